@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Alias index benchmark: compiled AliasIndex vs YAML merge + linear reverse scan.
+
+Writes a throwaway segment with N generated aliases (skill-hub shaped: keyword
+-> a few skill names) plus a small manual aliases.yaml, then times:
+  yaml_merge_ms  - AliasMerger.merge(), what every search parsed before
+  compile_ms     - first AliasMerger.index() (parse, merge, compile, write cache)
+  cached_ms      - later AliasMerger.index() calls (load aliases.index.json)
+  scan_expand_us - per-query expansion with the previous reverse-lookup scan
+  index_expand_us - per-query QueryExpander.expand on the compiled index
+
+Usage:
+    python scripts/bench_alias_index.py
+    python scripts/bench_alias_index.py --sizes 1000 10000 50000 --repeat 20
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.application.query_expander import QueryExpander
+from src.infrastructure.aliases_fs import AliasMerger
+
+QUERIES = 200
+
+
+def legacy_expand(aliases: dict[str, list[str]], query: str, tokens: list[str]) -> list:
+    """QueryExpander.expand before the index: reverse lookups scan every alias."""
+    terms = [(query, 1.0)]
+    added = {query}
+
+    def add(term: str) -> None:
+        if term not in added and len(added) - 1 < QueryExpander.MAX_EXTRA_TERMS:
+            terms.append((term, 0.7))
+            added.add(term)
+
+    for synonym in aliases.get(query, []):
+        add(synonym)
+    for key, synonyms in aliases.items():
+        if query in synonyms:
+            add(key)
+    for token in tokens:
+        if len(added) - 1 >= QueryExpander.MAX_EXTRA_TERMS:
+            break
+        for synonym in aliases.get(token, []):
+            add(synonym)
+        for key, synonyms in aliases.items():
+            if token in synonyms:
+                add(key)
+    return terms
+
+
+def _segment(workdir: Path, size: int, seed: int = 0) -> tuple[Path, list[list[str]]]:
+    rng = random.Random(seed)
+    skills = [f"skill-{i}" for i in range(max(50, size // 20))]
+    generated = {f"keyword{i}": rng.sample(skills, rng.randint(1, 5)) for i in range(size)}
+    manual = {"parser": ["tree_sitter", "ast_parser"], "db": ["sqlite"]}
+    segment = workdir / f"segment_{size}"
+    ctx = segment / "_ctx"
+    ctx.mkdir(parents=True)
+    for name, aliases in (("aliases.yaml", manual), ("aliases.generated.yaml", generated)):
+        (ctx / name).write_text(yaml.dump({"schema_version": 1, "aliases": aliases}))
+    vocabulary = list(generated) + skills + ["unrelated", "words"]
+    queries = [rng.sample(vocabulary, rng.randint(1, 3)) for _ in range(QUERIES)]
+    return segment, queries
+
+
+def _best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def bench(size: int, repeat: int, workdir: Path) -> dict[str, float | int | bool]:
+    segment, queries = _segment(workdir, size)
+    merger = AliasMerger(segment)
+
+    yaml_merge_ms = _best_ms(merger.merge, max(1, repeat // 5))
+    started = time.perf_counter()
+    index = merger.index()
+    compile_ms = (time.perf_counter() - started) * 1000
+    cached_ms = _best_ms(merger.index, repeat)
+
+    aliases = merger.merge()
+    expander = QueryExpander(index)
+    identical = all(
+        expander.expand(" ".join(q), q) == legacy_expand(aliases, " ".join(q), q) for q in queries
+    )
+    scan_ms = _best_ms(lambda: [legacy_expand(aliases, " ".join(q), q) for q in queries], 3)
+    index_ms = _best_ms(lambda: [expander.expand(" ".join(q), q) for q in queries], repeat)
+
+    return {
+        "aliases": len(aliases),
+        "identical": identical,
+        "yaml_merge_ms": round(yaml_merge_ms, 2),
+        "compile_ms": round(compile_ms, 2),
+        "cached_ms": round(cached_ms, 2),
+        "scan_expand_us": round(scan_ms * 1000 / QUERIES, 2),
+        "index_expand_us": round(index_ms * 1000 / QUERIES, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compiled alias index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (best kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_alias_index_") as tmp:
+        results = [bench(size, args.repeat, Path(tmp)) for size in args.sizes]
+
+    print(json.dumps(results, indent=2))
+    return 0 if all(row["identical"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
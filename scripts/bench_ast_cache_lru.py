@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+InMemoryLRUCache microbenchmark: get/set throughput at 1k/10k/100k entries.
+
+Compares the OrderedDict-based cache in src/domain/ast_cache.py with the
+previous list-based implementation (kept below as ListLRUCache), whose
+get() did ``list.remove`` on every hit and whose eviction did ``pop(0)``.
+
+Usage:
+    python scripts/bench_ast_cache_lru.py
+    python scripts/bench_ast_cache_lru.py --sizes 1000 10000 --ops 20000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Callable, Optional
+
+from src.domain.ast_cache import InMemoryLRUCache
+
+VALUE = {"symbols": [{"name": "f", "kind": "function", "line": 1}] * 4}
+
+
+class ListLRUCache:
+    """Previous InMemoryLRUCache: list-ordered LRU, sizes recomputed via json.dumps."""
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 100 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache: dict[str, Any] = {}
+        self._access_order: list[str] = []
+        self._current_bytes = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        if key not in self._cache:
+            return None
+        self._access_order.remove(key)
+        self._access_order.append(key)
+        return self._cache[key]
+
+    def set(self, key: str, value: Any) -> None:
+        value_bytes = len(json.dumps(value).encode())
+        while (
+            len(self._cache) >= self.max_entries
+            or self._current_bytes + value_bytes > self.max_bytes
+        ):
+            self._evict_oldest()
+        self._cache[key] = value
+        self._current_bytes += value_bytes
+        if key in self._access_order:
+            self._access_order.remove(key)
+        self._access_order.append(key)
+
+    def _evict_oldest(self) -> None:
+        if not self._access_order:
+            return
+        key = self._access_order.pop(0)
+        value = self._cache.pop(key, None)
+        if value is not None:
+            self._current_bytes -= len(json.dumps(value).encode())
+
+
+def _ops_per_second(fn: Callable[[str], Any], keys: list[str]) -> float:
+    started = time.perf_counter()
+    for key in keys:
+        fn(key)
+    elapsed = time.perf_counter() - started
+    return len(keys) / elapsed if elapsed > 0 else float("inf")
+
+
+def bench(factory: Callable[[int], Any], size: int, ops: int, seed: int = 0) -> dict[str, float]:
+    """Fill a cache of ``size`` entries, then time random hits and evicting sets."""
+    rng = random.Random(seed)
+    cache = factory(size)
+    for i in range(size):
+        cache.set(f"k{i}", VALUE)
+
+    hit_keys = [f"k{rng.randrange(size)}" for _ in range(ops)]
+    # New keys on a full cache: every set evicts the LRU entry
+    new_keys = [f"n{i}" for i in range(ops)]
+    return {
+        "get_ops_s": round(_ops_per_second(cache.get, hit_keys)),
+        "set_ops_s": round(_ops_per_second(lambda key: cache.set(key, VALUE), new_keys)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="InMemoryLRUCache microbenchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--ops", type=int, default=5_000, help="Timed operations per phase")
+    args = parser.parse_args()
+
+    implementations: dict[str, Callable[[int], Any]] = {
+        "ordered_dict": lambda size: InMemoryLRUCache(max_entries=size),
+        "list_legacy": lambda size: ListLRUCache(max_entries=size),
+    }
+    results = []
+    for size in args.sizes:
+        for name, factory in implementations.items():
+            results.append({"impl": name, "entries": size, **bench(factory, size, args.ops)})
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
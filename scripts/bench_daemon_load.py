@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Daemon load benchmark: request latency under N parallel clients.
+
+By default every client opens one connection per request, sends the payload
+line and waits for the reply. With --keep-alive each client reuses one
+DaemonConnection for all its (JSON) requests. Reports p50/p99/max latency and
+throughput.
+
+Usage:
+    python scripts/bench_daemon_load.py --socket <runtime>/daemon/socket
+    python scripts/bench_daemon_load.py --socket ... --clients 32 --requests 100 \\
+        --payload '{"method": "ctx.search", "params": {"segment": "/repo", "query": "x"}}'
+    python scripts/bench_daemon_load.py --socket ... --keep-alive \\
+        --payload '{"method": "textDocument/hover", "params": {...}}'
+"""
+
+import argparse
+import json
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.daemon.client import DaemonConnection
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def send_line(socket_path: Path, line: bytes, timeout: float) -> bytes:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(line)
+        chunks: list[bytes] = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+        return b"".join(chunks)
+    finally:
+        sock.close()
+
+
+def run_load(
+    socket_path: Path,
+    clients: int,
+    requests_per_client: int,
+    payload: bytes = b"PING\n",
+    timeout: float = 30.0,
+    keep_alive: bool = False,
+) -> dict[str, Any]:
+    """Drive ``clients`` parallel request loops and collect latencies (ms)."""
+
+    def client_loop() -> tuple[list[float], int]:
+        latencies: list[float] = []
+        errors = 0
+        connection = DaemonConnection(socket_path, timeout) if keep_alive else None
+        request = json.loads(payload) if keep_alive else None
+        for _ in range(requests_per_client):
+            started = time.perf_counter()
+            if connection is not None and request is not None:
+                ok = connection.request(request["method"], request.get("params", {})) is not None
+            else:
+                try:
+                    ok = bool(send_line(socket_path, payload, timeout))
+                except OSError:
+                    ok = False
+            if not ok:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+        if connection is not None:
+            connection.close()
+        return latencies, errors
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = list(pool.map(lambda _: client_loop(), range(clients)))
+    wall_s = time.perf_counter() - wall_started
+
+    latencies = [ms for client_latencies, _ in results for ms in client_latencies]
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in results),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies, default=0.0), 2),
+        "wall_s": round(wall_s, 3),
+        "rps": round(len(latencies) / wall_s, 1) if wall_s > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Trifecta daemon load benchmark")
+    parser.add_argument("--socket", type=Path, required=True, help="Daemon socket path")
+    parser.add_argument("--clients", type=int, default=16, help="Parallel clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--payload", default="PING", help="Request line (text or JSON)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout (s)")
+    parser.add_argument(
+        "--keep-alive", action="store_true", help="Reuse one connection per client (JSON only)"
+    )
+    args = parser.parse_args()
+
+    if not args.socket.exists():
+        print(f"Socket not found: {args.socket}", file=sys.stderr)
+        return 1
+
+    line = args.payload.rstrip("\n").encode() + b"\n"
+    report = run_load(
+        args.socket, args.clients, args.requests, line, args.timeout, args.keep_alive
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
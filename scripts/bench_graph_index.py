@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+GraphIndexer benchmark: serial vs process-pool indexing of a segment.
+
+Indexes ``src/**/*.py`` of the segment (default: this repository) once per
+``--jobs`` value into a throwaway graph DB, and checks that every run stores
+the same nodes and edges. Then times an incremental reindex of a copy of the
+segment after a one-line edit to a single file.
+
+Usage:
+    python scripts/bench_graph_index.py
+    python scripts/bench_graph_index.py --segment /path/to/repo --jobs 1 2 4 8 --repeat 3
+"""
+
+import argparse
+import json
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.application.graph_indexer import GraphIndexer
+from src.infrastructure.graph_store import GraphStore
+from src.infrastructure.source_walker import walk_sources
+
+
+def _graph_rows(db_path: Path) -> tuple[list[tuple], list[tuple]]:
+    with sqlite3.connect(db_path) as conn:
+        nodes = conn.execute("SELECT id, kind, line FROM nodes ORDER BY id").fetchall()
+        edges = conn.execute("SELECT id FROM edges ORDER BY id").fetchall()
+    return nodes, edges
+
+
+def bench(
+    segment: Path, jobs: int, repeat: int, workdir: Path
+) -> tuple[dict[str, float | int], tuple[list[tuple], list[tuple]]]:
+    """Best-of-``repeat`` wall time for one ``jobs`` value, plus the stored graph."""
+    timings: list[float] = []
+    db_path = workdir / f"graph_jobs{jobs}.db"
+    for _ in range(repeat):
+        store = GraphStore(db_path)
+        started = time.perf_counter()
+        summary = GraphIndexer(store=store).index_segment(segment, jobs=jobs, full=True)
+        timings.append(time.perf_counter() - started)
+    result = {
+        "jobs": jobs,
+        "best_s": round(min(timings), 3),
+        "nodes": summary.node_count,
+        "edges": summary.edge_count,
+    }
+    return result, _graph_rows(db_path)
+
+
+def bench_incremental(segment: Path, workdir: Path) -> dict[str, float | int]:
+    """Full index of a copy of ``segment``, then reindex after a one-line edit."""
+    copy = workdir / "segment"
+    shutil.copytree(segment / "src", copy / "src")
+    indexer = GraphIndexer(store=GraphStore(workdir / "graph_incremental.db"))
+
+    started = time.perf_counter()
+    indexer.index_segment(copy)
+    full_s = time.perf_counter() - started
+
+    edited = walk_sources(copy, ["src/**/*.py"])[0]
+    edited.write_text(edited.read_text() + "\n# edited\n")
+    started = time.perf_counter()
+    summary = indexer.index_segment(copy)
+    incremental_s = time.perf_counter() - started
+
+    return {
+        "full_s": round(full_s, 3),
+        "incremental_ms": round(incremental_s * 1000, 1),
+        "files_skipped": summary.files_skipped,
+        "files_reparsed": summary.files_reparsed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GraphIndexer serial vs parallel benchmark")
+    parser.add_argument("--segment", type=Path, default=Path(__file__).resolve().parent.parent)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per jobs value (best kept)")
+    args = parser.parse_args()
+
+    files = len(walk_sources(args.segment.resolve(), ["src/**/*.py"]))
+    with tempfile.TemporaryDirectory(prefix="bench_graph_") as tmp:
+        runs = [bench(args.segment, jobs, args.repeat, Path(tmp)) for jobs in args.jobs]
+        incremental = bench_incremental(args.segment.resolve(), Path(tmp))
+
+    results = [result for result, _ in runs]
+    identical = all(rows == runs[0][1] for _, rows in runs)
+    first_s = results[0]["best_s"]
+    for result in results:
+        result["speedup"] = round(first_s / result["best_s"], 2) if result["best_s"] else 0.0
+
+    report = {"files": files, "identical": identical, "runs": results, "incremental": incremental}
+    print(json.dumps(report, indent=2))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+GraphStore.search_nodes benchmark: trigram FTS5 index vs the previous LIKE scan.
+
+Fills a throwaway graph DB with N synthetic nodes (snake_case and camelCase
+symbols spread over many files) and times a few queries through
+GraphStore.search_nodes and through the previous query, which lowercased and
+LIKE-scanned every row of the segment.
+
+Usage:
+    python scripts/bench_graph_search.py
+    python scripts/bench_graph_search.py --sizes 10000 --repeat 50
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.domain.graph_models import GraphNode, make_node_id
+from src.infrastructure.graph_store import GraphStore
+
+SEGMENT_ID = "bench"
+WORDS = [
+    "cache", "index", "graph", "node", "edge", "search", "parse", "token", "chunk", "pack",
+    "store", "query", "render", "load", "save", "build", "merge", "score", "alias", "event",
+]
+QUERIES = ["search_chunk", "Graph", "render", "oken", "procss_batch"]
+
+
+def _nodes(count: int, seed: int = 0) -> list[GraphNode]:
+    rng = random.Random(seed)
+    nodes = []
+    for i in range(count):
+        a, b = rng.sample(WORDS, 2)
+        name = f"{a}_{b}_{i}" if i % 2 else f"{a}{b.capitalize()}{i}"
+        file_rel = f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}_{i // 50}.py"
+        nodes.append(
+            GraphNode(
+                id=make_node_id(SEGMENT_ID, file_rel, name),
+                segment_id=SEGMENT_ID,
+                file_rel=file_rel,
+                symbol_name=name,
+                qualified_name=name,
+                kind="function",
+                line=i % 500 + 1,
+            )
+        )
+    nodes.append(
+        GraphNode(
+            id=make_node_id(SEGMENT_ID, "src/batch.py", "process_batch"),
+            segment_id=SEGMENT_ID,
+            file_rel="src/batch.py",
+            symbol_name="process_batch",
+            qualified_name="process_batch",
+            kind="function",
+            line=1,
+        )
+    )
+    return nodes
+
+
+def legacy_search(db_path: Path, query: str, limit: int = 20) -> list[str]:
+    """The LIKE scan search_nodes ran before the trigram index."""
+    pattern = f"%{query.lower()}%"
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT symbol_name FROM nodes "
+            "WHERE segment_id = ? AND ("
+            "lower(symbol_name) LIKE ? OR lower(qualified_name) LIKE ? OR lower(file_rel) LIKE ?"
+            ") "
+            "ORDER BY CASE WHEN lower(symbol_name) = ? THEN 0 ELSE 1 END, file_rel, line "
+            "LIMIT ?",
+            (SEGMENT_ID, pattern, pattern, pattern, query.lower(), limit),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings) * 1000, 3)
+
+
+def bench(size: int, repeat: int, workdir: Path) -> list[dict[str, object]]:
+    db_path = workdir / f"graph_{size}.db"
+    store = GraphStore(db_path)
+    store.replace_segment(SEGMENT_ID, _nodes(size), [])
+
+    results = []
+    for query in QUERIES:
+        fts_hits = store.search_nodes(SEGMENT_ID, query)
+        results.append(
+            {
+                "nodes": size,
+                "query": query,
+                "fts_ms": _best_ms(lambda: store.search_nodes(SEGMENT_ID, query), repeat),
+                "like_ms": _best_ms(lambda: legacy_search(db_path, query), repeat),
+                "fts_top": fts_hits[0].symbol_name if fts_hits else None,
+                "like_hits": len(legacy_search(db_path, query)),
+            }
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GraphStore.search_nodes benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query (best kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_graph_search_") as tmp:
+        results = [row for size in args.sizes for row in bench(size, args.repeat, Path(tmp))]
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
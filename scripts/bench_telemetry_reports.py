@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Telemetry report benchmark: indexed TelemetryStore vs re-parsing events.jsonl.
+
+Writes a throwaway segment whose events.jsonl holds N events spread evenly
+over --history-days, then times, for a --days window:
+  legacy_ms - the previous approach: json-parse every line, then filter the
+              window with datetime.fromisoformat per event
+  first_ms  - first report through the store (ingests the whole log once)
+  stats_ms  - StatsUseCase over the window once the store is synced (best of --repeat)
+  zero_ms   - get_zero_hit_metrics over the window (daily counters + boundary day)
+
+Usage:
+    python scripts/bench_telemetry_reports.py
+    python scripts/bench_telemetry_reports.py --sizes 100000 --days 1 --repeat 10
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.application.use_cases import StatsUseCase
+from src.application.zero_hit_reports import get_zero_hit_metrics
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+def _write_events(events_path: Path, size: int, history_days: int) -> None:
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=history_days) / size
+    with open(events_path, "w") as f:
+        for i in range(size):
+            ts = now - step * (size - i)
+            row = {
+                "ts": ts.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "run_id": f"run_{i // 10}",
+                "cmd": "ctx.search" if i % 3 else "ctx.get",
+                "args": {"query": f"query {i % 50}"},
+                "result": {"hits": i % 4, "returned_ids": ["prime:a"]},
+                "timing_ms": 3,
+                "x": {"source": ("agent", "interactive", "fixture")[i % 3]},
+            }
+            f.write(json.dumps(row) + "\n")
+
+
+def legacy_window(events_path: Path, days: int) -> int:
+    """What stats/report/health did before the store: parse all, then filter."""
+    events = []
+    with open(events_path) as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    window = [e for e in events if datetime.fromisoformat(e["ts"]) >= cutoff]
+    return sum(1 for e in window if e["cmd"] == "ctx.search")
+
+
+def _best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings) * 1000, 2)
+
+
+def bench(size: int, days: int, history_days: int, repeat: int, workdir: Path) -> dict:
+    segment = workdir / f"segment_{size}"
+    telemetry_dir = segment / "_ctx" / "telemetry"
+    telemetry_dir.mkdir(parents=True)
+    events_path = telemetry_dir / "events.jsonl"
+    _write_events(events_path, size, history_days)
+    stats = StatsUseCase(FileSystemAdapter())
+
+    started = time.perf_counter()
+    searches = stats.execute(segment, window=days)["summary"]["total_searches"]
+    first_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "events": size,
+        "window_days": days,
+        "window_searches": searches,
+        "legacy_matches": legacy_window(events_path, days) == searches,
+        "legacy_ms": _best_ms(lambda: legacy_window(events_path, days), max(1, repeat // 5)),
+        "first_ms": round(first_ms, 2),
+        "stats_ms": _best_ms(lambda: stats.execute(segment, window=days), repeat),
+        "zero_ms": _best_ms(lambda: get_zero_hit_metrics(segment, days=days), repeat),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Telemetry report benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--days", type=int, default=7, help="Report window")
+    parser.add_argument("--history-days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per report (best kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_telemetry_reports_") as tmp:
+        results = [
+            bench(size, args.days, args.history_days, args.repeat, Path(tmp))
+            for size in args.sizes
+        ]
+
+    print(json.dumps(results, indent=2))
+    return 0 if all(row["legacy_matches"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Telemetry startup benchmark: Telemetry() construction time vs events.jsonl size.
+
+For each size, writes a throwaway segment whose events.jsonl holds that many
+schema-complete events, then times:
+  first_ms   - first construction (no watermark: one full normalization pass,
+               i.e. what every construction cost before the watermark)
+  steady_ms  - later constructions (best of --repeat), which only look at
+               lines appended since the previous check
+
+Usage:
+    python scripts/bench_telemetry_startup.py
+    python scripts/bench_telemetry_startup.py --sizes 1000 100000 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.infrastructure.telemetry import Telemetry
+
+ROW = {
+    "ts": "2026-01-01T00:00:00+0000",
+    "run_id": "run_bench",
+    "segment_id": "abcdef12",
+    "cmd": "ctx.search",
+    "args": {"query": "service layer", "limit": 5},
+    "result": {"hits": 3},
+    "timing_ms": 4,
+    "warnings": [],
+    "x": {"alias_expanded": True},
+}
+
+
+def _construct_ms(segment: Path) -> float:
+    started = time.perf_counter()
+    Telemetry(segment, level="lite")
+    return (time.perf_counter() - started) * 1000
+
+
+def bench(size: int, repeat: int, workdir: Path) -> dict[str, float | int]:
+    segment = workdir / f"segment_{size}"
+    telemetry_dir = segment / "_ctx" / "telemetry"
+    telemetry_dir.mkdir(parents=True)
+    (segment / "pyproject.toml").write_text("[project]\nname = 'bench'\n")
+    line = json.dumps(ROW) + "\n"
+    (telemetry_dir / "events.jsonl").write_text(line * size)
+
+    first_ms = _construct_ms(segment)
+    steady_ms = min(_construct_ms(segment) for _ in range(repeat))
+    return {
+        "events": size,
+        "file_mb": round((telemetry_dir / "events.jsonl").stat().st_size / 1e6, 2),
+        "first_ms": round(first_ms, 2),
+        "steady_ms": round(steady_ms, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Telemetry() startup benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 500_000])
+    parser.add_argument("--repeat", type=int, default=10, help="Steady-state constructions")
+    args = parser.parse_args()
+
+    os.environ.pop("TRIFECTA_NO_TELEMETRY", None)
+    os.environ.pop("TRIFECTA_TELEMETRY_DIR", None)
+    with tempfile.TemporaryDirectory(prefix="bench_telemetry_") as tmp:
+        results = [bench(size, args.repeat, Path(tmp)) for size in args.sizes]
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
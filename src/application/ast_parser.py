@@ -3,7 +3,7 @@ import hashlib
 import json
 import ast as ast_module
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
 from src.domain.ast_models import ChildSymbol, Range
 
 if TYPE_CHECKING:
@@ -20,6 +20,7 @@ class SymbolInfo:
     start_line: int
     end_line: int
     signature_stub: str
+    decorator_line: Optional[int] = None  # first decorator line; None if undecorated
 
     def to_dict(self) -> dict[str, object]:
         """Convert to dict for JSON serialization."""
@@ -30,6 +31,7 @@ class SymbolInfo:
             "start_line": self.start_line,
             "end_line": self.end_line,
             "signature_stub": self.signature_stub,
+            "decorator_line": self.decorator_line,
         }
 
 
@@ -42,10 +44,54 @@ class ParseResult:
     cache_key: str
 
 
+def _decorator_line(
+    node: ast_module.FunctionDef | ast_module.AsyncFunctionDef | ast_module.ClassDef,
+) -> Optional[int]:
+    # A decorator expression starts on its "@" line, even when it spans several
+    if not node.decorator_list:
+        return None
+    return min(decorator.lineno for decorator in node.decorator_list)
+
+
+def extract_top_level_symbols(tree: ast_module.Module) -> List[SymbolInfo]:
+    """Top-level functions and classes of a parsed module, sorted by line."""
+    symbols: List[SymbolInfo] = []
+
+    for node in tree.body:  # tree.body gives only top-level nodes
+        if isinstance(node, (ast_module.FunctionDef, ast_module.AsyncFunctionDef)):
+            symbols.append(
+                SymbolInfo(
+                    kind="function",
+                    name=node.name,
+                    qualified_name=node.name,  # top-level, so qualified == name
+                    start_line=node.lineno,
+                    end_line=node.end_lineno or node.lineno,
+                    signature_stub=f"def {node.name}(...)",
+                    decorator_line=_decorator_line(node),
+                )
+            )
+        elif isinstance(node, (ast_module.ClassDef)):
+            symbols.append(
+                SymbolInfo(
+                    kind="class",
+                    name=node.name,
+                    qualified_name=node.name,
+                    start_line=node.lineno,
+                    end_line=node.end_lineno or node.lineno,
+                    signature_stub=f"class {node.name}:",
+                    decorator_line=_decorator_line(node),
+                )
+            )
+
+    # Sort by line number
+    symbols.sort(key=lambda s: s.start_line)
+    return symbols
+
+
 class SkeletonMapBuilder:
     """Build skeleton maps from AST parsing."""
 
-    CACHE_VERSION = 1
+    CACHE_VERSION = 2  # 2: SymbolInfo.decorator_line
 
     def __init__(self, cache: Optional["AstCache"] = None, segment_id: str = "."):
         """
@@ -78,10 +124,7 @@ class SkeletonMapBuilder:
             ParseResult con símbolos, status de cache y clave de cache
         """
         if content is None:
-            try:
-                content = file_path.read_text(errors="replace")
-            except FileNotFoundError as e:
-                raise FileNotFoundError(f"File not found: {file_path}") from e
+            content = self._read_content(file_path)
 
         # Generar clave de cache
         file_rel = str(file_path)
@@ -90,77 +133,97 @@ class SkeletonMapBuilder:
         # Check cache
         cached_symbols = self.cache.get(cache_key)
         if cached_symbols is not None:
-            # Rehidrate: cache stores as list[dict], but we need list[SymbolInfo]
-            # This maintains the semantic contract for downstream consumers
-            if cached_symbols and isinstance(cached_symbols[0], dict):
-                cached_symbols = [
-                    SymbolInfo(
-                        kind=item["kind"],
-                        name=item["name"],
-                        qualified_name=item["qualified_name"],
-                        start_line=item["start_line"],
-                        end_line=item["end_line"],
-                        signature_stub=item["signature_stub"],
-                    )
-                    for item in cached_symbols
-                ]
-
             return ParseResult(
-                symbols=cached_symbols,
+                symbols=self._rehydrate(cached_symbols),
                 status="hit",
                 cache_key=cache_key,
             )
 
+        symbols, status = self._parse_symbols(file_path, content)
+
+        # Cache and return
+        self.cache.set(cache_key, symbols)
+        return ParseResult(symbols=symbols, status=status, cache_key=cache_key)
+
+    def build_many(
+        self, file_paths: List[Path], contents: Optional[Dict[Path, str]] = None
+    ) -> List[ParseResult]:
+        """
+        Build skeletons for many files with one cache lookup and one cache write.
+
+        Results keep the order of ``file_paths``. Only cache misses are parsed;
+        their symbols are written back with a single ``set_many``.
+        """
+        contents = contents or {}
+        keys: List[str] = []
+        file_contents: List[str] = []
+        for file_path in file_paths:
+            content = contents.get(file_path)
+            if content is None:
+                content = self._read_content(file_path)
+            file_contents.append(content)
+            keys.append(self._make_cache_key(str(file_path), content))
+
+        cached = self.cache.get_many(keys)
+
+        results: List[ParseResult] = []
+        writes: Dict[str, List[SymbolInfo]] = {}
+        for file_path, content, cache_key in zip(file_paths, file_contents, keys):
+            if cache_key in cached:
+                symbols = self._rehydrate(cached[cache_key])
+                results.append(ParseResult(symbols=symbols, status="hit", cache_key=cache_key))
+                continue
+            if cache_key in writes:
+                # Same file listed twice: parsed once already in this batch
+                results.append(
+                    ParseResult(symbols=writes[cache_key], status="hit", cache_key=cache_key)
+                )
+                continue
+            symbols, status = self._parse_symbols(file_path, content)
+            writes[cache_key] = symbols
+            results.append(ParseResult(symbols=symbols, status=status, cache_key=cache_key))
+
+        if writes:
+            self.cache.set_many(writes)
+        return results
+
+    @staticmethod
+    def _read_content(file_path: Path) -> str:
+        try:
+            return file_path.read_text(errors="replace")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+
+    @staticmethod
+    def _rehydrate(cached_symbols: List[Any]) -> List[SymbolInfo]:
+        # Rehidrate: cache stores as list[dict], but we need list[SymbolInfo]
+        # This maintains the semantic contract for downstream consumers
+        if cached_symbols and isinstance(cached_symbols[0], dict):
+            return [
+                SymbolInfo(
+                    kind=item["kind"],
+                    name=item["name"],
+                    qualified_name=item["qualified_name"],
+                    start_line=item["start_line"],
+                    end_line=item["end_line"],
+                    signature_stub=item["signature_stub"],
+                    decorator_line=item.get("decorator_line"),
+                )
+                for item in cached_symbols
+            ]
+        return cached_symbols
+
+    @staticmethod
+    def _parse_symbols(file_path: Path, content: str) -> Tuple[List[SymbolInfo], str]:
+        """Parse top-level symbols; returns (symbols, "miss" | "error")."""
         # Parse with stdlib ast
         try:
             tree = ast_module.parse(content, filename=str(file_path))
         except SyntaxError:
             # Fail-closed: syntax errors return empty (could be logged)
-            symbols: List[SymbolInfo] = []
-            self.cache.set(cache_key, symbols)
-            return ParseResult(
-                symbols=symbols,
-                status="error",
-                cache_key=cache_key,
-            )
+            return [], "error"
 
-        # Extract top-level symbols (only top-level, not nested)
-        symbols = []
-
-        for node in tree.body:  # tree.body gives only top-level nodes
-            if isinstance(node, (ast_module.FunctionDef, ast_module.AsyncFunctionDef)):
-                symbols.append(
-                    SymbolInfo(
-                        kind="function",
-                        name=node.name,
-                        qualified_name=node.name,  # top-level, so qualified == name
-                        start_line=node.lineno,
-                        end_line=node.end_lineno or node.lineno,
-                        signature_stub=f"def {node.name}(...)",
-                    )
-                )
-            elif isinstance(node, (ast_module.ClassDef)):
-                symbols.append(
-                    SymbolInfo(
-                        kind="class",
-                        name=node.name,
-                        qualified_name=node.name,
-                        start_line=node.lineno,
-                        end_line=node.end_lineno or node.lineno,
-                        signature_stub=f"class {node.name}:",
-                    )
-                )
-
-        # Sort by line number
-        symbols.sort(key=lambda s: s.start_line)
-
-        # Cache and return
-        self.cache.set(cache_key, symbols)
-        return ParseResult(
-            symbols=symbols,
-            status="miss",
-            cache_key=cache_key,
-        )
+        return extract_top_level_symbols(tree), "miss"
 
     def get_skeleton_bytes(self, symbols: List[SymbolInfo]) -> int:
         """Get estimated byte size of skeleton."""
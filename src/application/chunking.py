@@ -4,11 +4,32 @@ Whole-file chunking strategy:
 - Treats each doc as a single chunk
 - Stable IDs via SHA256 content hashing
 - Token estimation: len(text) // 4
+
+Section chunking strategy (``ctx build --chunking sections``):
+- Markdown split at headings, never inside fenced code blocks
+- Python split at top-level functions/classes (SkeletonMapBuilder symbols)
+- Sections are contiguous line ranges that together cover the whole file
 """
 
 import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Optional
+
+from src.application.ast_parser import SkeletonMapBuilder, SymbolInfo
 from src.domain.models import Chunk
 
+ChunkingMode = Literal["whole_file", "sections"]
+
+# ContextChunk.chunking_method values
+WHOLE_FILE_METHOD = "whole_file"
+HEADING_METHOD = "heading"
+SYMBOL_METHOD = "symbol"
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)\s*$")
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
 
 def chunk_whole_file(doc_name: str, content: str) -> Chunk:
     """Create a single chunk from entire file content.
@@ -40,3 +61,144 @@ def chunk_whole_file(doc_name: str, content: str) -> Chunk:
         text=content,
         token_est=token_est,
     )
+
+
+@dataclass(frozen=True)
+class Section:
+    """A contiguous line range of a source file.
+
+    ``title_path`` holds the headings (or the symbol name) below the file
+    name; it is empty for the text before the first heading/symbol.
+    ``parent`` is the position of the enclosing section in the same list.
+    """
+
+    title_path: tuple[str, ...]
+    text: str
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    parent: Optional[int] = None
+
+
+def chunking_method_for(path: Path, mode: ChunkingMode) -> str:
+    """chunking_method a build in ``mode`` uses for ``path``."""
+    if mode == "sections":
+        if path.suffix == ".md":
+            return HEADING_METHOD
+        if path.suffix == ".py":
+            return SYMBOL_METHOD
+    return WHOLE_FILE_METHOD
+
+
+def split_sections(
+    path: Path, content: str, method: str, symbols: Optional[list[SymbolInfo]] = None
+) -> list[Section]:
+    """Sections of ``content`` for ``method``; one section for whole_file.
+
+    ``symbols`` are the file's already built top-level symbols, if any.
+    """
+    if method == HEADING_METHOD:
+        sections = split_markdown_sections(content)
+    elif method == SYMBOL_METHOD:
+        sections = split_python_sections(path, content, symbols)
+    else:
+        sections = []
+    return sections or [Section((), content, 1, max(content.count("\n"), 1))]
+
+
+# (0-based first line, title_path, parent boundary) where a section begins
+_Boundary = tuple[int, tuple[str, ...], Optional[int]]
+
+
+def _make_sections(lines: list[str], starts: list[_Boundary]) -> list[Section]:
+    """Cut ``lines`` at each (0-based start, title_path, parent) boundary.
+
+    Whitespace-only ranges are dropped and parents re-pointed past them.
+    """
+    sections: list[Section] = []
+    kept: dict[int, int] = {}
+    for i, (start, title_path, parent) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(lines)
+        text = "".join(lines[start:end])
+        if not text.strip():
+            continue
+        kept[i] = len(sections)
+        sections.append(
+            Section(
+                title_path=title_path,
+                text=text,
+                start_line=start + 1,
+                end_line=end,
+                parent=kept.get(parent) if parent is not None else None,
+            )
+        )
+    return sections
+
+
+def split_markdown_sections(content: str) -> list[Section]:
+    """Split markdown at ATX headings outside code fences.
+
+    Each heading starts a section running to the next heading; its parent is
+    the nearest preceding heading of a lower level.
+    """
+    lines = content.splitlines(keepends=True)
+    starts: list[_Boundary] = [(0, (), None)]
+    # (level, title, boundary position) of the enclosing headings
+    stack: list[tuple[int, str, int]] = []
+    fence: Optional[str] = None
+
+    for i, line in enumerate(lines):
+        fence_match = _FENCE_RE.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+            continue
+        if fence is not None:
+            continue
+
+        heading_match = _HEADING_RE.match(line)
+        title = heading_match.group(2).strip() if heading_match else ""
+        if not heading_match or not title:
+            continue
+        level = len(heading_match.group(1))
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        parent = stack[-1][2] if stack else None
+        title_path = tuple(heading for _, heading, _ in stack) + (title,)
+        if i == 0:
+            starts.pop()  # No text before the first heading
+        stack.append((level, title, len(starts)))
+        starts.append((i, title_path, parent))
+
+    return _make_sections(lines, starts)
+
+
+def split_python_sections(
+    path: Path, content: str, symbols: Optional[list[SymbolInfo]] = None
+) -> list[Section]:
+    """Split Python source at top-level functions and classes.
+
+    Decorators and comments directly above a symbol belong to it; module code
+    between two symbols stays with the preceding one. A module that does not
+    parse, or has no top-level symbols, yields no sections. ``symbols`` skips
+    the parse when the caller already has them (SkeletonMapBuilder.build_many).
+    """
+    if symbols is None:
+        symbols = SkeletonMapBuilder().build(path, content).symbols
+    if not symbols:
+        return []
+
+    lines = content.splitlines(keepends=True)
+    starts: list[_Boundary] = [(0, (), None)]
+    previous_end = 0
+    for symbol in symbols:
+        start = (symbol.decorator_line or symbol.start_line) - 1
+        while start > previous_end and lines[start - 1].lstrip().startswith("#"):
+            start -= 1
+        if start == 0:
+            starts.pop()  # No module header
+        starts.append((start, (symbol.name,), None))
+        previous_end = symbol.end_line
+    return _make_sections(lines, starts)
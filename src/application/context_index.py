@@ -0,0 +1,194 @@
+"""Inverted index sidecar for ContextService.search (context_index.json).
+
+The index is built from the same ContextPack that is written to
+``_ctx/context_pack.json`` and is keyed to the sha256 of the persisted pack
+payload. A stale or missing index is never an error: search falls back to
+the linear scan.
+
+Matching semantics are identical to the scan (``word in text.lower()``):
+text is lowercased and split into maximal ``\\w`` runs. A query word made
+only of word characters can only occur inside one token, so its candidate
+set is the union of the postings of every vocabulary token containing it.
+Words with punctuation are narrowed through their word-character pieces and
+verified against the chunk body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.domain.context_models import ContextIndexEntry, ContextPack
+from src.infrastructure.file_system_utils import AtomicWriter
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_INDEX_FILENAME = "context_index.json"
+CONTEXT_INDEX_SCHEMA_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def pack_digest(payload: str) -> str:
+    """Digest of a persisted pack payload (as normalized by AtomicWriter)."""
+    if not payload.endswith("\n"):
+        payload += "\n"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def tokenize(text: str) -> set[str]:
+    """Distinct lowercase word tokens of a text."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+class _Vocabulary:
+    """Sorted tokens with encoded postings and C-speed substring lookup.
+
+    Postings are stored as space-separated positions and decoded only for
+    tokens that match a query fragment, which keeps loading the sidecar cheap.
+    Tokens are joined into one newline-separated blob so that finding every
+    token containing a fragment is a ``str.find`` loop instead of a Python
+    loop over the vocabulary.
+    """
+
+    def __init__(self, tokens: list[str], postings: list[str]):
+        if len(tokens) != len(postings):
+            raise ValueError("tokens and postings must have the same length")
+        self.tokens = tokens
+        self.postings = postings
+        self.offsets: list[int] = []
+        pos = 0
+        for token in tokens:
+            self.offsets.append(pos)
+            pos += len(token) + 1
+        self.blob = "\n".join(tokens)
+
+    @classmethod
+    def from_positions(cls, positions: dict[str, list[int]]) -> "_Vocabulary":
+        tokens = sorted(positions)
+        return cls(tokens, [" ".join(map(str, positions[token])) for token in tokens])
+
+    def positions_containing(self, fragment: str) -> set[int]:
+        positions: set[int] = set()
+        start = self.blob.find(fragment)
+        while start != -1:
+            token_idx = bisect_right(self.offsets, start) - 1
+            positions.update(map(int, self.postings[token_idx].split()))
+            next_token = token_idx + 1
+            if next_token >= len(self.offsets):
+                break
+            start = self.blob.find(fragment, self.offsets[next_token])
+        return positions
+
+
+@dataclass
+class ContextSearchIndex:
+    """Title and body postings per token, addressed by pack.index position."""
+
+    pack_digest: str
+    entry_ids: list[str]
+    title_vocab: _Vocabulary
+    body_vocab: _Vocabulary
+
+    @classmethod
+    def build(cls, pack: ContextPack, digest: str) -> "ContextSearchIndex":
+        """Tokenize every indexed chunk of the pack."""
+        chunk_map = {chunk.id: chunk for chunk in pack.chunks}
+        title_positions: dict[str, list[int]] = {}
+        body_positions: dict[str, list[int]] = {}
+
+        for pos, entry in enumerate(pack.index):
+            for token in tokenize(entry.title_path_norm):
+                title_positions.setdefault(token, []).append(pos)
+            chunk = chunk_map.get(entry.id)
+            if chunk is None:
+                continue
+            for token in tokenize(chunk.text):
+                body_positions.setdefault(token, []).append(pos)
+
+        return cls(
+            pack_digest=digest,
+            entry_ids=[entry.id for entry in pack.index],
+            title_vocab=_Vocabulary.from_positions(title_positions),
+            body_vocab=_Vocabulary.from_positions(body_positions),
+        )
+
+    def to_json(self) -> str:
+        payload = {
+            "schema_version": CONTEXT_INDEX_SCHEMA_VERSION,
+            "pack_digest": self.pack_digest,
+            "entry_ids": self.entry_ids,
+            "title_tokens": self.title_vocab.tokens,
+            "title_postings": self.title_vocab.postings,
+            "body_tokens": self.body_vocab.tokens,
+            "body_postings": self.body_vocab.postings,
+        }
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ContextSearchIndex | None":
+        """Load a sidecar from disk. Returns None if missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug(f"Ignoring unreadable context index {path}: {exc}")
+            return None
+        if not isinstance(data, dict) or data.get("schema_version") != CONTEXT_INDEX_SCHEMA_VERSION:
+            return None
+        try:
+            return cls(
+                pack_digest=str(data["pack_digest"]),
+                entry_ids=list(data["entry_ids"]),
+                title_vocab=_Vocabulary(list(data["title_tokens"]), list(data["title_postings"])),
+                body_vocab=_Vocabulary(list(data["body_tokens"]), list(data["body_postings"])),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def matches(self, entries: list[ContextIndexEntry], digest: str | None) -> bool:
+        """True if this index was built for exactly this pack index."""
+        if digest is None or digest != self.pack_digest:
+            return False
+        return len(self.entry_ids) == len(entries) and all(
+            entry.id == entry_id for entry, entry_id in zip(entries, self.entry_ids)
+        )
+
+    def title_candidates(self, word: str) -> set[int] | None:
+        """Positions whose title may contain ``word``; None means unknown (scan)."""
+        return self._candidates(word, self.title_vocab)
+
+    def body_candidates(self, word: str) -> set[int] | None:
+        """Positions whose body may contain ``word``; None means unknown (scan)."""
+        return self._candidates(word, self.body_vocab)
+
+    @staticmethod
+    def is_exact(word: str) -> bool:
+        """True if candidates for ``word`` need no verification against the text."""
+        return _TOKEN_RE.fullmatch(word) is not None
+
+    @staticmethod
+    def _candidates(word: str, vocab: _Vocabulary) -> set[int] | None:
+        pieces = _TOKEN_RE.findall(word)
+        if not pieces:
+            return None
+
+        result: set[int] | None = None
+        for piece in pieces:
+            positions = vocab.positions_containing(piece)
+            result = positions if result is None else result & positions
+            if not result:
+                break
+        return result or set()
+
+
+def write_context_index(ctx_dir: Path, pack: ContextPack, pack_payload: str) -> None:
+    """Build and persist the sidecar for a pack that was written as ``pack_payload``."""
+    index = ContextSearchIndex.build(pack, pack_digest(pack_payload))
+    AtomicWriter.write(ctx_dir / CONTEXT_INDEX_FILENAME, index.to_json())
@@ -0,0 +1,326 @@
+"""Precomputed ctx.get renditions sidecar (context_renditions.bin).
+
+``ctx get`` serves a chunk as raw text, as an excerpt (first non-empty
+lines) or as a skeleton (headings and code signatures), and falls back to a
+shorter excerpt when raw text would exceed the token budget. ``ctx build``
+renders all of these once per chunk, with their token estimates, keyed to
+the sha256 of the persisted pack payload like context_index.json. get then
+only picks a rendition, and decides on the budget before reading any raw
+chunk body. A stale or missing sidecar is never an error: get renders from
+the chunk text as before.
+
+Layout (same framing as context_pack.bin):
+    MAGIC (8 bytes) | header length (uint64 LE) | JSON header | records | text blob
+
+The header holds the pack digest and the chunk ids; record ``i`` is a
+fixed-width struct for ``ids[i]`` (sizes, token estimates and blob offsets).
+Readers mmap the file, so opening it costs one small JSON parse and a
+lookup decodes only the renditions of the requested chunk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.application.context_index import pack_digest
+from src.domain.context_models import ContextPack
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_RENDITIONS_FILENAME = "context_renditions.bin"
+CONTEXT_RENDITIONS_MAGIC = b"TRFREND\x01"
+CONTEXT_RENDITIONS_SCHEMA_VERSION = 1
+
+_HEADER_LEN = struct.Struct("<Q")
+_PREAMBLE_SIZE = len(CONTEXT_RENDITIONS_MAGIC) + _HEADER_LEN.size
+# text_sha, raw_chars, raw_tokens, excerpt (offset, length, tokens), fallback_chars,
+# skeleton (offset, length, tokens)
+_RECORD = struct.Struct("<8s9Q")
+
+EXCERPT_LINES = 25
+BUDGET_FALLBACK_LINES = 20
+EXCERPT_TRUNCATED_NOTE = "\n\n... [Contenido truncado, usa mode='raw' para ver todo]"
+BUDGET_FALLBACK_NOTE = (
+    "\n\n> [!NOTE]\n> Chunk truncado por presupuesto de tokens. "
+    "Usa mode='raw' con mayor budget si es crítico."
+)
+
+_SIGNATURE_KEYWORDS = ("def ", "class ", "interface ", "function ", "const ", "var ")
+
+
+def estimate_tokens(text: str) -> int:
+    """Simple token estimation: 4 chars per token."""
+    return len(text) // 4
+
+
+def _lead_lines(text: str, limit: int) -> tuple[list[str], bool]:
+    """First ``limit`` non-empty stripped lines, and whether more follow."""
+    lines: list[str] = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped:
+            if len(lines) == limit:
+                return lines, True
+            lines.append(stripped)
+    return lines, False
+
+
+def excerpt(text: str) -> str:
+    """T4: headings + trimming + first 25 lines."""
+    lines, truncated = _lead_lines(text, EXCERPT_LINES)
+    rendered = "\n".join(lines)
+    return rendered + EXCERPT_TRUNCATED_NOTE if truncated else rendered
+
+
+def budget_fallback(text: str) -> str:
+    """First 20 lines with a note, served when raw text exceeds the budget."""
+    lines, _ = _lead_lines(text, BUDGET_FALLBACK_LINES)
+    return "\n".join(lines) + BUDGET_FALLBACK_NOTE
+
+
+def skeletonize(text: str) -> str:
+    """
+    Extract headings and code block markers to create a structure view.
+    """
+    skeleton_lines = []
+    in_code_block = False
+
+    for line in text.splitlines():
+        line_strip = line.strip()
+
+        # Keep headings
+        if line_strip.startswith("#"):
+            skeleton_lines.append(line)
+            continue
+
+        # Keep code block markers
+        if line_strip.startswith("```"):
+            skeleton_lines.append(line)
+            in_code_block = not in_code_block
+            continue
+
+        # If inside code block, keep first line (signature)
+        if (
+            in_code_block
+            and len(skeleton_lines) > 0
+            and skeleton_lines[-1].strip().startswith("```")
+        ):
+            if any(kw in line for kw in _SIGNATURE_KEYWORDS):
+                skeleton_lines.append(f"  {line_strip}")
+
+    if not skeleton_lines:
+        return text[:200] + "..."  # Fallback
+
+    return "\n".join(skeleton_lines)
+
+
+def text_digest(text: str) -> bytes:
+    """Short digest of a chunk body, to detect reusable renditions."""
+    return hashlib.sha256(text.encode("utf-8")).digest()[:8]
+
+
+@dataclass(frozen=True)
+class ChunkRenditions:
+    """Every get rendition of one chunk body, with token estimates.
+
+    The budget fallback is a prefix of the excerpt (its first 20 of 25
+    lines) plus a note, so only its length is stored.
+    """
+
+    text_sha: bytes
+    raw_chars: int
+    raw_tokens: int
+    excerpt: str
+    excerpt_tokens: int
+    fallback_chars: int
+    skeleton: str
+    skeleton_tokens: int
+
+    @classmethod
+    def render(cls, text: str) -> "ChunkRenditions":
+        lines, truncated = _lead_lines(text, EXCERPT_LINES)
+        excerpt_text = "\n".join(lines) + (EXCERPT_TRUNCATED_NOTE if truncated else "")
+        skeleton_text = skeletonize(text)
+        return cls(
+            text_sha=text_digest(text),
+            raw_chars=len(text),
+            raw_tokens=estimate_tokens(text),
+            excerpt=excerpt_text,
+            excerpt_tokens=estimate_tokens(excerpt_text),
+            fallback_chars=len("\n".join(lines[:BUDGET_FALLBACK_LINES])),
+            skeleton=skeleton_text,
+            skeleton_tokens=estimate_tokens(skeleton_text),
+        )
+
+    @property
+    def budget_fallback(self) -> str:
+        return self.excerpt[: self.fallback_chars] + BUDGET_FALLBACK_NOTE
+
+    @property
+    def budget_fallback_tokens(self) -> int:
+        return (self.fallback_chars + len(BUDGET_FALLBACK_NOTE)) // 4
+
+
+class ContextRenditions:
+    """Read-only view over context_renditions.bin backed by mmap."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._mmap: mmap.mmap | None = None
+        self._file = open(path, "rb")
+        try:
+            preamble = self._file.read(_PREAMBLE_SIZE)
+            if len(preamble) != _PREAMBLE_SIZE or not preamble.startswith(
+                CONTEXT_RENDITIONS_MAGIC
+            ):
+                raise ValueError(f"Not a renditions sidecar: {path}")
+            (header_len,) = _HEADER_LEN.unpack(preamble[len(CONTEXT_RENDITIONS_MAGIC) :])
+            header: dict[str, Any] = json.loads(self._file.read(header_len))
+            if header.get("schema_version") != CONTEXT_RENDITIONS_SCHEMA_VERSION:
+                raise ValueError(f"Unsupported renditions schema: {header.get('schema_version')}")
+            self.pack_digest = str(header["pack_digest"])
+            ids = list(header["ids"])
+
+            self._records_start = _PREAMBLE_SIZE + header_len
+            self._blob_start = self._records_start + len(ids) * _RECORD.size
+            if path.stat().st_size < self._blob_start:
+                raise ValueError(f"Truncated renditions sidecar: {path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._positions = {chunk_id: pos for pos, chunk_id in enumerate(ids)}
+            self._decoded: dict[str, ChunkRenditions] = {}
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> "ContextRenditions | None":
+        """Open a sidecar from disk. Returns None if missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug(f"Ignoring unreadable context renditions {path}: {exc}")
+            return None
+
+    def matches(self, digest: str | None) -> bool:
+        """True if these renditions were built for exactly this pack payload."""
+        return digest is not None and digest == self.pack_digest
+
+    def get(self, chunk_id: str) -> ChunkRenditions | None:
+        """Renditions of one chunk, decoding only its slices of the blob (once)."""
+        rendered = self._decoded.get(chunk_id)
+        if rendered is not None:
+            return rendered
+        pos = self._positions.get(chunk_id)
+        if pos is None or self._mmap is None:
+            return None
+        (
+            text_sha,
+            raw_chars,
+            raw_tokens,
+            excerpt_offset,
+            excerpt_length,
+            excerpt_tokens,
+            fallback_chars,
+            skeleton_offset,
+            skeleton_length,
+            skeleton_tokens,
+        ) = _RECORD.unpack_from(self._mmap, self._records_start + pos * _RECORD.size)
+        rendered = ChunkRenditions(
+            text_sha=text_sha,
+            raw_chars=raw_chars,
+            raw_tokens=raw_tokens,
+            excerpt=self._text(excerpt_offset, excerpt_length),
+            excerpt_tokens=excerpt_tokens,
+            fallback_chars=fallback_chars,
+            skeleton=self._text(skeleton_offset, skeleton_length),
+            skeleton_tokens=skeleton_tokens,
+        )
+        self._decoded[chunk_id] = rendered
+        return rendered
+
+    def _text(self, offset: int, length: int) -> str:
+        assert self._mmap is not None
+        start = self._blob_start + offset
+        return self._mmap[start : start + length].decode("utf-8")
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def write_context_renditions(ctx_dir: Path, pack: ContextPack, pack_payload: str) -> Path:
+    """Render and persist the sidecar for a pack that was written as ``pack_payload``.
+
+    Renditions of chunks whose body is unchanged since the previous sidecar
+    are copied instead of re-rendered.
+    """
+    path = ctx_dir / CONTEXT_RENDITIONS_FILENAME
+    previous = ContextRenditions.load(path)
+
+    ids: dict[str, None] = {}
+    records = bytearray()
+    blob = bytearray()
+    for chunk in pack.chunks:
+        if chunk.id in ids:
+            continue
+        rendered = previous.get(chunk.id) if previous is not None else None
+        if rendered is None or rendered.text_sha != text_digest(chunk.text):
+            rendered = ChunkRenditions.render(chunk.text)
+        excerpt_bytes = rendered.excerpt.encode("utf-8")
+        skeleton_bytes = rendered.skeleton.encode("utf-8")
+        records += _RECORD.pack(
+            rendered.text_sha,
+            rendered.raw_chars,
+            rendered.raw_tokens,
+            len(blob),
+            len(excerpt_bytes),
+            rendered.excerpt_tokens,
+            rendered.fallback_chars,
+            len(blob) + len(excerpt_bytes),
+            len(skeleton_bytes),
+            rendered.skeleton_tokens,
+        )
+        blob += excerpt_bytes
+        blob += skeleton_bytes
+        ids[chunk.id] = None
+    if previous is not None:
+        previous.close()
+
+    header = {
+        "schema_version": CONTEXT_RENDITIONS_SCHEMA_VERSION,
+        "pack_digest": pack_digest(pack_payload),
+        "ids": list(ids),
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(CONTEXT_RENDITIONS_MAGIC)
+            f.write(_HEADER_LEN.pack(len(header_bytes)))
+            f.write(header_bytes)
+            f.write(records)
+            f.write(blob)
+        temp_path.replace(path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    return path
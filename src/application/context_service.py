@@ -1,11 +1,29 @@
 """Service for Programmatic Context Calling logic (ContextService)."""
 
 import hashlib
+import heapq
 import json
 from pathlib import Path
-from typing import Any, Literal, Optional
-
-from src.domain.context_models import ContextChunk, ContextPack, GetResult, SearchHit, SearchResult
+from typing import Any, Callable, Iterable, Literal, Optional, TypeVar
+
+from src.application.context_index import CONTEXT_INDEX_FILENAME, ContextSearchIndex
+from src.application.context_renditions import (
+    CONTEXT_RENDITIONS_FILENAME,
+    ContextRenditions,
+    budget_fallback,
+    estimate_tokens,
+    excerpt,
+    skeletonize,
+)
+from src.infrastructure.binary_pack import BinaryPackReader
+from src.domain.context_models import (
+    ContextChunk,
+    ContextIndexEntry,
+    ContextPack,
+    GetResult,
+    SearchHit,
+    SearchResult,
+)
 from src.domain.result import Err
 from src.domain.segment_indexing_policy import SegmentIndexingPolicy
 from src.domain.skill_manifest import SkillManifest
@@ -13,6 +31,21 @@ from src.domain.skill_manifest import SkillManifest
 SKILL_HUB_PROMOTION_RECEIPT = "skill_hub_promotion_receipt.json"
 SKILL_HUB_LAST_VALID_DIR = ".skill_hub_last_valid"
 
+T = TypeVar("T")
+
+
+def top_k(items: Iterable[T], k: int, score: Callable[[T], float]) -> list[T]:
+    """
+    Highest-scoring ``k`` items, ties kept in input order.
+
+    Same result as ``sorted(items, key=score, reverse=True)[:k]`` (a stable
+    sort), but selects with a bounded heap instead of sorting every item.
+    """
+    ranked = heapq.nsmallest(
+        k, enumerate(items), key=lambda pair: (-score(pair[1]), pair[0])
+    )
+    return [item for _, item in ranked]
+
 
 def parse_chunk_id(chunk_id: str) -> tuple[str, str]:
     """
@@ -39,6 +72,146 @@ def parse_chunk_id(chunk_id: str) -> tuple[str, str]:
     return ("unknown", chunk_id)
 
 
+class PackSession:
+    """A context pack loaded once and shared by every search/get against it.
+
+    Holds the parsed pack plus derived lookups (chunk map, lowercased text) so
+    that multi-term searches pay the JSON/pydantic cost a single time.
+    """
+
+    def __init__(
+        self,
+        pack: ContextPack,
+        pack_digest: str | None = None,
+        index_path: Path | None = None,
+    ):
+        self._pack = pack
+        self.chunk_map: dict[str, ContextChunk] = {chunk.id: chunk for chunk in pack.chunks}
+        self._init_lookups(pack.index, pack_digest, index_path)
+
+    def _init_lookups(
+        self,
+        index: list[ContextIndexEntry],
+        pack_digest: str | None,
+        index_path: Path | None,
+    ) -> None:
+        self.index = index
+        self.pack_digest = pack_digest
+        self.index_path = index_path
+        self._lower_bodies: dict[str, str] = {}
+        self._search_index: ContextSearchIndex | None = None
+        self._search_index_loaded = False
+        self._renditions: ContextRenditions | None = None
+        self._renditions_loaded = False
+
+    @property
+    def pack(self) -> ContextPack:
+        return self._pack
+
+    @property
+    def search_index(self) -> ContextSearchIndex | None:
+        """Inverted index sidecar for this pack, or None if missing/stale."""
+        if not self._search_index_loaded:
+            self._search_index_loaded = True
+            if self.index_path is not None:
+                index = ContextSearchIndex.load(self.index_path)
+                if index is not None and index.matches(self.index, self.pack_digest):
+                    self._search_index = index
+        return self._search_index
+
+    @property
+    def renditions(self) -> ContextRenditions | None:
+        """Precomputed get renditions for this pack, or None if missing/stale."""
+        if not self._renditions_loaded:
+            self._renditions_loaded = True
+            if self.index_path is not None:
+                renditions = ContextRenditions.load(
+                    self.index_path.with_name(CONTEXT_RENDITIONS_FILENAME)
+                )
+                if renditions is not None and renditions.matches(self.pack_digest):
+                    self._renditions = renditions
+        return self._renditions
+
+    def chunk_ids(self) -> list[str]:
+        """Chunk IDs in pack order."""
+        return list(self.chunk_map)
+
+    def chunk(self, chunk_id: str) -> ContextChunk | None:
+        return self.chunk_map.get(chunk_id)
+
+    def rendered_chunk(
+        self, chunk_id: str, text: str | None, token_est: int
+    ) -> ContextChunk | None:
+        """Copy of a chunk carrying a rendition (None = its own body) and its token estimate."""
+        chunk = self.chunk(chunk_id)
+        if chunk is None:
+            return None
+        update = {"text": chunk.text if text is None else text, "token_est": token_est}
+        return chunk.model_copy(update=update)
+
+    def chunk_doc(self, chunk_id: str) -> str | None:
+        """Doc of a chunk without touching its body; None if the chunk is missing."""
+        chunk = self.chunk_map.get(chunk_id)
+        return chunk.doc if chunk is not None else None
+
+    def _body(self, chunk_id: str) -> str:
+        return self.chunk_map[chunk_id].text
+
+    def lower_body(self, chunk_id: str) -> str:
+        """Return the lowercased chunk body, computed once per session."""
+        body = self._lower_bodies.get(chunk_id)
+        if body is None:
+            body = self._body(chunk_id).lower()
+            self._lower_bodies[chunk_id] = body
+        return body
+
+
+class BinaryPackSession(PackSession):
+    """PackSession over context_pack.bin: chunk bodies are read from mmap on demand."""
+
+    def __init__(self, reader: BinaryPackReader, index_path: Path | None = None):
+        self._reader = reader
+        self._full_pack: ContextPack | None = None
+        self.chunk_map = {}  # Materialized chunks only
+        self._init_lookups(reader.index, reader.pack_digest, index_path)
+
+    @property
+    def pack(self) -> ContextPack:
+        """Materialize the full pack (all bodies). Avoid on hot paths."""
+        if self._full_pack is None:
+            self._full_pack = self._reader.to_pack()
+        return self._full_pack
+
+    def chunk_ids(self) -> list[str]:
+        return self._reader.chunk_ids
+
+    def chunk(self, chunk_id: str) -> ContextChunk | None:
+        chunk = self.chunk_map.get(chunk_id)
+        if chunk is None:
+            chunk = self._reader.chunk(chunk_id)
+            if chunk is not None:
+                self.chunk_map[chunk_id] = chunk
+        return chunk
+
+    def rendered_chunk(
+        self, chunk_id: str, text: str | None, token_est: int
+    ) -> ContextChunk | None:
+        """As PackSession.rendered_chunk; a rendition never reads the body from the blob."""
+        if text is None:
+            return super().rendered_chunk(chunk_id, text, token_est)
+        chunk = self._reader.chunk(chunk_id, text=text)
+        if chunk is None:
+            return None
+        return chunk.model_copy(update={"token_est": token_est})
+
+    def chunk_doc(self, chunk_id: str) -> str | None:
+        slot = self._reader.slots.get(chunk_id)
+        return slot.doc if slot is not None else None
+
+    def _body(self, chunk_id: str) -> str:
+        return self._reader.text(chunk_id)
+
+
 class ContextService:
     """Handles ctx.search and ctx.get logic."""
 
@@ -47,6 +220,33 @@ class ContextService:
         self.ctx_dir = target_path / "_ctx"
         self.pack_path = self.ctx_dir / "context_pack.json"
         self.policy = SegmentIndexingPolicy.detect(target_path)
+        self._session: PackSession | None = None
+        self._loaded_pack_digest: str | None = None
+
+    def open_session(self) -> PackSession:
+        """Load the pack once and pin it for every later search/get on this service."""
+        if self._session is None:
+            self._session = self._new_session()
+        return self._session
+
+    def _current_session(self) -> PackSession:
+        """Return the pinned session, or a one-shot session if none is open."""
+        if self._session is not None:
+            return self._session
+        return self._new_session()
+
+    def _new_session(self) -> PackSession:
+        index_path = self.ctx_dir / CONTEXT_INDEX_FILENAME
+        # Prefer the mmap-backed binary pack when it matches the JSON pack.
+        # skill_hub packs always go through promoted-set validation instead.
+        if self.policy != SegmentIndexingPolicy.SKILL_HUB:
+            reader = BinaryPackReader.open_if_fresh(self.ctx_dir)
+            if reader is not None:
+                return BinaryPackSession(reader, index_path=index_path)
+
+        self._loaded_pack_digest = None
+        pack = self._load_pack()
+        return PackSession(pack, pack_digest=self._loaded_pack_digest, index_path=index_path)
 
     def _load_pack(self) -> ContextPack:
         """Load the context pack from disk."""
@@ -56,9 +256,9 @@ class ContextService:
         if not self.pack_path.exists():
             raise FileNotFoundError(f"Context pack not found at {self.pack_path}")
 
-        with open(self.pack_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return ContextPack(**data)
+        raw = self.pack_path.read_bytes()
+        self._loaded_pack_digest = hashlib.sha256(raw).hexdigest()
+        return ContextPack(**json.loads(raw))
 
     @staticmethod
     def _sha256(path: Path) -> str:
@@ -164,6 +364,7 @@ class ContextService:
             errors.append(f"[{source}] invalid pack admission: {'; '.join(pack_admission.error)}")
             return None
 
+        self._loaded_pack_digest = pack_fingerprint
         return pack
 
     def search(self, query: str, k: int = 5, doc_filter: Optional[str] = None) -> SearchResult:
@@ -173,65 +374,177 @@ class ContextService:
         Search authority is the full chunk body (`chunk.text`), while the
         returned display surface remains the truncated preview from the index.
         """
-        pack = self._load_pack()
-        hits = []
-        query_words = [w.lower() for w in query.split() if len(w) > 2]  # Skip short words
+        return self.search_terms([query], k=k, doc_filter=doc_filter)[0]
 
-        if not query_words:
-            query_words = [query.lower()]
+    def search_terms(
+        self, queries: list[str], k: int = 5, doc_filter: Optional[str] = None
+    ) -> list[SearchResult]:
+        """
+        Search several queries (e.g. QueryExpander terms) in one pass over the pack.
 
-        chunk_map = {chunk.id: chunk for chunk in pack.chunks}
+        Every distinct word of every query is matched once against each title
+        and body; the resulting per-word match sets are shared by all queries,
+        so scoring N expanded terms no longer costs N passes over the bodies.
+        Result ``i`` is identical to ``search(queries[i], k, doc_filter)``.
+        """
+        session = self._current_session()
+        query_words = [self._query_words(query) for query in queries]
+        words = list(dict.fromkeys(word for words in query_words for word in words))
+
+        # Match sets from the inverted index sidecar when it matches this pack
+        index = session.search_index
+        if index is not None:
+            title_sets, body_sets = self._match_from_postings(session, index, words, doc_filter)
+        else:
+            title_sets, body_sets = self._match_by_scan(session, words, doc_filter)
 
-        for entry in pack.index:
-            chunk = chunk_map.get(entry.id)
-            if chunk is None:
-                raise RuntimeError(f"missing chunk id '{entry.id}' referenced by context index")
+        boost_positions: dict[str, list[int]] = {}
+        return [
+            SearchResult(
+                hits=self._rank(
+                    session, words, title_sets, body_sets, boost_positions, doc_filter, k
+                )
+            )
+            for words in query_words
+        ]
 
-            # Apply doc filter if provided
-            if doc_filter and doc_filter not in entry.id and doc_filter != chunk.doc:
-                continue
+    @staticmethod
+    def _query_words(query: str) -> list[str]:
+        query_words = [w.lower() for w in query.split() if len(w) > 2]  # Skip short words
+        return query_words or [query.lower()]
 
-            score = 0.0
+    @staticmethod
+    def _doc_allowed(
+        session: PackSession, entry: ContextIndexEntry, doc_filter: Optional[str]
+    ) -> bool:
+        doc = session.chunk_doc(entry.id)
+        if doc is None:
+            raise RuntimeError(f"missing chunk id '{entry.id}' referenced by context index")
+        return not (doc_filter and doc_filter not in entry.id and doc_filter != doc)
+
+    def _match_by_scan(
+        self, session: PackSession, words: list[str], doc_filter: Optional[str]
+    ) -> tuple[dict[str, set[int]], dict[str, set[int]]]:
+        """Title/body match sets per word, visiting each index entry once."""
+        title_sets: dict[str, set[int]] = {word: set() for word in words}
+        body_sets: dict[str, set[int]] = {word: set() for word in words}
+        for pos, entry in enumerate(session.index):
+            if not self._doc_allowed(session, entry, doc_filter):
+                continue
             title_lower = entry.title_path_norm.lower()
-            body_lower = chunk.text.lower()
-
-            # 1. Direct word matches
-            for word in query_words:
+            body_lower = session.lower_body(entry.id)
+            for word in words:
                 if word in title_lower:
-                    score += 1.0
+                    title_sets[word].add(pos)
                 if word in body_lower:
-                    score += 0.5
-
-            # 2. Heuristic boosts (Even if title/preview match failed)
-            if "skill" in entry.id and any(
-                kw in query_words for kw in ["regla", "comando", "cómo", "rule", "protocol"]
-            ):
-                score += 0.5
-            if "agent" in entry.id and any(
-                kw in query_words for kw in ["stack", "código", "tech", "implement", "debug", "fix"]
-            ):
-                score += 1.0
-            if "session" in entry.id and any(
-                kw in query_words
-                for kw in ["pasos", "checklist", "runbook", "handoff", "history", "log"]
-            ):
-                score += 0.8
-
-            if score > 0:
-                hits.append(
-                    SearchHit(
-                        id=entry.id,
-                        title_path=[entry.title_path_norm],
-                        preview=entry.preview,
-                        token_est=entry.token_est,
-                        source_path=entry.title_path_norm,
-                        score=score,
-                    )
+                    body_sets[word].add(pos)
+        return title_sets, body_sets
+
+    def _match_from_postings(
+        self,
+        session: PackSession,
+        index: ContextSearchIndex,
+        words: list[str],
+        doc_filter: Optional[str],
+    ) -> tuple[dict[str, set[int]], dict[str, set[int]]]:
+        """Title/body match sets per word from postings, verifying inexact candidates.
+
+        Produces the same sets as _match_by_scan.
+        """
+        pack_index = session.index
+        allowed: dict[int, bool] = {}
+
+        def verified(found: set[int] | None, matches: Callable[[int], bool]) -> set[int]:
+            positions = range(len(pack_index)) if found is None else found
+            result = set()
+            for pos in positions:
+                if pos not in allowed:
+                    allowed[pos] = self._doc_allowed(session, pack_index[pos], doc_filter)
+                if allowed[pos] and matches(pos):
+                    result.add(pos)
+            return result
+
+        title_sets: dict[str, set[int]] = {}
+        body_sets: dict[str, set[int]] = {}
+        for word in words:
+            # Postings are exact for pure word tokens; anything else is verified
+            exact = index.is_exact(word)
+            title_found = index.title_candidates(word)
+            body_found = index.body_candidates(word)
+            if exact and title_found is not None:
+                title_sets[word] = verified(title_found, lambda pos: True)
+            else:
+                title_sets[word] = verified(
+                    title_found, lambda pos: word in pack_index[pos].title_path_norm.lower()
+                )
+            if exact and body_found is not None:
+                body_sets[word] = verified(body_found, lambda pos: True)
+            else:
+                body_sets[word] = verified(
+                    body_found, lambda pos: word in session.lower_body(pack_index[pos].id)
+                )
+        return title_sets, body_sets
+
+    def _rank(
+        self,
+        session: PackSession,
+        query_words: list[str],
+        title_sets: dict[str, set[int]],
+        body_sets: dict[str, set[int]],
+        boost_positions: dict[str, list[int]],
+        doc_filter: Optional[str],
+        k: int,
+    ) -> list[SearchHit]:
+        """Score one query from shared match sets; top ``k`` hits, ties in index order.
+
+        Scores accumulate per word over its match sets (title +1.0, body +0.5)
+        and per boost over the positions whose id carries the boost key, so the
+        work is proportional to the matches rather than to the pack size.
+        """
+        pack_index = session.index
+        scores: dict[int, float] = {}
+        for word in query_words:
+            for pos in title_sets[word]:
+                scores[pos] = scores.get(pos, 0.0) + 1.0
+            for pos in body_sets[word]:
+                scores[pos] = scores.get(pos, 0.0) + 0.5
+
+        # Boosted entries score even without word matches
+        for key, keywords, boost in self._HEURISTIC_BOOSTS:
+            if any(kw in query_words for kw in keywords):
+                if key not in boost_positions:
+                    boost_positions[key] = [
+                        pos
+                        for pos, entry in enumerate(pack_index)
+                        if key in entry.id and self._doc_allowed(session, entry, doc_filter)
+                    ]
+                for pos in boost_positions[key]:
+                    scores[pos] = scores.get(pos, 0.0) + boost
+
+        ranked = top_k(
+            (pos for pos in sorted(scores) if scores[pos] > 0), k, scores.__getitem__
+        )
+        hits = []
+        for pos in ranked:
+            entry = pack_index[pos]
+            hits.append(
+                SearchHit(
+                    id=entry.id,
+                    title_path=[entry.title_path_norm],
+                    preview=entry.preview,
+                    token_est=entry.token_est,
+                    source_path=entry.title_path_norm,
+                    score=scores[pos],
                 )
+            )
+        return hits
 
-        # Sort by score and take top k
-        hits = sorted(hits, key=lambda x: x.score, reverse=True)[:k]
-        return SearchResult(hits=hits)
+    # (id substring, trigger keywords, boost) -- applied even without word matches
+    _HEURISTIC_BOOSTS: tuple[tuple[str, tuple[str, ...], float], ...] = (
+        ("skill", ("regla", "comando", "cómo", "rule", "protocol"), 0.5),
+        ("agent", ("stack", "código", "tech", "implement", "debug", "fix"), 1.0),
+        ("session", ("pasos", "checklist", "runbook", "handoff", "history", "log"), 0.8),
+    )
 
     def get(
         self,
@@ -243,7 +556,7 @@ class ContextService:
         query: Optional[str] = None,
     ) -> GetResult:
         """Retrieve chunks by ID with backpressure and progressive disclosure."""
-        pack = self._load_pack()
+        session = self._current_session()
         selected_chunks = []
         total_tokens = 0
         chars_returned_total = 0
@@ -257,51 +570,29 @@ class ContextService:
         if max_chunks is not None and len(ids) > max_chunks:
             ids = ids[:max_chunks]
 
-        # Create a map for fast lookup
-        chunk_map = {c.id: c for c in pack.chunks}
-
         # Track stop reason and evidence
         stop_reason = "complete"  # Default assumption
         budget_exceeded = False
         evidence_metadata = {"strong_hit": False, "support": False}
 
         for chunk_id in ids:
-            chunk = chunk_map.get(chunk_id)
-            if not chunk:
+            # Progressive Disclosure logic: pick the rendition and size it
+            # before any raw body is materialized
+            rendition = self._render(session, chunk_id, mode, budget - total_tokens)
+            if rendition is None:
                 continue
-
-            # Progressive Disclosure logic
-            text = chunk.text
-            if mode == "excerpt":
-                # T4: headings + trimming + first 25 lines
-                lines = [line.strip() for line in text.split("\n") if line.strip()]
-                excerpt_lines = lines[:25]
-                text = "\n".join(excerpt_lines)
-                if len(lines) > 25:
-                    text += "\n\n... [Contenido truncado, usa mode='raw' para ver todo]"
-            elif mode == "skeleton":
-                text = self._skeletonize(text)
-            elif mode == "raw":
-                # T4: check if it fits in budget
-                token_est = len(text) // 4
-                if total_tokens + token_est > budget:
-                    # Fallback to excerpt with note
-                    lines = [line.strip() for line in text.split("\n") if line.strip()]
-                    text = (
-                        "\n".join(lines[:20])
-                        + "\n\n> [!NOTE]\n> Chunk truncado por presupuesto de tokens. Usa mode='raw' con mayor budget si es crítico."
-                    )
-                    budget_exceeded = True
-
-            token_est = len(text) // 4
-            chars_returned_total += len(text)
+            text, token_est, chars, truncated = rendition
+            budget_exceeded = budget_exceeded or truncated
+            chars_returned_total += chars
 
             # Backpressure: Stop if we are already at budget (or if the first chunk is just too big)
             if total_tokens + token_est > budget and total_tokens > 0:
                 stop_reason = "budget"
                 break
 
-            new_chunk = chunk.model_copy(update={"text": text, "token_est": token_est})
+            new_chunk = session.rendered_chunk(chunk_id, text, token_est)
+            if new_chunk is None:
+                continue
             selected_chunks.append(new_chunk)
             total_tokens += token_est
 
@@ -387,40 +678,48 @@ class ContextService:
 
         return {"strong_hit": strong_hit, "support": support}
 
+    @staticmethod
+    def _render(
+        session: PackSession, chunk_id: str, mode: str, remaining_budget: int
+    ) -> tuple[Optional[str], int, int, bool] | None:
+        """
+        (text, token_est, chars, truncated) of one chunk for ``mode``.
+
+        ``text`` is None when the raw body fits ``remaining_budget``: the
+        caller reads it only once backpressure has accepted the chunk.
+        Precomputed renditions are used when the sidecar matches the pack;
+        otherwise the rendition is computed from the chunk text. None if the
+        chunk does not exist.
+        """
+        renditions = session.renditions
+        rendered = renditions.get(chunk_id) if renditions is not None else None
+        if rendered is not None:
+            if mode == "excerpt":
+                return rendered.excerpt, rendered.excerpt_tokens, len(rendered.excerpt), False
+            if mode == "skeleton":
+                return rendered.skeleton, rendered.skeleton_tokens, len(rendered.skeleton), False
+            if mode == "raw" and rendered.raw_tokens > remaining_budget:
+                # T4: Fallback to excerpt with note
+                text = rendered.budget_fallback
+                return text, rendered.budget_fallback_tokens, len(text), True
+            return None, rendered.raw_tokens, rendered.raw_chars, False
+
+        chunk = session.chunk(chunk_id)
+        if not chunk:
+            return None
+        if mode == "excerpt":
+            text = excerpt(chunk.text)
+        elif mode == "skeleton":
+            text = skeletonize(chunk.text)
+        elif mode == "raw" and estimate_tokens(chunk.text) > remaining_budget:
+            text = budget_fallback(chunk.text)
+            return text, estimate_tokens(text), len(text), True
+        else:
+            return None, estimate_tokens(chunk.text), len(chunk.text), False
+        return text, estimate_tokens(text), len(text), False
+
     def _skeletonize(self, text: str) -> str:
         """
         Extract headings and code block markers to create a structure view.
         """
-        skeleton_lines = []
-        in_code_block = False
-
-        for line in text.splitlines():
-            line_strip = line.strip()
-
-            # Keep headings
-            if line_strip.startswith("#"):
-                skeleton_lines.append(line)
-                continue
-
-            # Keep code block markers
-            if line_strip.startswith("```"):
-                skeleton_lines.append(line)
-                in_code_block = not in_code_block
-                continue
-
-            # If inside code block, keep first line (signature)
-            if (
-                in_code_block
-                and len(skeleton_lines) > 0
-                and skeleton_lines[-1].strip().startswith("```")
-            ):
-                if any(
-                    kw in line
-                    for kw in ["def ", "class ", "interface ", "function ", "const ", "var "]
-                ):
-                    skeleton_lines.append(f"  {line_strip}")
-
-        if not skeleton_lines:
-            return text[:200] + "..."  # Fallback
-
-        return "\n".join(skeleton_lines)
+        return skeletonize(text)
@@ -1,11 +1,16 @@
 import ast as ast_module
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterator
 
-from src.application.ast_parser import SkeletonMapBuilder
+from src.application.ast_parser import extract_top_level_symbols
 from src.domain.graph_models import (
     GraphEdge,
+    GraphFileState,
     GraphIndexSummary,
     GraphNode,
     make_edge_id,
@@ -13,12 +18,15 @@ from src.domain.graph_models import (
 )
 from src.domain.segment_resolver import resolve_segment_ref
 from src.infrastructure.graph_store import GraphStore
+from src.infrastructure.source_walker import walk_sources
 
 
 @dataclass(frozen=True)
 class _FileGraphData:
     nodes: list[GraphNode]
     edges: list[GraphEdge]
+    content_hash: str
+    reparsed: bool = True
 
 
 class _DirectCallCollector(ast_module.NodeVisitor):
@@ -43,108 +51,195 @@ class _DirectCallCollector(ast_module.NodeVisitor):
         return None
 
 
+def _index_source(
+    segment_id: str,
+    segment_root: Path,
+    file_path: Path,
+    known_hash: str | None = None,
+) -> _FileGraphData:
+    """Content hash, nodes and direct-call edges of one file from a single read.
+
+    A file whose hash still equals ``known_hash`` is not parsed
+    (``reparsed=False``). Module-level (and pure) so it can run in a process
+    pool worker.
+    """
+    data = file_path.read_bytes()
+    content_hash = hashlib.sha256(data).hexdigest()
+    if content_hash == known_hash:
+        return _FileGraphData(nodes=[], edges=[], content_hash=content_hash, reparsed=False)
+    try:
+        tree = ast_module.parse(data.decode("utf-8", errors="replace"), filename=str(file_path))
+    except SyntaxError:
+        return _FileGraphData(nodes=[], edges=[], content_hash=content_hash)
+
+    file_rel = str(file_path.relative_to(segment_root))
+    nodes = [
+        GraphNode(
+            id=make_node_id(segment_id, file_rel, symbol.qualified_name),
+            segment_id=segment_id,
+            file_rel=file_rel,
+            symbol_name=symbol.name,
+            qualified_name=symbol.qualified_name,
+            kind=symbol.kind,
+            line=symbol.start_line,
+            metadata_json=None,
+        )
+        for symbol in extract_top_level_symbols(tree)
+    ]
+    return _FileGraphData(
+        nodes=nodes, edges=_extract_edges(segment_id, tree, nodes), content_hash=content_hash
+    )
+
+
+def _extract_edges(
+    segment_id: str,
+    tree: ast_module.Module,
+    nodes: list[GraphNode],
+) -> list[GraphEdge]:
+    caller_ids = {node.symbol_name: node.id for node in nodes if node.kind == "function"}
+    call_target_ids = {
+        node.symbol_name: node.id for node in nodes if node.kind in {"function", "class"}
+    }
+    edges: list[GraphEdge] = []
+
+    for node in tree.body:
+        if not isinstance(node, (ast_module.FunctionDef, ast_module.AsyncFunctionDef)):
+            continue
+        caller_id = caller_ids.get(node.name)
+        if caller_id is None:
+            continue
+        collector = _DirectCallCollector()
+        for statement in node.body:
+            collector.visit(statement)
+        for callee_name in collector.call_names:
+            callee_id = call_target_ids.get(callee_name)
+            if callee_id is None or callee_id == caller_id:
+                continue
+            edge_id = make_edge_id(segment_id, caller_id, callee_id, "calls")
+            edges.append(
+                GraphEdge(
+                    id=edge_id,
+                    segment_id=segment_id,
+                    from_node_id=caller_id,
+                    to_node_id=callee_id,
+                    edge_kind="calls",
+                    source="ast",
+                    confidence=1.0,
+                )
+            )
+
+    deduped: dict[str, GraphEdge] = {edge.id: edge for edge in edges}
+    return list(deduped.values())
+
+
 class GraphIndexer:
     def __init__(self, store: GraphStore | None = None) -> None:
         self._store = store
 
-    def index_segment(self, segment: Path | str) -> GraphIndexSummary:
+    def index_segment(
+        self,
+        segment: Path | str,
+        jobs: int | None = None,
+        full: bool = False,
+    ) -> GraphIndexSummary:
+        """Index ``src/**/*.py`` of a segment into its graph store.
+
+        Incremental by default: files whose mtime and size match the stored ones
+        are skipped without being read; the rest are hashed and only reparsed
+        when their content hash changed. Deleted files are dropped from the
+        graph. ``full`` (or a store without file states) rebuilds the whole
+        segment.
+
+        ``jobs`` > 1 parses files in that many worker processes; results are
+        consumed in walk order, so the stored graph is identical to a serial run.
+        """
         segment_ref = resolve_segment_ref(segment)
         segment_root = segment_ref.root_abs
         store = self._store or GraphStore(
             GraphStore.db_path_for_segment(segment_root, segment_ref.id),
             segment_id=segment_ref.id,
         )
-        builder = SkeletonMapBuilder(segment_id=str(segment_root))
         indexed_at = datetime.now(timezone.utc).isoformat()
 
+        sources = {
+            str(file_path.relative_to(segment_root)): file_path
+            for file_path in walk_sources(segment_root, ["src/**/*.py"], exclude_dirs=())
+        }
+        stored = {} if full else store.get_file_states(segment_ref.id)
+        # Stat before reading: an edit racing the read leaves a stale stat, forcing a rehash
+        stats = {file_rel: path.stat() for file_rel, path in sources.items()}
+        candidates = [
+            file_rel
+            for file_rel, stat in stats.items()
+            if file_rel not in stored
+            or not stored[file_rel].same_stat(stat.st_mtime_ns, stat.st_size)
+        ]
+        removed_files = sorted(set(stored) - set(sources))
+
+        changed: dict[str, GraphFileState] = {}
+        restamped: dict[str, GraphFileState] = {}
         all_nodes: list[GraphNode] = []
         all_edges: list[GraphEdge] = []
-        source_root = segment_root / "src"
-
-        if source_root.exists():
-            for file_path in sorted(source_root.rglob("*.py")):
-                file_data = self._index_file(segment_ref.id, segment_root, file_path, builder)
-                all_nodes.extend(file_data.nodes)
-                all_edges.extend(file_data.edges)
+        index_file = partial(_index_source, segment_ref.id, segment_root)
+        file_results = self._map_files(
+            index_file,
+            [sources[file_rel] for file_rel in candidates],
+            [
+                stored[file_rel].content_hash if file_rel in stored else None
+                for file_rel in candidates
+            ],
+            jobs,
+        )
+        for file_rel, file_data in zip(candidates, file_results):
+            stat = stats[file_rel]
+            state = GraphFileState(file_data.content_hash, stat.st_mtime_ns, stat.st_size)
+            if not file_data.reparsed:
+                restamped[file_rel] = state
+                continue
+            changed[file_rel] = state
+            all_nodes.extend(file_data.nodes)
+            all_edges.extend(file_data.edges)
+
+        if stored:
+            store.replace_files(
+                segment_ref.id,
+                changed,
+                removed_files,
+                all_nodes,
+                all_edges,
+                indexed_at=indexed_at,
+                restamped=restamped,
+            )
+        else:
+            store.replace_segment(
+                segment_ref.id, all_nodes, all_edges, indexed_at=indexed_at, files=changed
+            )
 
-        store.replace_segment(segment_ref.id, all_nodes, all_edges, indexed_at=indexed_at)
+        status = store.get_status(segment_ref.id)
         return GraphIndexSummary(
             segment_id=segment_ref.id,
             db_path=str(store.db_path),
-            node_count=len(all_nodes),
-            edge_count=len(all_edges),
+            node_count=status.node_count,
+            edge_count=status.edge_count,
             indexed_at=indexed_at,
+            files_skipped=len(sources) - len(changed),
+            files_reparsed=len(changed),
+            files_removed=len(removed_files),
         )
 
-    def _index_file(
-        self,
-        segment_id: str,
-        segment_root: Path,
-        file_path: Path,
-        builder: SkeletonMapBuilder,
-    ) -> _FileGraphData:
-        parse_result = builder.build(file_path)
-        file_rel = str(file_path.relative_to(segment_root))
-        nodes = [
-            GraphNode(
-                id=make_node_id(segment_id, file_rel, symbol.qualified_name),
-                segment_id=segment_id,
-                file_rel=file_rel,
-                symbol_name=symbol.name,
-                qualified_name=symbol.qualified_name,
-                kind=symbol.kind,
-                line=symbol.start_line,
-                metadata_json=None,
-            )
-            for symbol in parse_result.symbols
-        ]
-
-        edges = self._extract_edges(segment_id, file_path, nodes)
-        return _FileGraphData(nodes=nodes, edges=edges)
-
-    def _extract_edges(
-        self,
-        segment_id: str,
-        file_path: Path,
-        nodes: list[GraphNode],
-    ) -> list[GraphEdge]:
-        content = file_path.read_text(errors="replace")
-        try:
-            tree = ast_module.parse(content, filename=str(file_path))
-        except SyntaxError:
-            return []
-
-        caller_ids = {node.symbol_name: node.id for node in nodes if node.kind == "function"}
-        call_target_ids = {
-            node.symbol_name: node.id for node in nodes if node.kind in {"function", "class"}
-        }
-        edges: list[GraphEdge] = []
-
-        for node in tree.body:
-            if not isinstance(node, (ast_module.FunctionDef, ast_module.AsyncFunctionDef)):
-                continue
-            caller_id = caller_ids.get(node.name)
-            if caller_id is None:
-                continue
-            collector = _DirectCallCollector()
-            for statement in node.body:
-                collector.visit(statement)
-            for callee_name in collector.call_names:
-                callee_id = call_target_ids.get(callee_name)
-                if callee_id is None or callee_id == caller_id:
-                    continue
-                edge_id = make_edge_id(segment_id, caller_id, callee_id, "calls")
-                edges.append(
-                    GraphEdge(
-                        id=edge_id,
-                        segment_id=segment_id,
-                        from_node_id=caller_id,
-                        to_node_id=callee_id,
-                        edge_kind="calls",
-                        source="ast",
-                        confidence=1.0,
-                    )
-                )
-
-        deduped: dict[str, GraphEdge] = {edge.id: edge for edge in edges}
-        return list(deduped.values())
+    @staticmethod
+    def _map_files(
+        index_file: Callable[[Path, str | None], _FileGraphData],
+        file_paths: list[Path],
+        known_hashes: list[str | None],
+        jobs: int | None,
+    ) -> Iterator[_FileGraphData]:
+        if jobs is None or jobs <= 1 or len(file_paths) < 2:
+            yield from map(index_file, file_paths, known_hashes)
+            return
+
+        workers = min(jobs, len(file_paths))
+        # A few chunks per worker: amortizes IPC while keeping the load balanced
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(index_file, file_paths, known_hashes, chunksize=chunksize)
@@ -8,6 +8,10 @@ from src.infrastructure.graph_store import (
 
 
 class GraphService:
+    MAX_DEPTH = 10
+    # Cap for transitive (depth > 1) traversals when no limit is given
+    DEFAULT_RELATED_LIMIT = 200
+
     def __init__(self, store: GraphStore | None = None) -> None:
         self._store = store
 
@@ -35,11 +39,58 @@ class GraphService:
             "nodes": [node.to_dict() for node in nodes],
         }
 
-    def callers(self, segment: Path | str, symbol: str) -> dict[str, object]:
-        return self._related(segment, symbol, reverse=True)
+    def callers(
+        self,
+        segment: Path | str,
+        symbol: str,
+        depth: int = 1,
+        limit: int | None = None,
+    ) -> dict[str, object]:
+        return self._related(segment, symbol, reverse=True, depth=depth, limit=limit)
 
-    def callees(self, segment: Path | str, symbol: str) -> dict[str, object]:
-        return self._related(segment, symbol, reverse=False)
+    def callees(
+        self,
+        segment: Path | str,
+        symbol: str,
+        depth: int = 1,
+        limit: int | None = None,
+    ) -> dict[str, object]:
+        return self._related(segment, symbol, reverse=False, depth=depth, limit=limit)
+
+    def path(
+        self,
+        segment: Path | str,
+        source: str,
+        target: str,
+        max_depth: int = MAX_DEPTH,
+    ) -> dict[str, object]:
+        """Shortest call chain from ``source`` to ``target`` (both resolved like callers)."""
+        try:
+            resolved = self._resolve_existing(segment, required_tables=GraphStore.RELATION_REQUIRED_TABLES)
+        except GraphStoreAccessError as exc:
+            exc.symbol = source
+            raise
+        payload: dict[str, object] = {"status": "ok", "from": source, "to": target}
+        if resolved is None:
+            segment_ref = resolve_segment_ref(segment)
+            return {**payload, "segment_id": segment_ref.id, "found": False, "nodes": []}
+        segment_ref, store = resolved
+        source_node = self._resolve_related_target(store, segment_ref.id, source)
+        target_node = self._resolve_related_target(store, segment_ref.id, target)
+        chain = store.find_call_path(
+            segment_ref.id,
+            source_node.id,
+            target_node.id,
+            max_depth=min(max_depth, self.MAX_DEPTH),
+        )
+        return {
+            **payload,
+            "segment_id": segment_ref.id,
+            "found": chain is not None,
+            "nodes": [
+                {**node.to_dict(), "depth": hops} for hops, node in enumerate(chain or [])
+            ],
+        }
 
     def related_terms(self, segment: Path | str, query: str) -> dict[str, object]:
         resolved = self._resolve_existing(segment, required_tables=GraphStore.SEARCH_REQUIRED_TABLES)
@@ -57,7 +108,20 @@ class GraphService:
             "terms": [first.symbol_name, first.file_rel],
         }
 
-    def _related(self, segment: Path | str, symbol: str, reverse: bool) -> dict[str, object]:
+    def _related(
+        self,
+        segment: Path | str,
+        symbol: str,
+        reverse: bool,
+        depth: int = 1,
+        limit: int | None = None,
+    ) -> dict[str, object]:
+        """Direct callers/callees, or a capped traversal when ``depth`` > 1 or ``limit`` is set.
+
+        Only the traversal adds ``depth``/``truncated`` to the payload and a
+        hop count to each node; a plain direct lookup keeps its original shape.
+        """
+        traversal = depth > 1 or limit is not None
         try:
             resolved = self._resolve_existing(segment, required_tables=GraphStore.RELATION_REQUIRED_TABLES)
         except GraphStoreAccessError as exc:
@@ -65,24 +129,44 @@ class GraphService:
             raise
         if resolved is None:
             segment_ref = resolve_segment_ref(segment)
-            return {
+            payload: dict[str, object] = {
                 "status": "ok",
                 "segment_id": segment_ref.id,
                 "symbol": symbol,
-                "nodes": [],
             }
+            if traversal:
+                payload.update(depth=depth, truncated=False)
+            return {**payload, "nodes": []}
         segment_ref, store = resolved
         target_node = self._resolve_related_target(store, segment_ref.id, symbol)
-        nodes = (
-            store.get_callers_for_node(segment_ref.id, target_node.id)
-            if reverse
-            else store.get_callees_for_node(segment_ref.id, target_node.id)
+        if not traversal:
+            nodes = (
+                store.get_callers_for_node(segment_ref.id, target_node.id)
+                if reverse
+                else store.get_callees_for_node(segment_ref.id, target_node.id)
+            )
+            return {
+                "status": "ok",
+                "segment_id": segment_ref.id,
+                "symbol": symbol,
+                "nodes": [node.to_dict() for node in nodes],
+            }
+        cap = self.DEFAULT_RELATED_LIMIT if limit is None else limit
+        # One extra row tells a capped result apart from one that fits exactly
+        reached = store.traverse_calls(
+            segment_ref.id,
+            target_node.id,
+            reverse=reverse,
+            max_depth=min(depth, self.MAX_DEPTH),
+            limit=cap + 1,
         )
         return {
             "status": "ok",
             "segment_id": segment_ref.id,
             "symbol": symbol,
-            "nodes": [node.to_dict() for node in nodes],
+            "depth": depth,
+            "truncated": len(reached) > cap,
+            "nodes": [{**node.to_dict(), "depth": hops} for node, hops in reached[:cap]],
         }
 
     def _resolve_related_target(self, store: GraphStore, segment_id: str, symbol: str):
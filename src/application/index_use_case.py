@@ -2,6 +2,11 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from src.infrastructure.source_walker import walk_sources
+
+# Only runtime artifacts are skipped; build/ and dist/ packages stay searchable
+INDEX_EXCLUDE_DIRS = ("_ctx", "__pycache__")
+
 
 class IndexUseCase:
     def __init__(self, runtime_dir: Path) -> None:
@@ -26,9 +31,7 @@ class IndexUseCase:
     def _index_segment(self, segment_path: Path) -> int:
         count = 0
         conn = sqlite3.connect(self._search_db)
-        for py_file in segment_path.rglob("*.py"):
-            if "_ctx" in py_file.parts or "__pycache__" in py_file.parts:
-                continue
+        for py_file in walk_sources(segment_path, ["**/*.py"], INDEX_EXCLUDE_DIRS):
             try:
                 content = py_file.read_text(errors="ignore")
                 file_path = str(py_file)
@@ -17,9 +17,10 @@ class PlanUseCase:
     - L4: Fallback to entrypoints
     """
 
-    def __init__(self, file_system: Any, telemetry: Any = None) -> None:
+    def __init__(self, file_system: Any, telemetry: Any = None, warm_cache: Any = None) -> None:
         self.file_system = file_system
         self.telemetry = telemetry
+        self.warm_cache = warm_cache  # WarmContextCache when hosted by the daemon
 
     def _hash_task(self, task: str) -> str:
         """Generate SHA256 hash of task for privacy."""
@@ -612,7 +613,15 @@ class PlanUseCase:
         ctx_dir = target_path / "_ctx"
 
         # Load aliases for L2 matching
-        features = self._load_aliases(ctx_dir)
+        if self.warm_cache is not None:
+            features = self.warm_cache.cached(
+                "plan_features",
+                ctx_dir,
+                [ctx_dir / "aliases.yaml"],
+                lambda: self._load_aliases(ctx_dir),
+            )
+        else:
+            features = self._load_aliases(ctx_dir)
         available_features = set(features.keys())
 
         # Initialize result
@@ -1,6 +1,8 @@
 """Query expansion with alias support and weighting."""
 
-from typing import Any, Dict, List, Tuple, Set
+from typing import Any, Dict, List, Tuple, Set, Union
+
+from src.domain.alias_index import AliasIndex
 
 
 class QueryExpander:
@@ -10,13 +12,17 @@ class QueryExpander:
     ORIGINAL_WEIGHT = 1.0
     ALIAS_WEIGHT = 0.7
 
-    def __init__(self, aliases: Dict[str, List[str]]):
+    def __init__(self, aliases: Union[Dict[str, List[str]], AliasIndex]):
         """Initialize expander with aliases.
 
         Args:
-            aliases: Dict mapping alias keys to synonym lists
+            aliases: Dict mapping alias keys to synonym lists, or an AliasIndex
+                already compiled from one (e.g. loaded from the on-disk cache)
         """
-        self.aliases = aliases
+        if not isinstance(aliases, AliasIndex):
+            aliases = AliasIndex.from_aliases(aliases)
+        self.index = aliases
+        self.aliases = self.index.forward
 
     def expand(self, query: str, tokens: List[str]) -> List[Tuple[str, float]]:
         """Expand query using aliases with weights.
@@ -46,14 +52,12 @@ class QueryExpander:
 
         # 1. Check full query in keys and synonyms
         # From key -> add all synonyms
-        if query in self.aliases:
-            for synonym in self.aliases[query]:
-                add_term(synonym, self.ALIAS_WEIGHT)
+        for synonym in self.index.synonyms(query):
+            add_term(synonym, self.ALIAS_WEIGHT)
 
         # From synonym -> add key (reverse lookup)
-        for key, synonyms in self.aliases.items():
-            if query in synonyms:
-                add_term(key, self.ALIAS_WEIGHT)
+        for key in self.index.keys_for(query):
+            add_term(key, self.ALIAS_WEIGHT)
 
         # 2. Check each token (if not already found)
         for token in tokens:
@@ -61,14 +65,12 @@ class QueryExpander:
                 break
 
             # From key -> add synonyms
-            if token in self.aliases:
-                for synonym in self.aliases[token]:
-                    add_term(synonym, self.ALIAS_WEIGHT)
+            for synonym in self.index.synonyms(token):
+                add_term(synonym, self.ALIAS_WEIGHT)
 
             # From synonym -> add key
-            for key, synonyms in self.aliases.items():
-                if token in synonyms:
-                    add_term(key, self.ALIAS_WEIGHT)
+            for key in self.index.keys_for(token):
+                add_term(key, self.ALIAS_WEIGHT)
 
         return terms
 
@@ -83,13 +85,9 @@ class QueryExpander:
         """
         alias_terms = [t for t, w in terms if w == self.ALIAS_WEIGHT]
 
-        # Find which alias keys were used
-        keys_used = []
-        for key, synonyms in self.aliases.items():
-            for term in alias_terms:
-                if term in synonyms:
-                    keys_used.append(key)
-                    break
+        # Find which alias keys were used (listing any alias term), in alias order
+        used = {key for term in alias_terms for key in self.index.keys_for(term)}
+        keys_used = sorted(used, key=self.index.key_order.__getitem__)
 
         return {
             "alias_expanded": len(alias_terms) > 0,
@@ -3,15 +3,18 @@
 import hashlib
 import logging
 import os
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from src.application.context_service import ContextService, GetResult
+from src.application.chunking import ChunkingMode
+from src.application.context_service import ContextService, GetResult, top_k
+from src.application.warm_context import WarmContextCache
 from src.application.zero_hit_tracker import create_zero_hit_tracker
 from src.application.spanish_aliases import detect_spanish, expand_with_spanish_aliases
+from src.domain.alias_index import AliasIndex
 from src.infrastructure.file_system import FileSystemAdapter
+from src.infrastructure.git_head import read_head_sha
 from src.domain.query_linter import LinterPlan
 
 logger = logging.getLogger(__name__)
@@ -47,6 +50,9 @@ class SearchPipelineResult:
     # Term tracking (solo para execute_with_explanation)
     matched_terms: dict[str, list[str]]  # chunk_id -> terms that matched
 
+    # Service with the pack session pinned (reused by the Spanish fallback pass)
+    service: ContextService | None = None
+
 
 def _detect_source() -> str:
     """Detect execution source for telemetry segmentation.
@@ -81,16 +87,14 @@ def _detect_source() -> str:
 def _get_build_sha() -> str:
     """Get git commit SHA for build tracking.
 
+    Read from .git (HEAD, loose refs, packed-refs) and cached per process;
+    the cache is revalidated by mtime, so no git subprocess runs per search.
+
     Returns:
         First 8 characters of git HEAD SHA, or 'unknown' if not in git repo.
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5, check=True
-        )
-        return result.stdout.strip()[:8]
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-        return "unknown"
+    sha = read_head_sha(Path.cwd())
+    return sha[:8] if sha else "unknown"
 
 
 def _classify_zero_hit_reason(
@@ -148,9 +152,15 @@ def _build_disabled_lint_plan(normalized_query: str) -> LinterPlan:
 class SearchUseCase:
     """Wrapper for ctx.search with telemetry."""
 
-    def __init__(self, file_system: FileSystemAdapter, telemetry: Any = None) -> None:
+    def __init__(
+        self,
+        file_system: FileSystemAdapter,
+        telemetry: Any = None,
+        warm_cache: WarmContextCache | None = None,
+    ) -> None:
         self.file_system = file_system
         self.telemetry = telemetry
+        self.warm_cache = warm_cache
 
     def _execute_search_pipeline(
         self,
@@ -201,11 +211,14 @@ class SearchUseCase:
                 matched_terms={},
             )
 
-        # Load aliases (manual + generated merged)
+        # Load aliases (manual + generated merged), compiled for O(1) lookups
         # target_path IS the segment root - AliasMerger expects segment_path param
+        aliases: AliasIndex | dict[str, list[str]]
         try:
-            merger = AliasMerger(segment_path=target_path)
-            aliases = merger.merge()
+            if self.warm_cache is not None:
+                aliases = self.warm_cache.alias_index(target_path)
+            else:
+                aliases = AliasMerger(segment_path=target_path).index()
         except Exception as e:
             logger.debug(f"Failed to load aliases: {e}")
             aliases = {}  # Fail-safe: continue with empty aliases
@@ -218,8 +231,12 @@ class SearchUseCase:
         query_for_expander: str
         if enable_lint:
             repo_root = resolve_segment_root(target_path)
-            anchors_cfg = ConfigLoader.load_anchors(repo_root)
-            aliases_cfg = ConfigLoader.load_linter_aliases(repo_root)
+            if self.warm_cache is not None:
+                anchors_cfg = self.warm_cache.anchors(repo_root)
+                aliases_cfg = self.warm_cache.linter_aliases(repo_root)
+            else:
+                anchors_cfg = ConfigLoader.load_anchors(repo_root)
+                aliases_cfg = ConfigLoader.load_linter_aliases(repo_root)
             lint_plan = lint_query(normalized_query, anchors_cfg, aliases_cfg)
 
             # If config missing, force disabled state
@@ -246,13 +263,20 @@ class SearchUseCase:
         # Get expansion metadata
         expansion_meta = expander.get_expansion_metadata(expanded_terms)
 
-        # Execute search for each term and combine results
-        service = ContextService(target_path)
+        # Execute search for each term and combine results.
+        # The pack is loaded once and shared by every expanded term.
+        service = (
+            self.warm_cache.service(target_path)
+            if self.warm_cache is not None
+            else ContextService(target_path)
+        )
+        service.open_session()
         combined_results: dict[str, tuple[Any, float]] = {}  # chunk_id -> (hit, max_score)
         matched_terms: dict[str, list[str]] = {}  # chunk_id -> terms that matched
 
-        for term, weight in expanded_terms:
-            result = service.search(term, k=limit * 2)  # Get more to allow for de-dupe
+        # All terms are matched in one pass; k * 2 leaves room for de-dupe
+        term_results = service.search_terms([term for term, _ in expanded_terms], k=limit * 2)
+        for (term, weight), result in zip(expanded_terms, term_results):
             for hit in result.hits:
                 weighted_score = hit.score * weight
                 if hit.id not in combined_results or weighted_score > combined_results[hit.id][1]:
@@ -265,7 +289,7 @@ class SearchUseCase:
                         matched_terms[hit.id].append(term)
 
         # Sort by weighted score and take top N
-        sorted_hits = sorted(combined_results.values(), key=lambda x: x[1], reverse=True)[:limit]
+        sorted_hits = top_k(combined_results.values(), limit, lambda x: x[1])
         final_hits = [hit for hit, _ in sorted_hits]
 
         return SearchPipelineResult(
@@ -281,6 +305,7 @@ class SearchUseCase:
             sorted_hits=sorted_hits,
             final_hits=final_hits,
             matched_terms=matched_terms if track_matched_terms else {},
+            service=service,
         )
 
     def execute(
@@ -359,10 +384,10 @@ class SearchUseCase:
         if len(final_hits) == 0 and source != "fixture":
             if detect_spanish(query):
                 spanish_alias_variants = expand_with_spanish_aliases(normalized_query)
-                # Create service for Spanish fallback search
-                service = ContextService(target_path)
-                for variant in spanish_alias_variants[1:]:
-                    variant_result = service.search(variant, k=limit * 2)
+                # Reuse the pipeline's pinned pack session for the fallback pass
+                service = result.service or ContextService(target_path)
+                variant_results = service.search_terms(spanish_alias_variants[1:], k=limit * 2)
+                for variant_result in variant_results:
                     for hit in variant_result.hits:
                         if hit.id not in combined_results:
                             combined_results[hit.id] = (hit, hit.score * 0.8)
@@ -372,9 +397,7 @@ class SearchUseCase:
         pass2_hits = 0
         pass2_attempted = len(spanish_alias_variants) > 1
         if combined_results and not final_hits:
-            sorted_hits = sorted(combined_results.values(), key=lambda x: x[1], reverse=True)[
-                :limit
-            ]
+            sorted_hits = top_k(combined_results.values(), limit, lambda x: x[1])
             final_hits = [hit for hit, _ in sorted_hits]
             pass2_hits = len(final_hits)
 
@@ -567,9 +590,15 @@ class SearchUseCase:
 class GetChunkUseCase:
     """Wrapper for ctx.get with telemetry."""
 
-    def __init__(self, file_system: FileSystemAdapter, telemetry: Any = None) -> None:
+    def __init__(
+        self,
+        file_system: FileSystemAdapter,
+        telemetry: Any = None,
+        warm_cache: WarmContextCache | None = None,
+    ) -> None:
         self.file_system = file_system
         self.telemetry = telemetry
+        self.warm_cache = warm_cache
 
     def execute_with_result(
         self,
@@ -582,7 +611,11 @@ class GetChunkUseCase:
         query: Optional[str] = None,
     ) -> tuple[str, GetResult]:
         """Execute get and return both output and GetResult (for PD_REPORT)."""
-        service = ContextService(target_path)
+        service = (
+            self.warm_cache.service(target_path)
+            if self.warm_cache is not None
+            else ContextService(target_path)
+        )
         result = service.get(
             ids,
             mode=mode,
@@ -667,13 +700,26 @@ class SyncContextUseCase:
         self.file_system = file_system
         self.telemetry = telemetry
 
-    def execute(self, target_path: Path) -> str:
+    def execute(
+        self,
+        target_path: Path,
+        write_binary: bool = False,
+        incremental: bool = False,
+        jobs: int | None = None,
+        chunking: ChunkingMode = "whole_file",
+    ) -> str:
         """Execute sync (build + validate)."""
         from src.application.use_cases import BuildContextPackUseCase, ValidateContextPackUseCase
 
         # Build
         build_uc = BuildContextPackUseCase(self.file_system, self.telemetry)
-        build_uc.execute(target_path)
+        build_uc.execute(
+            target_path,
+            write_binary=write_binary,
+            incremental=incremental,
+            jobs=jobs,
+            chunking=chunking,
+        )
 
         # Validate
         validate_uc = ValidateContextPackUseCase(self.file_system, self.telemetry)
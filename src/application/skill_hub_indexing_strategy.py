@@ -150,7 +150,7 @@ class SkillHubIndexingStrategy:
             # Build source file metadata
             sha256 = hashlib.sha256(content.encode()).hexdigest()
             try:
-                mtime = skill_file_path.stat().st_mtime
+                stat = skill_file_path.stat()
             except OSError as e:
                 errors.append(f"Cannot stat skill file {skill_entry.relative_path}: {e}")
                 continue
@@ -158,8 +158,9 @@ class SkillHubIndexingStrategy:
                 SourceFile(
                     path=skill_entry.relative_path,
                     sha256=sha256,
-                    mtime=mtime,
+                    mtime=stat.st_mtime,
                     chars=len(content),
+                    size=stat.st_size,
                 )
             )
 
@@ -154,7 +154,7 @@ def generate_chart(segment_path, chart_type: str = "hits", days: int = 7) -> str
     """
     from .telemetry_reports import load_telemetry_data, filter_events_by_date
 
-    events, _, _ = load_telemetry_data(segment_path)
+    events, _, _ = load_telemetry_data(segment_path, days)
     events = filter_events_by_date(events, days)
 
     if chart_type == "commands":
@@ -16,8 +16,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-from src.application.telemetry_reports import load_telemetry_data
+from src.application.telemetry_reports import load_telemetry_state
 from src.application.zero_hit_tracker import create_zero_hit_tracker
+from src.infrastructure.telemetry_store import TelemetryStore
 
 
 @dataclass
@@ -36,14 +37,13 @@ class TelemetryHealth:
 
     def __init__(self, segment_path: Path):
         self.segment_path = segment_path
-        self.events: list[dict[str, Any]] = []
         self.metrics: dict[str, Any] = {}
         self.last_run: dict[str, Any] = {}
         self._load_data()
 
     def _load_data(self):
-        """Load telemetry data from segment."""
-        self.events, self.metrics, self.last_run = load_telemetry_data(self.segment_path)
+        """Load telemetry state from segment; events are queried from the indexed store."""
+        self.metrics, self.last_run = load_telemetry_state(self.segment_path)
 
     def _compute_zero_hit_by_source(self) -> dict[str, Any]:
         """Compute zero-hit ratios by source from events.
@@ -56,21 +56,12 @@ class TelemetryHealth:
                 'sources': [{'source': 'fixture', 'searches': N, 'zero_hits': M, 'ratio': R}, ...]
             }
         """
-        from collections import defaultdict
-
-        # Count searches and zero-hits by source
-        source_stats = defaultdict(lambda: {"searches": 0, "zero_hits": 0})
-
-        for event in self.events:
-            if event.get("cmd") != "ctx.search":
-                continue
-
-            source = event.get("x", {}).get("source", "unknown")
-            hits = event.get("result", {}).get("hits", -1)
-
-            source_stats[source]["searches"] += 1
-            if hits == 0:
-                source_stats[source]["zero_hits"] += 1
+        # Count searches and zero-hits by source (a search without result.hits is not a zero hit)
+        with TelemetryStore.for_segment(self.segment_path) as store:
+            source_stats = {
+                row["source"]: {"searches": row["events"], "zero_hits": row["zero_hits"]}
+                for row in store.search_counts()
+            }
 
         # Compute ratios
         result = {
@@ -121,7 +112,9 @@ class TelemetryHealth:
     def _compute_spanish_alias_impact(self) -> dict[str, Any]:
         from collections import defaultdict
 
-        alias_events = [e for e in self.events if e.get("cmd") == "ctx.search.spanish_alias"]
+        with TelemetryStore.for_segment(self.segment_path) as store:
+            alias_events = store.events(cmd="ctx.search.spanish_alias")
+            window_events = store.count()
 
         if not alias_events:
             return {
@@ -194,7 +187,7 @@ class TelemetryHealth:
             "total_recovered": total_recovered,
             "recovery_rate": recovery_rate,
             "top_aliases": top_aliases,
-            "window_events": len(self.events),
+            "window_events": window_events,
         }
 
     def check_lsp_invariants(self) -> list[HealthResult]:
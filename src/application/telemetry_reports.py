@@ -9,28 +9,41 @@ from pathlib import Path
 from typing import Any, Optional
 from collections import Counter
 
+from src.infrastructure.telemetry_store import TelemetryStore
 
-def load_telemetry_data(segment_path: Path) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
+
+def load_telemetry_data(
+    segment_path: Path, days: int = 0
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
     """Load telemetry data from segment.
 
+    Events are read through the indexed TelemetryStore, so a window only
+    loads the events inside it.
+
     Args:
         segment_path: Path to segment directory
+        days: Only load events from the last N days, plus events without a
+            valid timestamp (0 = all)
 
     Returns:
         Tuple of (events, metrics, last_run)
     """
-    tel_dir = segment_path / "_ctx" / "telemetry"
+    with TelemetryStore.for_segment(segment_path) as store:
+        events = store.events(since=_cutoff(days), include_undated=True)
+    metrics, last_run = load_telemetry_state(segment_path)
+    return events, metrics, last_run
+
+
+def load_telemetry_state(segment_path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load metrics.json and last_run.json from segment.
 
-    events = []
-    events_path = tel_dir / "events.jsonl"
-    if events_path.exists():
-        with open(events_path) as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
+    Args:
+        segment_path: Path to segment directory
+
+    Returns:
+        Tuple of (metrics, last_run)
+    """
+    tel_dir = segment_path / "_ctx" / "telemetry"
 
     metrics = {}
     metrics_path = tel_dir / "metrics.json"
@@ -48,7 +61,11 @@ def load_telemetry_data(segment_path: Path) -> tuple[list[dict[str, Any]], dict[
         except json.JSONDecodeError:
             pass
 
-    return events, metrics, last_run
+    return metrics, last_run
+
+
+def _cutoff(days: int) -> Optional[datetime]:
+    return datetime.now(timezone.utc) - timedelta(days=days) if days > 0 else None
 
 
 def filter_events_by_date(events: list[dict[str, Any]], days: int) -> list[dict[str, Any]]:
@@ -90,14 +107,12 @@ def generate_report(segment_path: Path, last_days: int = 7, format_type: str = "
     Returns:
         Formatted report string
     """
-    events, metrics, last_run = load_telemetry_data(segment_path)
-
-    if not events and not metrics:
-        return "No telemetry data found."
-
-    # Filter by date
-    if last_days > 0:
-        events = filter_events_by_date(events, last_days)
+    metrics, last_run = load_telemetry_state(segment_path)
+    with TelemetryStore.for_segment(segment_path) as store:
+        if not store.count() and not metrics:
+            return "No telemetry data found."
+        # Only the window is loaded; undated events are kept, as filter_events_by_date does
+        events = store.events(since=_cutoff(last_days), include_undated=True)
 
     if format_type == "json":
         return json.dumps({"events": events, "metrics": metrics, "last_run": last_run}, indent=2)
@@ -242,16 +257,16 @@ def get_quick_stats(segment_path: Path) -> dict[str, Any]:
     Returns:
         Dictionary with quick stats
     """
-    events, metrics, last_run = load_telemetry_data(segment_path)
-
-    cmd_counts = Counter(e["cmd"] for e in events)
-    searches = [e for e in events if e["cmd"] == "ctx.search"]
-    with_hits = sum(1 for e in searches if e.get("result", {}).get("hits", 0) > 0)
+    with TelemetryStore.for_segment(segment_path) as store:
+        cmd_counts = Counter(store.counts_by_cmd())
+        search_counts = store.search_counts()
+    total_searches = sum(row["events"] for row in search_counts)
+    with_hits = sum(row["with_hits"] for row in search_counts)
 
     return {
-        "total_commands": len(events),
-        "total_searches": len(searches),
+        "total_commands": sum(cmd_counts.values()),
+        "total_searches": total_searches,
         "searches_with_hits": with_hits,
-        "hit_rate": with_hits / len(searches) if searches else 0,
+        "hit_rate": with_hits / total_searches if total_searches else 0,
         "top_command": cmd_counts.most_common(1)[0] if cmd_counts else None,
     }
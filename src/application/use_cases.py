@@ -1,15 +1,28 @@
 import hashlib
 import json
 import logging
+import os
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from src.application.ast_parser import SkeletonMapBuilder, SymbolInfo
+from src.application.chunking import (
+    SYMBOL_METHOD,
+    WHOLE_FILE_METHOD,
+    ChunkingMode,
+    chunking_method_for,
+    split_sections,
+)
+from src.application.context_index import pack_digest, write_context_index
+from src.application.context_renditions import write_context_renditions
 from src.application.context_service import ContextService
 from src.application.skill_hub_indexing_strategy import SkillHubIndexingStrategy
 from src.domain.constants import MAX_SKILL_LINES
@@ -23,12 +36,52 @@ from src.domain.models import TrifectaConfig, TrifectaPack, ValidationResult
 from src.domain.result import Err, Ok
 from src.domain.segment_indexing_policy import SegmentIndexingPolicy
 from src.domain.skill_manifest import SkillManifest
+from src.infrastructure.binary_pack import (
+    BINARY_PACK_FILENAME,
+    verify_binary_pack,
+    write_binary_pack,
+)
 from src.infrastructure.file_system import FileSystemAdapter
 from src.infrastructure.file_system_utils import AtomicWriter, file_lock
+from src.infrastructure.source_walker import walk_sources
+from src.infrastructure.telemetry_store import TelemetryStore
 from src.infrastructure.templates import TemplateRenderer
 
 logger = logging.getLogger(__name__)
 
+# Previous-build (source file, chunks, index entries) of one doc, reused by incremental builds
+_ReusableSource = tuple[SourceFile, list[ContextChunk], list[ContextIndexEntry]]
+
+# Reader threads for `ctx build` when --jobs is not given
+DEFAULT_BUILD_JOBS = min(8, (os.cpu_count() or 1) + 4)
+
+# Repo content indexed by `ctx build`, highest priority first.
+# P0 FIX: Expand patterns to include custom high-value directories
+REPO_SOURCE_PATTERNS: tuple[str, ...] = (
+    "docs/**/*.md",
+    "src/**/*.py",
+    "src/**/*.ts",
+    "src/**/*.js",
+    "README*.md",
+    "*.md",
+    # Custom high-value directories (WO-0009, examen_grado case)
+    "skills/**/*.md",  # Skills system
+    "apps/**/*.py",  # Application code
+    "apps/**/*.ts",  # TypeScript apps
+    "apps/**/*.js",  # JavaScript apps
+    "apps/**/*.vue",  # Vue components
+    "apps/**/*.md",  # App documentation
+    "config/**/*.yaml",  # Configuration files
+    "config/**/*.yml",  # YAML config
+    "config/**/*.json",  # JSON config
+    "config/**/*.toml",  # TOML config
+    "tests/**/*.py",  # Test files
+    "tests/**/*.ts",  # TypeScript tests
+    "tests/**/*.js",  # JavaScript tests
+    "main.py",  # Entry points
+    "app.py",  # Alternative entry point
+)
+
 SKILL_HUB_PROMOTION_RECEIPT = "skill_hub_promotion_receipt.json"
 SKILL_HUB_LAST_VALID_DIR = ".skill_hub_last_valid"
 
@@ -296,18 +349,29 @@ class BuildContextPackUseCase:
         p = root / path_str
         return p if p.exists() and p.is_file() else None
 
-    def _save_pack(self, target_path: Path, pack: ContextPack) -> None:
+    def _save_pack(self, target_path: Path, pack: ContextPack, write_binary: bool = False) -> None:
         """Save context pack atomically with lock.
 
         Args:
             target_path: Path to segment root directory
             pack: ContextPack to save
+            write_binary: Also write context_pack.bin (mmap layout) next to the JSON
         """
         ctx_dir = target_path / "_ctx"
         pack_path = ctx_dir / "context_pack.json"
+        binary_path = ctx_dir / BINARY_PACK_FILENAME
         lock_path = ctx_dir / ".autopilot.lock"
+        pack_payload = pack.model_dump_json(indent=2)
         with file_lock(lock_path):
-            AtomicWriter.write(pack_path, pack.model_dump_json(indent=2))
+            AtomicWriter.write(pack_path, pack_payload)
+            # Search and get sidecars keyed to the digest of the payload just written
+            write_context_index(ctx_dir, pack, pack_payload)
+            write_context_renditions(ctx_dir, pack, pack_payload)
+            if write_binary:
+                write_binary_pack(ctx_dir, pack, pack_digest(pack_payload))
+            elif binary_path.exists():
+                # Never leave a binary pack describing a previous build behind
+                binary_path.unlink()
 
     def _skill_hub_paths(self, target_path: Path) -> tuple[Path, Path, Path]:
         ctx_dir = target_path / "_ctx"
@@ -488,8 +552,195 @@ class BuildContextPackUseCase:
                 return Err([f"[Promotion] Atomic publication failed: {exc}"])
         return Ok(None)
 
-    def execute(self, target_path: Path) -> "Ok[ContextPack] | Err[list[str]]":
-        """Scan a Trifecta segment and build a context_pack.json."""
+    @staticmethod
+    def _read_and_hash(file_path: Path) -> tuple[str, str]:
+        content = file_path.read_text()
+        if not content.endswith("\n"):
+            content += "\n"
+        return content, hashlib.sha256(content.encode()).hexdigest()
+
+    def _read_and_hash_all(self, paths: list[Path], jobs: int | None) -> list[tuple[str, str]]:
+        """Read and hash files on a bounded thread pool, preserving input order."""
+        workers = min(jobs or DEFAULT_BUILD_JOBS, len(paths))
+        if workers <= 1:
+            return [self._read_and_hash(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ctx-build") as pool:
+            return list(pool.map(self._read_and_hash, paths))
+
+    @staticmethod
+    def _python_symbols(
+        target_path: Path, paths: list[Path], contents: dict[Path, str]
+    ) -> dict[Path, list[SymbolInfo]]:
+        """Top-level symbols of many Python files via SkeletonMapBuilder.build_many.
+
+        Uses the AST cache from get_ast_cache(), so TRIFECTA_AST_PERSIST=1
+        carries unchanged skeletons across builds.
+        """
+        if not paths:
+            return {}
+        from src.infrastructure.factories import get_ast_cache
+
+        segment_id = str(target_path)
+        builder = SkeletonMapBuilder(
+            cache=get_ast_cache(segment_id=segment_id), segment_id=segment_id
+        )
+        results = builder.build_many(paths, contents)
+        return {path: result.symbols for path, result in zip(paths, results)}
+
+    def _record_build_phase(self, phase: str, started: float) -> float:
+        """Report a build phase duration to telemetry; returns the next phase start."""
+        now = time.perf_counter()
+        if self.telemetry:
+            self.telemetry.observe(f"ctx.build.{phase}", int((now - started) * 1000))
+        return now
+
+    @staticmethod
+    def _chunk_id(doc_type: str, title_path_norm: str, sha256: str) -> str:
+        """Stable ID: doc:sha1(doc + "\\n" + title_path_norm + "\\n" + text_sha256)[:10]."""
+        id_input = f"{doc_type}\n{title_path_norm}\n{sha256}"
+        content_hash = hashlib.sha1(id_input.encode(), usedforsecurity=False).hexdigest()[:10]
+        return f"{doc_type}:{content_hash}"
+
+    def _load_reusable_sources(
+        self, ctx_dir: Path
+    ) -> dict[str, _ReusableSource]:
+        """Index the previous context_pack.json by doc for incremental builds.
+
+        A doc is eligible when its source file has a recorded size and every
+        one of its chunks has an index entry and the same chunking_method. A
+        missing or unreadable pack yields an empty mapping, i.e. a full build.
+        """
+        pack_path = ctx_dir / "context_pack.json"
+        if not pack_path.exists():
+            return {}
+        try:
+            previous = ContextPack(**json.loads(pack_path.read_bytes()))
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Incremental build: ignoring previous pack {pack_path}: {e}")
+            return {}
+
+        sources_by_path: dict[str, SourceFile] = {}
+        for source_file in previous.source_files:
+            sources_by_path.setdefault(source_file.path, source_file)
+        entries_by_id = {entry.id: entry for entry in previous.index}
+
+        chunks_by_doc: dict[str, list[ContextChunk]] = {}
+        for chunk in previous.chunks:
+            chunks_by_doc.setdefault(chunk.doc, []).append(chunk)
+
+        reusable: dict[str, _ReusableSource] = {}
+        for doc, doc_chunks in chunks_by_doc.items():
+            source = sources_by_path.get(doc_chunks[0].source_path)
+            entries = [entries_by_id.get(chunk.id) for chunk in doc_chunks]
+            if (
+                source is None
+                or source.size is None
+                or any(entry is None for entry in entries)
+                or any(chunk.source_path != source.path for chunk in doc_chunks)
+                or len({chunk.chunking_method for chunk in doc_chunks}) != 1
+                or (doc_chunks[0].chunking_method == WHOLE_FILE_METHOD and len(doc_chunks) != 1)
+            ):
+                continue
+            reusable[doc] = (source, doc_chunks, [entry for entry in entries if entry is not None])
+        return reusable
+
+    def _file_chunks(
+        self,
+        doc_type: str,
+        file_path: Path,
+        source_rel_path: str,
+        content: str,
+        sha256: str,
+        method: str,
+        symbols: list[SymbolInfo] | None = None,
+    ) -> tuple[list[ContextChunk], list[ContextIndexEntry]]:
+        """Chunks (and L0 index entries) of one source file, in file order.
+
+        whole_file yields one chunk titled by the file name. Section methods
+        yield one chunk per heading/symbol section, titled by the file name
+        plus its headings; IDs hash each section's own text, so editing one
+        section leaves the IDs of the others unchanged.
+        """
+        parts: list[tuple[list[str], str, str, int | None, int | None, int | None]]
+        if method == WHOLE_FILE_METHOD:
+            parts = [([file_path.name], content, sha256, None, None, None)]
+        else:
+            parts = [
+                (
+                    [file_path.name, *section.title_path],
+                    section.text,
+                    hashlib.sha256(section.text.encode()).hexdigest(),
+                    section.parent,
+                    section.start_line,
+                    section.end_line,
+                )
+                for section in split_sections(file_path, content, method, symbols)
+            ]
+
+        chunks: list[ContextChunk] = []
+        index: list[ContextIndexEntry] = []
+
+        seen_ids: set[str] = set()
+        for title_path, text, sha256, parent, start_line, end_line in parts:
+            title_path_norm = " > ".join(title_path)
+            chunk_id = self._chunk_id(doc_type, title_path_norm, sha256)
+            occurrence = 1
+            while chunk_id in seen_ids:
+                # Same heading path and text twice in one file
+                occurrence += 1
+                chunk_id = self._chunk_id(doc_type, f"{title_path_norm}#{occurrence}", sha256)
+            seen_ids.add(chunk_id)
+
+            # Simple token estimation: 4 chars per token
+            token_est = len(text) // 4
+            chunks.append(
+                ContextChunk(
+                    id=chunk_id,
+                    doc=doc_type,
+                    title_path=title_path,
+                    text=text,
+                    char_count=len(text),
+                    token_est=token_est,
+                    source_path=source_rel_path,
+                    chunking_method=method,
+                    parent_id=chunks[parent].id if parent is not None else None,
+                    start_line=start_line,
+                    end_line=end_line,
+                )
+            )
+            # Index entry (L0)
+            preview = text[:200].strip() + "..." if len(text) > 200 else text
+            index.append(
+                ContextIndexEntry(
+                    id=chunk_id,
+                    title_path_norm=title_path_norm,
+                    preview=preview,
+                    token_est=token_est,
+                )
+            )
+        return chunks, index
+
+    def execute(
+        self,
+        target_path: Path,
+        write_binary: bool = False,
+        incremental: bool = False,
+        jobs: int | None = None,
+        chunking: ChunkingMode = "whole_file",
+    ) -> "Ok[ContextPack] | Err[list[str]]":
+        """Scan a Trifecta segment and build a context_pack.json.
+
+        Args:
+            target_path: Segment root directory
+            write_binary: Also write context_pack.bin for lazy chunk access
+                (GENERIC policy only; skill_hub packs stay JSON-only)
+            incremental: Reuse chunks from the previous pack for files whose
+                mtime and size are unchanged. The pack is identical to a full
+                build (apart from created_at).
+            jobs: Reader threads for the read/hash phase (None = auto, 1 = sequential)
+            chunking: "whole_file" (one chunk per file) or "sections" (markdown
+                by headings, Python by top-level symbols, other files whole)
+        """
         if self.telemetry:
             self.telemetry.incr("ctx_build_count")
         from src.infrastructure.segment_state import resolve_segment_state
@@ -551,9 +802,12 @@ class BuildContextPackUseCase:
             )
             if isinstance(promoted, Err):
                 return promoted
+            write_context_index(target_path / "_ctx", pack, pack_payload)
+            write_context_renditions(target_path / "_ctx", pack, pack_payload)
             return Ok(pack)
 
         # 1. GENERIC policy (default): derive segment_id from canonical tracked _ctx triplet.
+        build_start = time.perf_counter()
         try:
             state = resolve_segment_state(str(target_path), self.file_system)
             segment_id = state.segment_id
@@ -654,60 +908,24 @@ class BuildContextPackUseCase:
             sources[f"ref:{name}"] = path
 
         # 4.6 NEW: Scan repo content (docs/, src/, README) - WO-0009 fix
-        # This was missing - previously only _ctx metadata was indexed
-        exclude_dirs = {
-            ".git",
-            ".venv",
-            "node_modules",
-            "dist",
-            "build",
-            "_ctx",
-            "__pycache__",
-            ".pytest_cache",
-        }
-
-        # Scan for markdown and code files
-        # P0 FIX: Expand patterns to include custom high-value directories
-        for pattern in [
-            "docs/**/*.md",
-            "src/**/*.py",
-            "src/**/*.ts",
-            "src/**/*.js",
-            "README*.md",
-            "*.md",
-            # Custom high-value directories (WO-0009, examen_grado case)
-            "skills/**/*.md",  # Skills system
-            "apps/**/*.py",  # Application code
-            "apps/**/*.ts",  # TypeScript apps
-            "apps/**/*.js",  # JavaScript apps
-            "apps/**/*.vue",  # Vue components
-            "apps/**/*.md",  # App documentation
-            "config/**/*.yaml",  # Configuration files
-            "config/**/*.yml",  # YAML config
-            "config/**/*.json",  # JSON config
-            "config/**/*.toml",  # TOML config
-            "tests/**/*.py",  # Test files
-            "tests/**/*.ts",  # TypeScript tests
-            "tests/**/*.js",  # JavaScript tests
-            "main.py",  # Entry points
-            "app.py",  # Alternative entry point
-        ]:
-            for file_path in target_path.glob(pattern):
-                # Skip if in excluded dir
-                if any(excluded_dir in file_path.parts for excluded_dir in exclude_dirs):
-                    continue
-                # Skip if already indexed
-                if file_path.resolve() in excluded_paths:
-                    continue
-                # Skip if not a file
-                if not file_path.is_file():
+        # This was missing - previously only _ctx metadata was indexed.
+        # One pruned walk for all patterns; excluded dirs are never entered.
+        # The walk never follows directory symlinks, so only a symlinked file itself
+        # can resolve outside root_resolved / rel_path
+        root_resolved = target_path.resolve()
+        for file_path in walk_sources(target_path, REPO_SOURCE_PATTERNS):
+            rel_path = file_path.relative_to(target_path)
+            # Skip if already indexed
+            if excluded_paths:
+                candidate = root_resolved / rel_path
+                if file_path.is_symlink():
+                    candidate = file_path.resolve()
+                if candidate in excluded_paths:
                     continue
 
-                # Add to sources with repo prefix
-                rel_path = file_path.relative_to(target_path)
-                source_key = f"repo:{rel_path}"
-                sources[source_key] = file_path
-                excluded_paths.add(file_path.resolve())
+            # Add to sources with repo prefix
+            source_key = f"repo:{rel_path}"
+            sources[source_key] = file_path
 
         # 4.7 FAIL-CLOSED VALIDATION (was 4.6)
         # NOTE: _validate_prohibited_paths rejects /src/ code files
@@ -715,74 +933,117 @@ class BuildContextPackUseCase:
         # Commenting out for now - will fix validation separately if needed
         # self._validate_prohibited_paths(list(sources.values()))
 
-        chunks: list[ContextChunk] = []
-        index: list[ContextIndexEntry] = []
-        source_files: list[SourceFile] = []
+        phase_start = self._record_build_phase("discover", build_start)
+
+        # Incremental: previous chunks keyed by doc, reused when stat matches
+        reusable = self._load_reusable_sources(ctx_dir) if incremental else {}
 
-        # 3. Process each file as a whole_file chunk (MVP)
+        # 3a. Stat every source and decide what can be reused
+        planned: list[tuple[str, Path, os.stat_result, str, str, _ReusableSource | None]] = []
+        to_read: list[Path] = []
         for doc_type, file_path in sources.items():
-            if not file_path.exists():
+            # Stat before reading: a concurrent edit then shows up as a changed
+            # mtime on the next build instead of being masked.
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
                 continue
 
-            content = file_path.read_text()
-            if not content.endswith("\n"):
-                content += "\n"
-            # Simple token estimation: 4 chars per token
-            token_est = len(content) // 4
-
-            # Source metadata
-            import hashlib
-
-            sha256 = hashlib.sha256(content.encode()).hexdigest()
-            mtime = file_path.stat().st_mtime
-
             # Extract relative path from source_key (format: "repo:relative/path")
             source_rel_path = doc_type.split(":", 1)[1] if ":" in doc_type else str(file_path.relative_to(target_path))
+            title_path_norm = file_path.name
+            method = chunking_method_for(file_path, chunking)
+
+            previous = reusable.get(doc_type)
+            if previous is not None:
+                prev_source, prev_chunks, _ = previous
+                first = prev_chunks[0]
+                if not (
+                    prev_source.path == source_rel_path
+                    and prev_source.mtime == stat.st_mtime
+                    and prev_source.size == stat.st_size
+                    and first.chunking_method == method
+                    and first.title_path[:1] == [title_path_norm]
+                    and (
+                        method != WHOLE_FILE_METHOD
+                        or (
+                            first.title_path == [title_path_norm]
+                            and first.id
+                            == self._chunk_id(doc_type, title_path_norm, prev_source.sha256)
+                        )
+                    )
+                ):
+                    previous = None
+            if previous is None:
+                to_read.append(file_path)
+            planned.append((doc_type, file_path, stat, source_rel_path, method, previous))
+        phase_start = self._record_build_phase("stat", phase_start)
+
+        # 3b. Read and hash changed files concurrently (I/O bound; hashlib releases the GIL)
+        read_results = self._read_and_hash_all(to_read, jobs)
+        phase_start = self._record_build_phase("read_hash", phase_start)
+
+        # Python files split by symbol get their skeletons from one batched cache pass
+        contents = {path: content for path, (content, _) in zip(to_read, read_results)}
+        symbols_by_path = self._python_symbols(
+            target_path,
+            [
+                file_path
+                for _, file_path, _, _, method, previous in planned
+                if previous is None and method == SYMBOL_METHOD
+            ],
+            contents,
+        )
+        read_iter = iter(read_results)
+
+        chunks: list[ContextChunk] = []
+        index: list[ContextIndexEntry] = []
+        source_files: list[SourceFile] = []
 
+        # 3c. Chunk each file (whole_file, or by sections), in source order
+        reused_chunks = 0
+        for doc_type, file_path, stat, source_rel_path, method, previous in planned:
+            if previous is not None:
+                prev_source, prev_chunks, prev_entries = previous
+                source_files.append(prev_source)
+                chunks.extend(prev_chunks)
+                index.extend(prev_entries)
+                reused_chunks += len(prev_chunks)
+                continue
+
+            content, sha256 = next(read_iter)
             source_files.append(
                 SourceFile(
                     path=source_rel_path,
                     sha256=sha256,
-                    mtime=mtime,
+                    mtime=stat.st_mtime,
                     chars=len(content),
+                    size=stat.st_size,
                 )
             )
-
-            # Stable ID: doc:sha1(doc + "\n" + title_path_norm + "\n" + text_sha256)[:10]
-            title_path_norm = file_path.name
-            id_input = f"{doc_type}\n{title_path_norm}\n{sha256}"
-            content_hash = hashlib.sha1(id_input.encode(), usedforsecurity=False).hexdigest()[:10]
-            chunk_id = f"{doc_type}:{content_hash}"
-
-            chunk = ContextChunk(
-                id=chunk_id,
-                doc=doc_type,
-                title_path=[file_path.name],
-                text=content,
-                char_count=len(content),
-                token_est=token_est,
-                source_path=source_rel_path,
-                chunking_method="whole_file",
-            )
-            chunks.append(chunk)
-
-            # Index entry (L0)
-            preview = content[:200].strip() + "..." if len(content) > 200 else content
-            index.append(
-                ContextIndexEntry(
-                    id=chunk_id,
-                    title_path_norm=title_path_norm,
-                    preview=preview,
-                    token_est=token_est,
-                )
+            file_chunks, file_index = self._file_chunks(
+                doc_type,
+                file_path,
+                source_rel_path,
+                content,
+                sha256,
+                method,
+                symbols_by_path.get(file_path),
             )
+            chunks.extend(file_chunks)
+            index.extend(file_index)
 
         pack = ContextPack(
             segment=segment_id, source_files=source_files, chunks=chunks, index=index
         )
+        if self.telemetry and incremental:
+            self.telemetry.incr("ctx_build_reused_chunks", reused_chunks)
+            self.telemetry.incr("ctx_build_rehashed_chunks", len(chunks) - reused_chunks)
+        phase_start = self._record_build_phase("assemble", phase_start)
 
         # 4. Save to disk atomically with lock
-        self._save_pack(target_path, pack)
+        self._save_pack(target_path, pack, write_binary=write_binary)
+        self._record_build_phase("write", phase_start)
 
         return Ok(pack)
 
@@ -817,12 +1078,13 @@ class MacroLoadUseCase:
         expander = QueryExpander(aliases)
         expanded_terms = expander.expand(norm_task, tokens)
 
-        # Execute search for each expanded piece
+        # Execute search for each expanded piece against a single pack load
         service = ContextService(target_path)
+        session = service.open_session()
         combined_hits: dict[str, tuple[Any, float]] = {}  # chunk_id -> (hit, max_weighted_score)
 
-        for term, weight in expanded_terms:
-            search_res = service.search(term, k=10)
+        term_results = service.search_terms([term for term, _ in expanded_terms], k=10)
+        for (_, weight), search_res in zip(expanded_terms, term_results):
             for hit in search_res.hits:
                 weighted_score = hit.score * weight
                 if hit.id not in combined_hits or weighted_score > combined_hits[hit.id][1]:
@@ -841,7 +1103,7 @@ class MacroLoadUseCase:
         # 2. Get L0 Skeletons (Initial navigation)
         l0_ids = []
         for cid in ["skill", "agent"]:
-            match = [c.id for c in service._load_pack().chunks if c.id.startswith(f"{cid}:")]
+            match = [chunk_id for chunk_id in session.chunk_ids() if chunk_id.startswith(f"{cid}:")]
             if match:
                 l0_ids.append(match[0])
 
@@ -1005,6 +1267,10 @@ class ValidateContextPackUseCase:
             if not chunks_data:
                 errors.append("Context pack contains no chunks")
 
+            # 6. Binary pack (optional) must mirror the JSON pack exactly
+            if (ctx_dir / BINARY_PACK_FILENAME).exists():
+                errors.extend(verify_binary_pack(ctx_dir, data))
+
         except Exception as e:
             errors.append(f"Failed to parse context pack: {str(e)}")
 
@@ -1190,30 +1456,10 @@ class StatsUseCase:
         if self.telemetry:
             self.telemetry.incr("ctx_stats_count")
 
-        events_path = target_path / "_ctx" / "telemetry" / "events.jsonl"
-
-        # Load events
-        events = []
-        if events_path.exists():
-            with open(events_path) as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            events.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            pass
-
-        # Filter by window
-        if window > 0:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=window)
-            events = [
-                e
-                for e in events
-                if datetime.fromisoformat(e["ts"].replace("Z", "+00:00")) >= cutoff
-            ]
-
-        # Filter searches only
-        searches = [e for e in events if e["cmd"] == "ctx.search"]
+        # Load searches in the window from the indexed store
+        cutoff = datetime.now(timezone.utc) - timedelta(days=window) if window > 0 else None
+        with TelemetryStore.for_segment(target_path) as store:
+            searches = store.events(since=cutoff, cmd="ctx.search")
         total_searches = len(searches)
         hits = sum(1 for e in searches if e.get("result", {}).get("hits", 0) > 0)
         zero_hits = total_searches - hits
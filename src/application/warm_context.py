@@ -0,0 +1,136 @@
+"""Process-resident caches for ctx search/get/plan (used by the daemon).
+
+A one-shot CLI call re-reads the pack, alias YAML and anchors config on every
+invocation. A long-lived process keeps them here instead, keyed by the
+``(mtime_ns, size)`` stamp of the files they were loaded from: any rewrite of
+those files (``ctx build``, alias generation, config edits) reloads them on
+the next request.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from src.application.context_index import CONTEXT_INDEX_FILENAME
+from src.application.context_renditions import CONTEXT_RENDITIONS_FILENAME
+from src.application.context_service import SKILL_HUB_PROMOTION_RECEIPT, ContextService
+from src.domain.alias_index import AliasIndex
+from src.infrastructure.binary_pack import BINARY_PACK_FILENAME
+
+T = TypeVar("T")
+
+# Every file whose change can alter what ContextService loads for a segment
+_PACK_STAMP_FILES = (
+    "context_pack.json",
+    BINARY_PACK_FILENAME,
+    CONTEXT_INDEX_FILENAME,
+    CONTEXT_RENDITIONS_FILENAME,
+    "trifecta_config.json",
+    "skills_manifest.json",
+    SKILL_HUB_PROMOTION_RECEIPT,
+)
+
+FileStamp = tuple[tuple[int, int] | None, ...]
+
+
+def file_stamp(paths: list[Path]) -> FileStamp:
+    """(mtime_ns, size) per path, None for missing files."""
+    stamp: list[tuple[int, int] | None] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+class WarmContextCache:
+    """Pinned pack sessions, merged aliases and linter config per segment."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Path], tuple[FileStamp, Any]] = {}
+
+    def cached(self, kind: str, key: Path, paths: list[Path], loader: Callable[[], T]) -> T:
+        """Return ``loader()``'s value, reloading only when ``paths`` changed on disk."""
+        stamp = file_stamp(paths)
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None and entry[0] == stamp:
+                return entry[1]  # type: ignore[no-any-return]
+        value = loader()
+        with self._lock:
+            self._entries[(kind, key)] = (stamp, value)
+        return value
+
+    def service(self, segment_path: Path) -> ContextService:
+        """ContextService with a session pinned to the current pack."""
+        ctx_dir = segment_path / "_ctx"
+
+        def load() -> ContextService:
+            service = ContextService(segment_path)
+            service.open_session()
+            return service
+
+        paths = [ctx_dir / name for name in _PACK_STAMP_FILES]
+        return self.cached("pack", segment_path, paths, load)
+
+    def aliases(self, segment_path: Path) -> dict[str, list[str]]:
+        """Merged manual + generated aliases (AliasMerger output)."""
+        from src.infrastructure.aliases_fs import (
+            GENERATED_ALIASES_FILENAME,
+            MANUAL_ALIASES_FILENAME,
+            AliasMerger,
+        )
+
+        ctx_dir = segment_path / "_ctx"
+        return self.cached(
+            "aliases",
+            segment_path,
+            [ctx_dir / MANUAL_ALIASES_FILENAME, ctx_dir / GENERATED_ALIASES_FILENAME],
+            lambda: AliasMerger(segment_path=segment_path).merge(),
+        )
+
+    def alias_index(self, segment_path: Path) -> AliasIndex:
+        """Merged aliases compiled into forward/reverse maps (AliasMerger.index output)."""
+        from src.infrastructure.aliases_fs import (
+            GENERATED_ALIASES_FILENAME,
+            MANUAL_ALIASES_FILENAME,
+            AliasMerger,
+        )
+
+        ctx_dir = segment_path / "_ctx"
+        return self.cached(
+            "alias_index",
+            segment_path,
+            [ctx_dir / MANUAL_ALIASES_FILENAME, ctx_dir / GENERATED_ALIASES_FILENAME],
+            lambda: AliasMerger(segment_path=segment_path).index(),
+        )
+
+    def anchors(self, repo_root: Path) -> dict[str, Any]:
+        from src.infrastructure.config_loader import ConfigLoader
+
+        return self.cached(
+            "anchors",
+            repo_root,
+            [repo_root / "configs" / "anchors.yaml"],
+            lambda: ConfigLoader.load_anchors(repo_root),
+        )
+
+    def linter_aliases(self, repo_root: Path) -> dict[str, Any]:
+        from src.infrastructure.config_loader import ConfigLoader
+
+        return self.cached(
+            "linter_aliases",
+            repo_root,
+            [repo_root / "configs" / "aliases.yaml"],
+            lambda: ConfigLoader.load_linter_aliases(repo_root),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
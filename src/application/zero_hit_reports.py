@@ -4,12 +4,13 @@ B0 Instrumentation: Report zero-hit rates segmented by source (test/fixture/inte
 and build SHA to enable precise measurement of zero-hit reduction interventions.
 """
 
-import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 from collections import defaultdict
 
+from src.infrastructure.telemetry_store import TelemetryStore
+
 
 def generate_zero_hit_report(
     segment_path: Path, days: int = 30, output_path: Optional[Path] = None
@@ -29,40 +30,11 @@ def generate_zero_hit_report(
     if not events_path.exists():
         return "# Zero-Hit Report\n\nNo telemetry data found."
 
-    # Parse events
-    events = []
-    with open(events_path) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
-    # Filter to ctx.search events within time window
-    from datetime import timezone
-
+    # ctx.search events within the time window, read from the indexed store
+    # (events without a valid timestamp fall outside every window)
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-    def parse_ts(ts_str):
-        """Parse timestamp string, handling both offset-aware and naive."""
-        if not ts_str:
-            return datetime(2000, 1, 1, tzinfo=timezone.utc)
-        # Handle Z suffix (UTC)
-        if ts_str.endswith("Z"):
-            ts_str = ts_str[:-1] + "+00:00"
-        try:
-            dt = datetime.fromisoformat(ts_str)
-            # If naive, assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except ValueError:
-            return datetime(2000, 1, 1, tzinfo=timezone.utc)
-
-    search_events = [
-        e for e in events if e.get("cmd") == "ctx.search" and parse_ts(e.get("ts")) > cutoff
-    ]
+    with TelemetryStore.for_segment(segment_path) as store:
+        search_events = store.events(since=cutoff, cmd="ctx.search", strict=True)
 
     # Aggregate by source
     by_source = defaultdict(lambda: {"total": 0, "zero_hits": 0, "reasons": defaultdict(int)})
@@ -164,46 +136,18 @@ def get_zero_hit_metrics(segment_path: Path, days: int = 30) -> dict[str, Any]:
     if not events_path.exists():
         return {"error": "No telemetry data"}
 
-    events = []
-    with open(events_path) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
+    # Whole days come from the store's daily counters; only the boundary day is scanned
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    with TelemetryStore.for_segment(segment_path) as store:
+        counts = store.search_counts(since=cutoff)
 
-    def parse_ts(ts_str):
-        if not ts_str:
-            return datetime(2000, 1, 1, tzinfo=timezone.utc)
-        if ts_str.endswith("Z"):
-            ts_str = ts_str[:-1] + "+00:00"
-        try:
-            dt = datetime.fromisoformat(ts_str)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except ValueError:
-            return datetime(2000, 1, 1, tzinfo=timezone.utc)
-
-    search_events = [
-        e for e in events if e.get("cmd") == "ctx.search" and parse_ts(e.get("ts")) > cutoff
-    ]
-
-    by_source = defaultdict(lambda: {"total": 0, "zero_hits": 0})
-
-    for event in search_events:
-        x = event.get("x", {})
-        source = x.get("source", "unknown")
-        hits = event.get("result", {}).get("hits", 0)
-
-        by_source[source]["total"] += 1
-        if hits == 0:
-            by_source[source]["zero_hits"] += 1
+    # A search without result.hits counts as a zero hit
+    by_source = {
+        row["source"]: {"total": row["events"], "zero_hits": row["zero_hits"] + row["missing_hits"]}
+        for row in counts
+    }
 
-    total = len(search_events)
+    total = sum(s["total"] for s in by_source.values())
     total_zero = sum(s["zero_hits"] for s in by_source.values())
     overall_ratio = (total_zero / total * 100) if total > 0 else 0
 
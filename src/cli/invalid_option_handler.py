@@ -352,6 +352,8 @@ def _emit_invalid_option_telemetry(
         platform=_get_platform(),
         is_tty=_is_tty(),
     )
+    # The shared instance is never flush()ed: write the one-off event now
+    telemetry.flush_events()
 
 
 def emit_help_used_telemetry(command_path: str, argv: list[str]) -> None:
@@ -375,6 +377,7 @@ def emit_help_used_telemetry(command_path: str, argv: list[str]) -> None:
         platform=_get_platform(),
         is_tty=_is_tty(),
     )
+    telemetry.flush_events()
 
 
 def get_telemetry_kpis() -> dict[str, Any]:
@@ -0,0 +1,70 @@
+"""Compiled alias index: forward and reverse hash maps over an alias dict.
+
+QueryExpander looks up every query token both as an alias key (forward: key
+-> synonyms) and as a synonym (reverse: synonym -> keys that list it).
+Compiling both maps once turns the reverse lookup from a scan of every alias
+into a single dict access.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+ALIAS_INDEX_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class AliasIndex:
+    """Alias keys to synonyms and back, preserving alias order.
+
+    ``reverse[synonym]`` lists keys in the order they appear in ``forward``,
+    so expansion results match a linear scan of the alias dict.
+    """
+
+    forward: dict[str, list[str]] = field(default_factory=dict)
+    reverse: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_aliases(cls, aliases: dict[str, list[str]]) -> "AliasIndex":
+        reverse: dict[str, list[str]] = {}
+        for key, synonyms in aliases.items():
+            for synonym in synonyms:
+                keys = reverse.setdefault(synonym, [])
+                if not keys or keys[-1] != key:
+                    keys.append(key)
+        return cls(forward=aliases, reverse=reverse)
+
+    def __bool__(self) -> bool:
+        return bool(self.forward)
+
+    @cached_property
+    def key_order(self) -> dict[str, int]:
+        """Position of each alias key in ``forward``."""
+        return {key: position for position, key in enumerate(self.forward)}
+
+    def synonyms(self, term: str) -> list[str]:
+        """Synonyms listed under alias key ``term``."""
+        return self.forward.get(term, [])
+
+    def keys_for(self, term: str) -> list[str]:
+        """Alias keys listing ``term`` as a synonym, in alias order."""
+        return self.reverse.get(term, [])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": ALIAS_INDEX_SCHEMA_VERSION,
+            "forward": self.forward,
+            "reverse": self.reverse,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AliasIndex":
+        """Inverse of ``to_dict``; raises ValueError on a schema mismatch."""
+        if data.get("schema_version") != ALIAS_INDEX_SCHEMA_VERSION:
+            raise ValueError(f"unsupported alias index schema: {data.get('schema_version')!r}")
+        forward, reverse = data.get("forward"), data.get("reverse")
+        if not isinstance(forward, dict) or not isinstance(reverse, dict):
+            raise ValueError("alias index requires 'forward' and 'reverse' maps")
+        return cls(forward=forward, reverse=reverse)
@@ -13,11 +13,19 @@ Principios de diseño:
 - Versionable: Claves de cache incluyen versión del formato
 """
 
-from typing import Protocol, Optional, Any
+from typing import TYPE_CHECKING, Protocol, Optional, Any, Iterator
 from pathlib import Path
 from enum import Enum
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
+import atexit
+import threading
 import time
+import weakref
+
+if TYPE_CHECKING:
+    import sqlite3
 
 
 class CacheStatus(Enum):
@@ -36,6 +44,7 @@ class CacheEntry:
     value: Any
     created_at: float
     last_access: float
+    size_bytes: int = 0
 
 
 @dataclass
@@ -62,6 +71,14 @@ class AstCache(Protocol):
         """Guardar valor en el cache."""
         ...
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Obtener varios valores; las claves ausentes no aparecen."""
+        ...
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Guardar varios valores de una vez."""
+        ...
+
     def delete(self, key: str) -> bool:
         """Eliminar valor del cache. Retorna True si existía."""
         ...
@@ -75,8 +92,28 @@ class AstCache(Protocol):
         ...
 
 
+def _to_serializable(value: Any) -> Any:
+    """Convertir dataclasses (o listas de ellas) a estructuras JSON-serializables."""
+    from dataclasses import asdict
+
+    if isinstance(value, list) and value and hasattr(value[0], "to_dict"):
+        return [v.to_dict() for v in value]
+    if isinstance(value, list) and value and hasattr(value[0], "__dataclass_fields__"):
+        return [asdict(v) for v in value]
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "__dataclass_fields__"):
+        return asdict(value)
+    return value
+
+
 class InMemoryLRUCache:
-    """Cache en memoria con evicción LRU."""
+    """Cache en memoria con evicción LRU.
+
+    OrderedDict como lista LRU (get/set/delete/evicción en O(1)); el tamaño
+    en bytes de cada entrada se calcula una sola vez al insertarla. Seguro
+    entre hilos.
+    """
 
     def __init__(self, max_entries: int = 10000, max_bytes: int = 100 * 1024 * 1024):
         """
@@ -88,122 +125,223 @@ class InMemoryLRUCache:
         """
         self.max_entries = max_entries
         self.max_bytes = max_bytes
-        self._cache: dict[str, CacheEntry] = {}
-        self._access_order: list[str] = []  # Para LRU
-        self._lock = None
+        # Orden de inserción = orden LRU (primero = menos usado)
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
         self._current_bytes = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Obtener valor del cache."""
-        if key not in self._cache:
-            self._misses += 1
-            return None
-
-        # Move to end (most recently used)
-        entry = self._cache[key]
-        entry.last_access = time.time()
-        self._access_order.remove(key)
-        self._access_order.append(key)
-        self._hits += 1
-        return entry.value
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            # Move to end (most recently used)
+            entry.last_access = time.time()
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Obtener varios valores con una sola toma del lock."""
+        found: dict[str, Any] = {}
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    self._misses += 1
+                    continue
+                entry.last_access = now
+                self._cache.move_to_end(key)
+                self._hits += 1
+                found[key] = entry.value
+        return found
 
     def set(self, key: str, value: Any) -> None:
         """Guardar valor en el cache."""
         import json
-        from dataclasses import asdict
 
-        # Serialize value (handle lists of dataclass objects)
-        value_serialized: Any
-        if isinstance(value, list) and value and hasattr(value[0], "to_dict"):
-            value_serialized = [v.to_dict() for v in value]
-        elif isinstance(value, list) and value and hasattr(value[0], "__dataclass_fields__"):
-            value_serialized = [asdict(v) for v in value]
-        elif hasattr(value, "to_dict"):
-            value_serialized = value.to_dict()
-        elif hasattr(value, "__dataclass_fields__"):
-            value_serialized = asdict(value)
-        else:
-            value_serialized = value
-
-        # Calculate size
-        value_bytes = len(json.dumps(value_serialized).encode())
-
-        # Evict if necessary
-        while (
-            len(self._cache) >= self.max_entries
-            or self._current_bytes + value_bytes > self.max_bytes
-        ):
-            self._evict_oldest()
-
-        # Add or update entry
-        entry = CacheEntry(
-            key=key,
-            value=value,
-            created_at=time.time(),
-            last_access=time.time(),
-        )
-        self._cache[key] = entry
-        self._current_bytes += value_bytes
+        # Calculate size (outside the lock: serialization is the costly part)
+        value_bytes = len(json.dumps(_to_serializable(value)).encode())
+        now = time.time()
+
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.size_bytes
+            if value_bytes > self.max_bytes:
+                # Could never fit: do not flush the whole cache for it
+                return
+
+            # Evict if necessary
+            while self._cache and (
+                len(self._cache) >= self.max_entries
+                or self._current_bytes + value_bytes > self.max_bytes
+            ):
+                self._evict_oldest()
+
+            self._cache[key] = CacheEntry(
+                key=key,
+                value=value,
+                created_at=now,
+                last_access=now,
+                size_bytes=value_bytes,
+            )
+            self._current_bytes += value_bytes
 
-        # Update access order
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Guardar varios valores."""
+        for key, value in items.items():
+            self.set(key, value)
 
     def delete(self, key: str) -> bool:
         """Eliminar valor del cache."""
-        if key not in self._cache:
-            return False
-
-        entry = self._cache.pop(key)
-        self._access_order.remove(key)
-
-        import json
-
-        self._current_bytes -= len(json.dumps(entry.value).encode())
-        return True
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return False
+            self._current_bytes -= entry.size_bytes
+            return True
 
     def clear(self) -> None:
         """Limpiar todo el cache."""
-        self._cache.clear()
-        self._access_order.clear()
-        self._hits = 0
-        self._misses = 0
-        self._current_bytes = 0
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._current_bytes = 0
 
     def stats(self) -> CacheStats:
         """Obtener estadísticas del cache."""
-        total = self._hits + self._misses
-        raw_rate = (self._hits / total) if total > 0 else 0.0
-        hit_rate = max(0.0, min(1.0, raw_rate))
-        return CacheStats(
-            entries=len(self._cache),
-            hits=self._hits,
-            misses=self._misses,
-            hit_rate=hit_rate,
-            max_entries=self.max_entries,
-            max_bytes=self.max_bytes,
-            current_bytes=self._current_bytes,
-        )
+        with self._lock:
+            total = self._hits + self._misses
+            raw_rate = (self._hits / total) if total > 0 else 0.0
+            hit_rate = max(0.0, min(1.0, raw_rate))
+            return CacheStats(
+                entries=len(self._cache),
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=hit_rate,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                current_bytes=self._current_bytes,
+            )
 
     def _evict_oldest(self) -> None:
-        """Evictar la entrada más antigua (LRU)."""
-        if not self._access_order:
+        """Evictar la entrada más antigua (LRU). Llamar con el lock tomado."""
+        if not self._cache:
             return
 
-        key = self._access_order.pop(0)
-        entry = self._cache.pop(key, None)
+        _, entry = self._cache.popitem(last=False)
+        self._current_bytes -= entry.size_bytes
+
+
+# Accesos (last_access) pendientes antes de escribirlos en bloque
+ACCESS_FLUSH_BATCH = 256
+ACCESS_FLUSH_INTERVAL_S = 5.0
+# Límite de parámetros por sentencia en get_many
+_SQLITE_MAX_PARAMS = 500
+
+# Run in one transaction at init; cache_counters is seeded once (_SEED_COUNTERS)
+# and then kept by triggers
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        last_access REAL NOT NULL,
+        value_bytes INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_last_access ON cache(last_access)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cache_counters (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL,
+        accessed INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cache_counters_insert AFTER INSERT ON cache BEGIN
+        UPDATE cache_counters SET
+            entries = entries + 1,
+            bytes = bytes + new.value_bytes,
+            accessed = accessed + (new.last_access > new.created_at)
+        WHERE id = 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cache_counters_delete AFTER DELETE ON cache BEGIN
+        UPDATE cache_counters SET
+            entries = entries - 1,
+            bytes = bytes - old.value_bytes,
+            accessed = accessed - (old.last_access > old.created_at)
+        WHERE id = 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cache_counters_update AFTER UPDATE ON cache BEGIN
+        UPDATE cache_counters SET
+            bytes = bytes + new.value_bytes - old.value_bytes,
+            accessed = accessed + (new.last_access > new.created_at)
+                                - (old.last_access > old.created_at)
+        WHERE id = 0;
+    END
+    """,
+)
+
+# Recorre la tabla: solo cuando aún no hay fila de contadores (DB nueva o
+# creada antes de los contadores)
+_SEED_COUNTERS = """
+INSERT INTO cache_counters (id, entries, bytes, accessed)
+    SELECT 0, COUNT(*), COALESCE(SUM(value_bytes), 0),
+           COALESCE(SUM(last_access > created_at), 0)
+    FROM cache
+"""
+
+_UPSERT = """
+INSERT INTO cache (key, value, created_at, last_access, value_bytes)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    value = excluded.value,
+    created_at = excluded.created_at,
+    last_access = excluded.last_access,
+    value_bytes = excluded.value_bytes
+"""
 
-        if entry:
-            import json
 
-            self._current_bytes -= len(json.dumps(entry.value).encode())
+_open_sqlite_caches: "weakref.WeakSet[SQLiteCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_sqlite_caches() -> None:
+    """Los accesos aún en memoria no se pierden al salir del proceso."""
+    for cache in list(_open_sqlite_caches):
+        try:
+            cache.flush()
+        except Exception:
+            pass
 
 
 class SQLiteCache:
-    """Cache persistente en SQLite."""
+    """Cache persistente en SQLite.
+
+    Una conexión por instancia (y proceso) en modo WAL. Los ``get`` no
+    escriben: el last_access se acumula en memoria y se vuelca en bloque
+    (cada ACCESS_FLUSH_BATCH accesos, ACCESS_FLUSH_INTERVAL_S segundos, o
+    antes de stats/evicción/close). Entradas, bytes y accesos se mantienen
+    en ``cache_counters`` mediante triggers, así ni stats() ni la evicción
+    recorren la tabla.
+    """
 
     def __init__(self, db_path: Path, max_entries: int = 10000, max_bytes: int = 100 * 1024 * 1024):
         """
@@ -217,178 +355,231 @@ class SQLiteCache:
         self.db_path = db_path
         self.max_entries = max_entries
         self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._conn_pid = 0
+        self._pending_access: dict[str, float] = {}
+        self._last_flush = time.monotonic()
         self._init_db()
+        _open_sqlite_caches.add(self)
+
+    def _connection(self) -> "sqlite3.Connection":
+        """Conexión de larga vida; se reabre tras un fork."""
+        import os
+        import sqlite3
+
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        # Autocommit: las escrituras abren BEGIN IMMEDIATE explícito
+        conn = sqlite3.connect(
+            self.db_path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError:
+            pass  # Otro proceso tiene la DB bloqueada; WAL queda para la próxima apertura
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        self._pending_access = {}
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator["sqlite3.Connection"]:
+        """Transacción de escritura (BEGIN IMMEDIATE: sin upgrade de lock a mitad)."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _init_db(self) -> None:
-        """Inicializar base de datos."""
+        """Inicializar base de datos (idempotente; siembra contadores en DBs antiguas)."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        import sqlite3
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    created_at REAL NOT NULL,
-                    last_access REAL NOT NULL,
-                    value_bytes INTEGER NOT NULL
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_last_access ON cache(last_access)
-            """)
-            conn.commit()
+        with self._write() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            if conn.execute("SELECT 1 FROM cache_counters WHERE id = 0").fetchone() is None:
+                conn.execute(_SEED_COUNTERS)
+
+    def close(self) -> None:
+        """Volcar accesos pendientes y cerrar la conexión."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def flush(self) -> None:
+        """Escribir en bloque los last_access acumulados por get()."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending_access:
+                return
+            pending = [(ts, key) for key, ts in self._pending_access.items()]
+            self._pending_access = {}
+            with self._write() as conn:
+                conn.executemany("UPDATE cache SET last_access = ? WHERE key = ?", pending)
+
+    def _record_access(self, keys: list[str]) -> None:
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                self._pending_access[key] = now
+            if (
+                len(self._pending_access) >= ACCESS_FLUSH_BATCH
+                or time.monotonic() - self._last_flush >= ACCESS_FLUSH_INTERVAL_S
+            ):
+                self.flush()
 
     def get(self, key: str) -> Optional[Any]:
         """Obtener valor del cache."""
-        import sqlite3
         import json
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT value, value_bytes FROM cache WHERE key = ?
-            """,
-                (key,),
-            )
-            row = cursor.fetchone()
-
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
             if row is None:
                 return None
+            self._record_access([key])
+            return json.loads(row[0])
 
-            value_json, value_bytes = row
-
-            # Update last_access
-            conn.execute(
-                """
-                UPDATE cache SET last_access = ? WHERE key = ?
-            """,
-                (time.time(), key),
-            )
-            conn.commit()
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Obtener varios valores; las claves ausentes no aparecen en el resultado."""
+        import json
 
-            return json.loads(value_json)
+        found: dict[str, Any] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(unique), _SQLITE_MAX_PARAMS):
+                chunk = unique[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, value_json in rows:
+                    found[key] = json.loads(value_json)
+            if found:
+                self._record_access(list(found))
+        return found
 
     def set(self, key: str, value: Any) -> None:
         """Guardar valor en el cache."""
-        import sqlite3
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Guardar varios valores en una sola transacción."""
         import json
-        from dataclasses import asdict
+
+        if not items:
+            return
 
         # Serialize value (handle lists of dataclass objects)
-        value_serialized: Any
-        if isinstance(value, list) and value and hasattr(value[0], "to_dict"):
-            value_serialized = [v.to_dict() for v in value]
-        elif isinstance(value, list) and value and hasattr(value[0], "__dataclass_fields__"):
-            value_serialized = [asdict(v) for v in value]
-        elif hasattr(value, "to_dict"):
-            value_serialized = value.to_dict()
-        elif hasattr(value, "__dataclass_fields__"):
-            value_serialized = asdict(value)
-        else:
-            value_serialized = value
-
-        value_json = json.dumps(value_serialized)
-        value_bytes = len(value_json.encode())
-
-        # Evict if necessary
-        self._evict_if_needed(value_bytes)
-
-        # Add or update entry
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO cache (key, value, created_at, last_access, value_bytes)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (key, value_json, time.time(), time.time(), value_bytes),
-            )
-            conn.commit()
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            value_json = json.dumps(_to_serializable(value))
+            rows.append((key, value_json, now, now, len(value_json.encode())))
+
+        # Evict (by last_access) only after pending accesses are on disk
+        self.flush()
+        with self._write() as conn:
+            # Sobrescribir una clave no añade entrada, solo cambia sus bytes
+            replaced = self._stored_sizes(conn, list(items))
+            new_entries = len(rows) - len(replaced)
+            new_bytes = sum(row[4] for row in rows) - sum(replaced.values())
+            self._evict_if_needed(conn, new_entries, new_bytes)
+            conn.executemany(_UPSERT, rows)
+            for key in items:
+                self._pending_access.pop(key, None)
 
     def delete(self, key: str) -> bool:
         """Eliminar valor del cache."""
-        import sqlite3
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                DELETE FROM cache WHERE key = ?
-            """,
-                (key,),
-            )
-            conn.commit()
+        with self._write() as conn:
+            self._pending_access.pop(key, None)
+            cursor = conn.execute("DELETE FROM cache WHERE key = ?", (key,))
             return cursor.rowcount > 0
 
     def clear(self) -> None:
         """Limpiar todo el cache."""
-        import sqlite3
-
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
+            self._pending_access = {}
             conn.execute("DELETE FROM cache")
-            conn.commit()
 
     def stats(self) -> CacheStats:
         """Obtener estadísticas del cache."""
-        import sqlite3
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT
-                    COUNT(*) as entries,
-                    SUM(CASE WHEN last_access > created_at THEN 1 ELSE 0 END) as hits,
-                    SUM(CASE WHEN last_access = created_at THEN 1 ELSE 0 END) as misses,
-                    SUM(value_bytes) as current_bytes
-                FROM cache
-            """)
-            row = cursor.fetchone()
-
-            entries, hits, misses, current_bytes = row or (0, 0, 0, 0)
-            # Handle None values from SUM when table is empty
-            hits = hits or 0
-            misses = misses or 0
-            total = hits + misses
-            raw_rate = (hits / total) if total > 0 else 0.0
-            hit_rate = max(0.0, min(1.0, raw_rate))
-
-            return CacheStats(
-                entries=entries,
-                hits=hits,
-                misses=misses,
-                hit_rate=hit_rate,
-                max_entries=self.max_entries,
-                max_bytes=self.max_bytes,
-                current_bytes=current_bytes,
-            )
+        self.flush()
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT entries, bytes, accessed FROM cache_counters WHERE id = 0"
+            ).fetchone()
+
+        entries, current_bytes, hits = row or (0, 0, 0)
+        # Hits: entradas leídas tras crearse; misses: nunca leídas
+        misses = entries - hits
+        total = hits + misses
+        raw_rate = (hits / total) if total > 0 else 0.0
+        hit_rate = max(0.0, min(1.0, raw_rate))
 
-    def _evict_if_needed(self, new_bytes: int) -> None:
-        """Evictar entradas si es necesario."""
-        import sqlite3
+        return CacheStats(
+            entries=entries,
+            hits=hits,
+            misses=misses,
+            hit_rate=hit_rate,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            current_bytes=current_bytes,
+        )
 
-        with sqlite3.connect(self.db_path) as conn:
-            # Check current size
+    @staticmethod
+    def _stored_sizes(conn: "sqlite3.Connection", keys: list[str]) -> dict[str, int]:
+        """value_bytes de las claves que ya están en el cache."""
+        sizes: dict[str, int] = {}
+        for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+            chunk = keys[start : start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value_bytes FROM cache WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            sizes.update(rows)
+        return sizes
+
+    def _evict_if_needed(
+        self, conn: "sqlite3.Connection", new_entries: int, new_bytes: int
+    ) -> None:
+        """Evictar entradas si es necesario (dentro de la transacción de escritura)."""
+        entries, current_bytes = conn.execute(
+            "SELECT entries, bytes FROM cache_counters WHERE id = 0"
+        ).fetchone()
+
+        # Evict until we have space
+        while entries > 0 and (
+            entries + new_entries > self.max_entries
+            or current_bytes + new_bytes > self.max_bytes
+        ):
+            # Delete oldest entries
             cursor = conn.execute("""
-                SELECT COUNT(*), SUM(value_bytes) FROM cache
+                DELETE FROM cache
+                WHERE key IN (
+                    SELECT key FROM cache ORDER BY last_access ASC LIMIT 100
+                )
             """)
-            row = cursor.fetchone()
-            entries, current_bytes = row or (0, 0)
-            # Handle None from SUM when table is empty
-            current_bytes = current_bytes or 0
-
-            # Evict until we have space
-            while entries >= self.max_entries or current_bytes + new_bytes > self.max_bytes:
-                # Delete oldest entries
-                cursor = conn.execute("""
-                    DELETE FROM cache
-                    WHERE key IN (
-                        SELECT key FROM cache ORDER BY last_access ASC LIMIT 100
-                    )
-                    RETURNING value_bytes
-                """)
-                deleted_bytes = sum(row[0] for row in cursor.fetchall())
-                entries -= cursor.rowcount
-                current_bytes -= deleted_bytes
-                conn.commit()
+            if cursor.rowcount <= 0:
+                break
+            entries, current_bytes = conn.execute(
+                "SELECT entries, bytes FROM cache_counters WHERE id = 0"
+            ).fetchone()
 
 
 class NullCache:
@@ -398,10 +589,18 @@ class NullCache:
         """Siempre retorna None."""
         return None
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Siempre retorna vacío."""
+        return {}
+
     def set(self, key: str, value: Any) -> None:
         """No hace nada."""
         pass
 
+    def set_many(self, items: dict[str, Any]) -> None:
+        """No hace nada."""
+        pass
+
     def delete(self, key: str) -> bool:
         """Siempre retorna False."""
         return False
@@ -1,7 +1,7 @@
 """Domain Models for Trifecta Context."""
 
 from datetime import datetime
-from typing import Any, List
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -16,6 +16,9 @@ class ContextChunk(BaseModel):
     token_est: int
     source_path: str = Field(..., description="Path relative to repo root")
     chunking_method: str = "whole_file"
+    parent_id: Optional[str] = Field(default=None, description="Chunk of the enclosing section")
+    start_line: Optional[int] = Field(default=None, description="First source line (1-based)")
+    end_line: Optional[int] = Field(default=None, description="Last source line (inclusive)")
 
 
 class ContextIndexEntry(BaseModel):
@@ -34,6 +37,7 @@ class SourceFile(BaseModel):
     sha256: str
     mtime: float
     chars: int
+    size: int | None = None  # bytes on disk; None in packs built before incremental builds
 
 
 class ContextPack(BaseModel):
@@ -31,6 +31,16 @@ class GraphEdge:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class GraphFileState:
+    content_hash: str
+    mtime_ns: Optional[int] = None
+    size: Optional[int] = None
+
+    def same_stat(self, mtime_ns: int, size: int) -> bool:
+        return self.mtime_ns == mtime_ns and self.size == size
+
+
 @dataclass(frozen=True)
 class GraphIndexSummary:
     segment_id: str
@@ -38,6 +48,9 @@ class GraphIndexSummary:
     node_count: int
     edge_count: int
     indexed_at: str
+    files_skipped: int = 0
+    files_reparsed: int = 0
+    files_removed: int = 0
 
     def to_dict(self) -> dict[str, object]:
         return asdict(self)
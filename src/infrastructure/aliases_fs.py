@@ -4,6 +4,7 @@ This module provides:
 - Loading aliases from YAML files (schema_version 1)
 - Saving generated aliases to YAML files
 - Merging manual and generated aliases with precedence
+- Caching the merged aliases as a compiled AliasIndex (aliases.index.json)
 
 Design principles:
 - Manual aliases always take precedence over generated
@@ -13,12 +14,17 @@ Design principles:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+from src.domain.alias_index import AliasIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +34,7 @@ EXPECTED_SCHEMA_VERSION = 1
 # Default filenames
 MANUAL_ALIASES_FILENAME = "aliases.yaml"
 GENERATED_ALIASES_FILENAME = "aliases.generated.yaml"
+COMPILED_ALIASES_FILENAME = "aliases.index.json"
 
 
 def load_aliases_yaml(file_path: Path) -> dict[str, list[str]]:
@@ -162,6 +169,116 @@ class AliasMerger:
         """Merge manual and generated aliases."""
         return merge_aliases(self.load_manual(), self.load_generated())
 
+    def index(self) -> AliasIndex:
+        """Merged aliases compiled for O(1) lookups, cached on disk (see load_alias_index)."""
+        return load_alias_index(self.ctx_path)
+
+
+def _source_stamps(ctx_path: Path) -> dict[str, dict[str, int] | None]:
+    """mtime_ns and size of each alias source, None for missing files."""
+    stamps: dict[str, dict[str, int] | None] = {}
+    for name in (MANUAL_ALIASES_FILENAME, GENERATED_ALIASES_FILENAME):
+        try:
+            stat = (ctx_path / name).stat()
+        except OSError:
+            stamps[name] = None
+        else:
+            stamps[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    return stamps
+
+
+def _source_hashes(ctx_path: Path) -> dict[str, str | None]:
+    hashes: dict[str, str | None] = {}
+    for name in (MANUAL_ALIASES_FILENAME, GENERATED_ALIASES_FILENAME):
+        try:
+            hashes[name] = hashlib.sha256((ctx_path / name).read_bytes()).hexdigest()
+        except OSError:
+            hashes[name] = None
+    return hashes
+
+
+def _stamp_matches(stamp: dict[str, int] | None, source: Any) -> bool:
+    if stamp is None or not isinstance(source, dict):
+        return stamp is None and source is None
+    return all(source.get(field) == value for field, value in stamp.items())
+
+
+def _hash_matches(digest: str | None, source: Any) -> bool:
+    if digest is None or not isinstance(source, dict):
+        return digest is None and source is None
+    return source.get("sha256") == digest
+
+
+def _read_alias_index(cache_path: Path) -> tuple[AliasIndex, dict[str, Any]] | None:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        sources = data["sources"]
+        if not isinstance(sources, dict):
+            return None
+        return AliasIndex.from_dict(data["index"]), sources
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_alias_index(
+    cache_path: Path,
+    index: AliasIndex,
+    stamps: dict[str, dict[str, int] | None],
+    hashes: dict[str, str | None],
+) -> None:
+    sources = {
+        name: {**stamp, "sha256": hashes[name]} if stamp else None
+        for name, stamp in stamps.items()
+    }
+    payload = json.dumps({"sources": sources, "index": index.to_dict()}, ensure_ascii=False)
+    # Atomic write: concurrent searches either see the old or the new index
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Failed to write alias index {cache_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_alias_index(ctx_path: Path) -> AliasIndex:
+    """Merged manual + generated aliases as a compiled AliasIndex.
+
+    The index is cached in ``_ctx/aliases.index.json`` with the mtime, size
+    and SHA-256 of both YAML sources. It is reused while their stats match;
+    if only the stats moved, the sources are hashed and the cache is kept
+    when their content is unchanged. Otherwise the YAML is parsed and merged
+    again and the cache rewritten (best effort).
+
+    Args:
+        ctx_path: The segment's ``_ctx`` directory.
+    """
+    cache_path = ctx_path / COMPILED_ALIASES_FILENAME
+    stamps = _source_stamps(ctx_path)
+    cached = _read_alias_index(cache_path)
+    if cached is not None:
+        index, sources = cached
+        if all(_stamp_matches(stamp, sources.get(name)) for name, stamp in stamps.items()):
+            return index
+
+    hashes = _source_hashes(ctx_path)
+    if cached is not None:
+        index, sources = cached
+        if all(_hash_matches(digest, sources.get(name)) for name, digest in hashes.items()):
+            _write_alias_index(cache_path, index, stamps, hashes)
+            return index
+
+    manual = load_aliases_yaml(ctx_path / MANUAL_ALIASES_FILENAME)
+    generated = load_aliases_yaml(ctx_path / GENERATED_ALIASES_FILENAME)
+    index = AliasIndex.from_aliases(merge_aliases(manual, generated))
+    if any(stamps.values()):
+        _write_alias_index(cache_path, index, stamps, hashes)
+    return index
+
 
 class GeneratedAliasWriter:
     """Write generated aliases to YAML file.
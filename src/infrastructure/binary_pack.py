@@ -0,0 +1,289 @@
+"""
+Binary context pack layout (context_pack.bin) with lazily materialized chunks.
+
+Layout:
+    MAGIC (8 bytes) | header length (uint64 LE) | JSON header | text blob
+
+The header carries pack metadata, chunk metadata (everything but the text,
+plus ``offset``/``length`` into the blob) and the L0 index. The blob is the
+UTF-8 chunk texts laid out contiguously. Readers mmap the file and decode
+only the chunk bodies they need, so opening the pack costs O(chunks), not
+O(total text).
+
+The binary pack is a derived artifact: context_pack.json stays the source of
+truth. The header records the JSON pack's size and mtime so that readers can
+detect a stale binary without hashing the JSON, and the JSON payload digest so
+that the search sidecar can be matched without reading the JSON at all.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack, SourceFile
+
+BINARY_PACK_FILENAME = "context_pack.bin"
+BINARY_PACK_MAGIC = b"TRFPACK\x01"
+BINARY_PACK_SCHEMA_VERSION = 1
+
+_HEADER_LEN = struct.Struct("<Q")
+_PREAMBLE_SIZE = len(BINARY_PACK_MAGIC) + _HEADER_LEN.size
+
+
+class BinaryPackError(ValueError):
+    """Raised when a binary pack is malformed."""
+
+
+@dataclass(frozen=True)
+class ChunkSlot:
+    """Chunk metadata plus the location of its text in the blob."""
+
+    id: str
+    doc: str
+    title_path: list[str]
+    char_count: int
+    token_est: int
+    source_path: str
+    chunking_method: str
+    offset: int
+    length: int
+    parent_id: str | None = None
+    start_line: int | None = None
+    end_line: int | None = None
+
+
+def _json_stat(json_path: Path) -> dict[str, int]:
+    stat = json_path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_binary_pack(ctx_dir: Path, pack: ContextPack, pack_digest: str) -> Path:
+    """Write context_pack.bin for a pack already persisted as context_pack.json.
+
+    Must be called after the JSON pack is written: the header pins its stat.
+    """
+    blob = bytearray()
+    chunks: list[dict[str, Any]] = []
+    for chunk in pack.chunks:
+        encoded = chunk.text.encode("utf-8")
+        chunks.append(
+            {
+                "id": chunk.id,
+                "doc": chunk.doc,
+                "title_path": chunk.title_path,
+                "char_count": chunk.char_count,
+                "token_est": chunk.token_est,
+                "source_path": chunk.source_path,
+                "chunking_method": chunk.chunking_method,
+                "offset": len(blob),
+                "length": len(encoded),
+                "parent_id": chunk.parent_id,
+                "start_line": chunk.start_line,
+                "end_line": chunk.end_line,
+            }
+        )
+        blob.extend(encoded)
+
+    header = {
+        "schema_version": BINARY_PACK_SCHEMA_VERSION,
+        "pack_schema_version": pack.schema_version,
+        "segment": pack.segment,
+        "created_at": pack.created_at,
+        "digest": pack.digest,
+        "pack_digest": pack_digest,
+        "json_stat": _json_stat(ctx_dir / "context_pack.json"),
+        "source_files": [src.model_dump() for src in pack.source_files],
+        "chunks": chunks,
+        "index": [entry.model_dump() for entry in pack.index],
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    path = ctx_dir / BINARY_PACK_FILENAME
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(BINARY_PACK_MAGIC)
+            f.write(_HEADER_LEN.pack(len(header_bytes)))
+            f.write(header_bytes)
+            f.write(blob)
+        temp_path.replace(path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    return path
+
+
+class BinaryPackReader:
+    """Read-only view over context_pack.bin backed by mmap."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            preamble = self._file.read(_PREAMBLE_SIZE)
+            if len(preamble) != _PREAMBLE_SIZE or not preamble.startswith(BINARY_PACK_MAGIC):
+                raise BinaryPackError(f"Not a binary context pack: {path}")
+            (header_len,) = _HEADER_LEN.unpack(preamble[len(BINARY_PACK_MAGIC) :])
+            header_bytes = self._file.read(header_len)
+            if len(header_bytes) != header_len:
+                raise BinaryPackError(f"Truncated binary pack header: {path}")
+            try:
+                self.header: dict[str, Any] = json.loads(header_bytes)
+            except json.JSONDecodeError as exc:
+                raise BinaryPackError(f"Invalid binary pack header: {exc}") from exc
+            if self.header.get("schema_version") != BINARY_PACK_SCHEMA_VERSION:
+                raise BinaryPackError(
+                    f"Unsupported binary pack schema: {self.header.get('schema_version')}"
+                )
+
+            self._blob_start = _PREAMBLE_SIZE + header_len
+            file_size = path.stat().st_size
+            self.blob_size = file_size - self._blob_start
+            self._mmap = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if file_size > 0
+                else None
+            )
+
+            self.slots: dict[str, ChunkSlot] = {}
+            for raw in self.header["chunks"]:
+                slot = ChunkSlot(**raw)
+                if slot.offset < 0 or slot.length < 0 or slot.offset + slot.length > self.blob_size:
+                    raise BinaryPackError(f"Chunk '{slot.id}' points outside the text blob")
+                self.slots[slot.id] = slot
+            self.index = [ContextIndexEntry(**entry) for entry in self.header["index"]]
+        except (KeyError, TypeError) as exc:
+            self.close()
+            raise BinaryPackError(f"Invalid binary pack header: {exc}") from exc
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def open_if_fresh(cls, ctx_dir: Path) -> "BinaryPackReader | None":
+        """Open context_pack.bin only if it was written for the current JSON pack."""
+        path = ctx_dir / BINARY_PACK_FILENAME
+        json_path = ctx_dir / "context_pack.json"
+        if not path.exists() or not json_path.exists():
+            return None
+        try:
+            reader = cls(path)
+        except (OSError, BinaryPackError):
+            return None
+        if not reader.is_fresh(json_path):
+            reader.close()
+            return None
+        return reader
+
+    def is_fresh(self, json_path: Path) -> bool:
+        try:
+            return self.header.get("json_stat") == _json_stat(json_path)
+        except OSError:
+            return False
+
+    @property
+    def pack_digest(self) -> str:
+        return str(self.header["pack_digest"])
+
+    @property
+    def chunk_ids(self) -> list[str]:
+        return list(self.slots)
+
+    def text(self, chunk_id: str) -> str:
+        slot = self.slots[chunk_id]
+        if self._mmap is None:
+            return ""
+        start = self._blob_start + slot.offset
+        return self._mmap[start : start + slot.length].decode("utf-8")
+
+    def chunk(self, chunk_id: str, text: str | None = None) -> ContextChunk | None:
+        """Materialize a single chunk, reading only its slice of the blob.
+
+        A given ``text`` replaces the body, and the blob is not read at all.
+        """
+        slot = self.slots.get(chunk_id)
+        if slot is None:
+            return None
+        return ContextChunk(
+            id=slot.id,
+            doc=slot.doc,
+            title_path=slot.title_path,
+            text=self.text(chunk_id) if text is None else text,
+            char_count=slot.char_count,
+            token_est=slot.token_est,
+            source_path=slot.source_path,
+            chunking_method=slot.chunking_method,
+            parent_id=slot.parent_id,
+            start_line=slot.start_line,
+            end_line=slot.end_line,
+        )
+
+    def to_pack(self) -> ContextPack:
+        """Materialize the whole pack (every chunk body)."""
+        return ContextPack(
+            schema_version=self.header["pack_schema_version"],
+            segment=self.header["segment"],
+            created_at=self.header["created_at"],
+            digest=self.header["digest"],
+            source_files=[SourceFile(**src) for src in self.header["source_files"]],
+            chunks=[chunk for cid in self.slots if (chunk := self.chunk(cid)) is not None],
+            index=self.index,
+        )
+
+    def close(self) -> None:
+        mm = getattr(self, "_mmap", None)
+        if mm is not None:
+            mm.close()
+            self._mmap = None
+        self._file.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def verify_binary_pack(ctx_dir: Path, pack_data: dict[str, Any]) -> list[str]:
+    """Check context_pack.bin against the parsed context_pack.json payload.
+
+    Returns a list of error strings (empty when consistent).
+    """
+    path = ctx_dir / BINARY_PACK_FILENAME
+    try:
+        reader = BinaryPackReader(path)
+    except (OSError, BinaryPackError) as exc:
+        return [f"Binary pack unreadable: {exc}"]
+
+    errors: list[str] = []
+    try:
+        if not reader.is_fresh(ctx_dir / "context_pack.json"):
+            errors.append("Binary pack is stale (context_pack.json changed since it was written)")
+
+        json_chunks = {c["id"]: c for c in pack_data.get("chunks", [])}
+        if list(json_chunks) != reader.chunk_ids:
+            errors.append("Binary pack chunk ids differ from context_pack.json")
+
+        for chunk_id, chunk in json_chunks.items():
+            if chunk_id not in reader.slots:
+                continue
+            try:
+                text = reader.text(chunk_id)
+            except UnicodeDecodeError:
+                errors.append(f"Binary pack chunk is not valid UTF-8: {chunk_id}")
+                continue
+            if text != chunk.get("text"):
+                errors.append(f"Binary pack chunk text mismatch: {chunk_id}")
+
+        json_index = [entry.get("id") for entry in pack_data.get("index", [])]
+        if json_index != [entry.id for entry in reader.index]:
+            errors.append("Binary pack index differs from context_pack.json")
+    finally:
+        reader.close()
+    return errors
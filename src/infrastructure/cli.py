@@ -131,6 +131,13 @@ app.add_typer(repo_app, name="repo")
 
 HELP_SEGMENT = "Target segment path (e.g., 'debug_terminal' or '.')"
 HELP_TELEMETRY = "Telemetry level: off, lite (default), full"
+HELP_BINARY_PACK = "Also write context_pack.bin (memory-mapped layout with lazy chunk bodies)"
+HELP_INCREMENTAL = "Reuse chunks of files whose mtime and size are unchanged since the last build"
+HELP_BUILD_JOBS = "Reader threads for reading/hashing sources (0 = auto, 1 = sequential)"
+HELP_CHUNKING = (
+    "Chunking: whole_file (one chunk per file) or sections "
+    "(markdown by headings, Python by top-level symbols)"
+)
 
 
 def _resolve_segment(segment: str, require_ctx: bool = False) -> Path:
@@ -203,6 +210,36 @@ def _get_lint_enabled(no_lint_flag: bool) -> bool:
     return False  # Conservative default: OFF until explicitly enabled
 
 
+def _route_ctx_to_daemon(segment: str, method: str, params: dict[str, Any]) -> dict[str, Any] | None:
+    """Serve a ctx call from the segment's running daemon (warm pack/aliases).
+
+    Returns the daemon's ok-response, or None to run the command in-process
+    (no daemon, routing disabled via TRIFECTA_DAEMON_ROUTE=0, or any error).
+    """
+    from src.domain.segment_resolver import resolve_segment_ref
+    from src.infrastructure.daemon.client import (
+        daemon_routing_enabled,
+        daemon_socket_path,
+        get_connection,
+    )
+
+    if not daemon_routing_enabled():
+        return None
+    ref = resolve_segment_ref(segment)
+    runtime_dir = (
+        Path.home() / DIR_LOCAL / "share" / "trifecta" / "repos" / ref.fingerprint / "runtime"
+    )
+    socket_path = daemon_socket_path(runtime_dir)
+    if not socket_path.exists():
+        return None
+    response = get_connection(socket_path).request(
+        method, {"segment": str(Path(segment).resolve()), **params}
+    )
+    if response is None or response.get("status") != "ok":
+        return None
+    return response
+
+
 def _is_runtime_dir_allowed(runtime_dir: Path, allowed_bases: list[Path]) -> bool:
     """Validate runtime dir against resolved allowlisted bases."""
     return is_runtime_dir_allowed(runtime_dir, allowed_bases)
@@ -596,6 +633,12 @@ def _handle_sync_build_error(
 def build(
     segment: str = typer.Option(..., "--segment", "-s", help=HELP_SEGMENT),
     telemetry_level: str = typer.Option("lite", "--telemetry", help=HELP_TELEMETRY),
+    binary: bool = typer.Option(False, "--binary", help=HELP_BINARY_PACK),
+    incremental: bool = typer.Option(False, "--incremental", help=HELP_INCREMENTAL),
+    jobs: int = typer.Option(0, "--jobs", min=0, help=HELP_BUILD_JOBS),
+    chunking: Literal["whole_file", "sections"] = typer.Option(
+        "whole_file", "--chunking", help=HELP_CHUNKING
+    ),
 ) -> None:
     """Build a Context Pack (context_pack.json) for a segment."""
     from src.domain.result import Err, Ok
@@ -618,7 +661,13 @@ def build(
     segment_fs = state.segment_root_resolved
 
     try:
-        match use_case.execute(segment_fs):
+        match use_case.execute(
+            segment_fs,
+            write_binary=binary,
+            incremental=incremental,
+            jobs=jobs or None,
+            chunking=chunking,
+        ):
             case Ok(pack):
                 typer.echo(pack)
                 telemetry.event(
@@ -705,6 +754,21 @@ def search(
       --explain              Return structured JSON with ranking explanation
       --explain-format       Output format for explanation: json (default) or text
     """
+    if not explain:
+        routed = _route_ctx_to_daemon(
+            segment,
+            "ctx.search",
+            {
+                "query": query,
+                "limit": limit,
+                "enable_lint": _get_lint_enabled(no_lint),
+                "telemetry_level": os.environ.get("TRIFECTA_TELEMETRY_LEVEL", telemetry_level),
+            },
+        )
+        if routed is not None:
+            typer.echo(routed["output"])
+            return
+
     telemetry = _get_telemetry(segment, telemetry_level, require_ctx=False)
     start_time = time.time()
     _, file_system, _ = _get_dependencies(segment, telemetry)
@@ -818,6 +882,24 @@ def get(
         if env_stop_on_evidence and env_stop_on_evidence == "1":
             effective_stop_on_evidence = True
 
+    if not pd_report:
+        routed = _route_ctx_to_daemon(
+            segment,
+            "ctx.get",
+            {
+                "ids": id_list,
+                "mode": mode,
+                "budget_token_est": budget_token_est,
+                "max_chunks": effective_max_chunks,
+                "stop_on_evidence": effective_stop_on_evidence,
+                "query": query,
+                "telemetry_level": os.environ.get("TRIFECTA_TELEMETRY_LEVEL", telemetry_level),
+            },
+        )
+        if routed is not None:
+            typer.echo(routed["output"])
+            return
+
     try:
         # Use execute_with_result when --pd-report is active for access to GetResult
         if pd_report:
@@ -998,13 +1080,23 @@ def plan(
     json_output: bool = typer.Option(False, "--json", "-j", help=HELP_OUTPUT_JSON),
 ) -> None:
     """Generate execution plan using PRIME index (no RAG)."""
-    telemetry = _get_telemetry(segment, telemetry_level)
-    _, file_system, _ = _get_dependencies(segment, telemetry)
-
-    use_case = PlanUseCase(file_system, telemetry)
+    routed = _route_ctx_to_daemon(
+        segment,
+        "ctx.plan",
+        {
+            "task": task,
+            "telemetry_level": os.environ.get("TRIFECTA_TELEMETRY_LEVEL", telemetry_level),
+        },
+    )
+    if routed is None:
+        telemetry = _get_telemetry(segment, telemetry_level)
+        _, file_system, _ = _get_dependencies(segment, telemetry)
+        use_case = PlanUseCase(file_system, telemetry)
 
     try:
-        result = use_case.execute(Path(segment).resolve(), task)
+        result = routed["result"] if routed is not None else use_case.execute(
+            Path(segment).resolve(), task
+        )
 
         if json_output:
             typer.echo(json.dumps(result, indent=2))
@@ -1361,6 +1453,12 @@ def eval_plan(
 def sync(
     segment: str = typer.Option(..., "--segment", "-s", help=HELP_SEGMENT),
     telemetry_level: str = typer.Option("lite", "--telemetry", help=HELP_TELEMETRY),
+    binary: bool = typer.Option(False, "--binary", help=HELP_BINARY_PACK),
+    incremental: bool = typer.Option(False, "--incremental", help=HELP_INCREMENTAL),
+    jobs: int = typer.Option(0, "--jobs", min=0, help=HELP_BUILD_JOBS),
+    chunking: Literal["whole_file", "sections"] = typer.Option(
+        "whole_file", "--chunking", help=HELP_CHUNKING
+    ),
 ) -> None:
     """Macro: Build + Validate."""
     from src.application.exceptions import InvalidConfigScopeError, InvalidSegmentPathError
@@ -1383,7 +1481,13 @@ def sync(
         build_uc = BuildContextPackUseCase(file_system, telemetry)
         from src.domain.result import Err
 
-        build_result = build_uc.execute(state.segment_root_resolved)
+        build_result = build_uc.execute(
+            state.segment_root_resolved,
+            write_binary=binary,
+            incremental=incremental,
+            jobs=jobs or None,
+            chunking=chunking,
+        )
         if isinstance(build_result, Err):
             typer.echo("❌ Build Failed:")
             for err in build_result.error:
@@ -1,6 +1,7 @@
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import typer
 
@@ -11,6 +12,15 @@ from src.infrastructure.graph_store import GraphCommandError
 
 graph_app = typer.Typer(help="Code Graph Commands")
 
+HELP_INDEX_JOBS = "Worker processes for parsing sources (0 = one per CPU, 1 = sequential)"
+HELP_INDEX_FULL = "Rebuild the whole segment instead of only files whose content changed"
+HELP_DEPTH = "Follow calls transitively up to N hops (1 = direct only)"
+HELP_RELATED_LIMIT = (
+    "Maximum nodes returned (the payload reports truncated=true beyond it); "
+    f"defaults to {GraphService.DEFAULT_RELATED_LIMIT} with --depth > 1, unlimited otherwise"
+)
+HELP_PATH_MAX_DEPTH = "Give up when no path of at most N calls exists"
+
 
 def _emit(data: dict[str, object], json_output: bool) -> None:
     if json_output:
@@ -29,16 +39,24 @@ def _emit(data: dict[str, object], json_output: bool) -> None:
         typer.echo(
             f"segment={data.get('segment_id', '?')} nodes={data.get('node_count', 0)} edges={data.get('edge_count', 0)}"
         )
+        if "files_reparsed" in data:
+            typer.echo(
+                f"files skipped={data.get('files_skipped', 0)}"
+                f" reparsed={data.get('files_reparsed', 0)}"
+                f" removed={data.get('files_removed', 0)}"
+            )
         return
 
     nodes = data.get("nodes", [])
     if not isinstance(nodes, list):
         nodes = []
-    typer.echo(f"{len(nodes)} result(s)")
+    typer.echo(f"{len(nodes)} result(s)" + (" (truncated)" if data.get("truncated") else ""))
+    show_depth = data.get("depth", 1) != 1 or "found" in data
     for node in nodes:
+        suffix = f" (depth {node.get('depth', '?')})" if show_depth else ""
         typer.echo(
             f"- {node.get('symbol_name', '?')} [{node.get('kind', '?')}]"
-            f" {node.get('file_rel', '?')}:{node.get('line', '?')}"
+            f" {node.get('file_rel', '?')}:{node.get('line', '?')}{suffix}"
         )
 
 
@@ -57,10 +75,14 @@ def _handle_graph_error(exc: GraphCommandError, json_output: bool) -> None:
 @graph_app.command("index")
 def index(
     segment: str = typer.Option(".", "--segment", "-s"),
+    jobs: int = typer.Option(1, "--jobs", min=0, help=HELP_INDEX_JOBS),
+    full: bool = typer.Option(False, "--full", help=HELP_INDEX_FULL),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     try:
-        summary = GraphIndexer().index_segment(Path(segment))
+        summary = GraphIndexer().index_segment(
+            Path(segment), jobs=jobs or os.cpu_count(), full=full
+        )
         _emit({"status": "ok", **summary.to_dict()}, json_output)
     except GraphCommandError as exc:
         _handle_graph_error(exc, json_output)
@@ -94,10 +116,14 @@ def search(
 def callers(
     symbol: str = typer.Option(..., "--symbol"),
     segment: str = typer.Option(".", "--segment", "-s"),
+    depth: int = typer.Option(1, "--depth", min=1, max=GraphService.MAX_DEPTH, help=HELP_DEPTH),
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help=HELP_RELATED_LIMIT),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     try:
-        _emit(GraphService().callers(Path(segment), symbol), json_output)
+        _emit(
+            GraphService().callers(Path(segment), symbol, depth=depth, limit=limit), json_output
+        )
     except GraphCommandError as exc:
         _handle_graph_error(exc, json_output)
 
@@ -106,9 +132,33 @@ def callers(
 def callees(
     symbol: str = typer.Option(..., "--symbol"),
     segment: str = typer.Option(".", "--segment", "-s"),
+    depth: int = typer.Option(1, "--depth", min=1, max=GraphService.MAX_DEPTH, help=HELP_DEPTH),
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help=HELP_RELATED_LIMIT),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    try:
+        _emit(
+            GraphService().callees(Path(segment), symbol, depth=depth, limit=limit), json_output
+        )
+    except GraphCommandError as exc:
+        _handle_graph_error(exc, json_output)
+
+
+@graph_app.command("path")
+def path(
+    source: str = typer.Argument(..., help="Calling symbol"),
+    target: str = typer.Argument(..., help="Called symbol"),
+    segment: str = typer.Option(".", "--segment", "-s"),
+    max_depth: int = typer.Option(
+        GraphService.MAX_DEPTH,
+        "--max-depth",
+        min=1,
+        max=GraphService.MAX_DEPTH,
+        help=HELP_PATH_MAX_DEPTH,
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     try:
-        _emit(GraphService().callees(Path(segment), symbol), json_output)
+        _emit(GraphService().path(Path(segment), source, target, max_depth=max_depth), json_output)
     except GraphCommandError as exc:
         _handle_graph_error(exc, json_output)
@@ -0,0 +1,153 @@
+import atexit
+import itertools
+import json
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Any
+
+DAEMON_REQUEST_TIMEOUT = 30.0
+DAEMON_CONNECT_TIMEOUT = 0.5
+
+
+def daemon_socket_path(runtime_dir: Path) -> Path:
+    return runtime_dir / "daemon" / "socket"
+
+
+class DaemonConnection:
+    """Keep-alive connection to a daemon socket, reused across calls.
+
+    Every request carries an ``id``, which keeps the daemon side of the
+    connection open; replies may arrive out of order and are matched by id.
+    A connection the daemon dropped (idle timeout, restart) is reopened once.
+    """
+
+    def __init__(self, socket_path: Path, timeout: float = DAEMON_REQUEST_TIMEOUT) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._buffer = b""
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def request(self, method: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Send one request and wait for its reply; None if the daemon is unreachable."""
+        replies = self.pipeline([{"method": method, "params": params}])
+        return replies[0] if replies else None
+
+    def pipeline(self, requests: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """Write all requests before reading any reply; replies keep request order."""
+        return self._exchange(requests, batch=False)
+
+    def batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """Send requests as one batch envelope; the daemon answers with one array."""
+        return self._exchange(requests, batch=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _exchange(
+        self, requests: list[dict[str, Any]], *, batch: bool
+    ) -> list[dict[str, Any] | None]:
+        if not requests:
+            return []
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    return self._exchange_once(requests, batch)
+                except (OSError, ValueError):
+                    self._close()
+                    if attempt == 1 or not self.socket_path.exists():
+                        break
+            return [None] * len(requests)
+
+    def _exchange_once(
+        self, requests: list[dict[str, Any]], batch: bool
+    ) -> list[dict[str, Any] | None]:
+        sock = self._connect()
+        ids = [next(self._ids) for _ in requests]
+        envelopes = [{"id": req_id, **req} for req_id, req in zip(ids, requests)]
+        if batch:
+            sock.sendall(json.dumps(envelopes).encode() + b"\n")
+            replies = self._read_message(sock)
+            if not isinstance(replies, list):
+                raise ValueError("batch reply is not an array")
+            by_id = {r.get("id"): r for r in replies if isinstance(r, dict)}
+        else:
+            sock.sendall(b"".join(json.dumps(env).encode() + b"\n" for env in envelopes))
+            by_id = {}
+            while not all(req_id in by_id for req_id in ids):
+                reply = self._read_message(sock)
+                if isinstance(reply, dict):
+                    by_id[reply.get("id")] = reply
+        return [_strip_id(by_id.get(req_id)) for req_id in ids]
+
+    def _connect(self) -> socket.socket:
+        if self._sock is not None:
+            return self._sock
+        if not self.socket_path.exists():
+            raise FileNotFoundError(str(self.socket_path))
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(DAEMON_CONNECT_TIMEOUT)
+            sock.connect(str(self.socket_path))
+            sock.settimeout(self.timeout)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._buffer = b""
+        return sock
+
+    def _read_message(self, sock: socket.socket) -> Any:
+        while b"\n" not in self._buffer:
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionResetError("daemon closed the connection")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._buffer = b""
+
+
+def _strip_id(reply: dict[str, Any] | None) -> dict[str, Any] | None:
+    if reply is None:
+        return None
+    return {key: value for key, value in reply.items() if key != "id"}
+
+
+_connections: dict[Path, DaemonConnection] = {}
+_connections_lock = threading.Lock()
+
+
+def get_connection(socket_path: Path) -> DaemonConnection:
+    """Process-wide keep-alive connection per daemon socket."""
+    with _connections_lock:
+        connection = _connections.get(socket_path)
+        if connection is None:
+            connection = DaemonConnection(socket_path)
+            _connections[socket_path] = connection
+        return connection
+
+
+@atexit.register
+def close_connections() -> None:
+    with _connections_lock:
+        for connection in _connections.values():
+            connection.close()
+        _connections.clear()
+
+
+def daemon_routing_enabled() -> bool:
+    """CLI auto-routing to a running daemon; TRIFECTA_DAEMON_ROUTE=0 disables it."""
+    return os.environ.get("TRIFECTA_DAEMON_ROUTE", "1").lower() not in ("0", "false", "no")
@@ -0,0 +1,101 @@
+"""ctx.search / ctx.get / ctx.plan requests served by the daemon from warm caches."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.application.plan_use_case import PlanUseCase
+from src.application.search_get_usecases import GetChunkUseCase, SearchUseCase
+from src.application.warm_context import WarmContextCache
+from src.infrastructure.file_system import FileSystemAdapter
+from src.infrastructure.telemetry import Telemetry
+
+CTX_METHODS = frozenset({"ctx.search", "ctx.get", "ctx.plan"})
+
+
+def is_ctx_method(method: str) -> bool:
+    return method in CTX_METHODS
+
+
+class CtxRequestHandler:
+    """Serve ctx.search / ctx.get / ctx.plan from warm, process-resident state.
+
+    Responses carry the same text (or plan dict) the CLI would print, so the
+    CLI can echo them unchanged.
+    """
+
+    def __init__(self, repo_root: Path, cache: WarmContextCache | None = None) -> None:
+        self.repo_root = repo_root.resolve()
+        self.cache = cache or WarmContextCache()
+        self.file_system = FileSystemAdapter()
+        # Requests run on daemon worker threads; flushes must not interleave
+        self._telemetry_lock = threading.Lock()
+
+    def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        method = req.get("method", "")
+        params = req.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(method, "params must be an object")
+
+        try:
+            segment = self._resolve_segment(params.get("segment"))
+        except ValueError as exc:
+            return _error(method, str(exc))
+
+        # One Telemetry per request, like a CLI run: last_run.json describes this request only
+        telemetry = Telemetry(segment, level=str(params.get("telemetry_level", "lite")))
+        start_time = time.time()
+        try:
+            if method == "ctx.search":
+                output = SearchUseCase(self.file_system, telemetry, self.cache).execute(
+                    segment,
+                    str(params["query"]),
+                    limit=int(params.get("limit", 5)),
+                    enable_lint=bool(params.get("enable_lint", False)),
+                )
+                return {"status": "ok", "method": method, "output": output}
+
+            if method == "ctx.get":
+                output = GetChunkUseCase(self.file_system, telemetry, self.cache).execute(
+                    segment,
+                    [str(cid) for cid in params["ids"]],
+                    mode=params.get("mode", "excerpt"),
+                    budget_token_est=int(params.get("budget_token_est", 1500)),
+                    max_chunks=params.get("max_chunks"),
+                    stop_on_evidence=bool(params.get("stop_on_evidence", False)),
+                    query=params.get("query"),
+                )
+                return {"status": "ok", "method": method, "output": output}
+
+            if method == "ctx.plan":
+                result = PlanUseCase(self.file_system, telemetry, self.cache).execute(
+                    segment, str(params["task"])
+                )
+                return {"status": "ok", "method": method, "result": result}
+        except KeyError as exc:
+            return _error(method, f"missing param: {exc.args[0]}")
+        except Exception as exc:
+            return _error(method, str(exc))
+        finally:
+            try:
+                with self._telemetry_lock:
+                    if is_ctx_method(method):
+                        telemetry.observe(method, int((time.time() - start_time) * 1000))
+                    telemetry.flush()
+            except Exception:
+                pass
+
+        return _error(method, f"unknown method: {method}")
+
+    def _resolve_segment(self, raw: Any) -> Path:
+        if not isinstance(raw, str) or not raw:
+            raise ValueError("missing param: segment")
+        segment = Path(raw).resolve()
+        if not segment.is_relative_to(self.repo_root):
+            raise ValueError(f"segment outside daemon repo root: {segment}")
+        return segment
+
+
+def _error(method: str, message: str) -> dict[str, Any]:
+    return {"status": "error", "method": method, "message": message}
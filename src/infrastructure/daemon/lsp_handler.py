@@ -4,8 +4,14 @@ from src.domain.lsp_contracts import FallbackReason, LSPResponse
 from src.infrastructure.lsp_client import LSPState
 
 
-def handle_lsp_request(req: dict[str, Any], lsp_client: Any) -> dict[str, Any]:
-    """Handle JSON envelope LSP requests for daemon run."""
+def handle_lsp_request(
+    req: dict[str, Any], lsp_client: Any, timeout: float | None = None
+) -> dict[str, Any]:
+    """Handle JSON envelope LSP requests for daemon run.
+
+    ``timeout`` bounds the wait for the LSP reply; None keeps the client's
+    default (TRIFECTA_LSP_REQUEST_TIMEOUT).
+    """
     method = req.get("method", "")
     params = req.get("params", {})
 
@@ -28,7 +34,10 @@ def handle_lsp_request(req: dict[str, Any], lsp_client: Any) -> dict[str, Any]:
         ).to_dict()
 
     try:
-        result = lsp_client.request(method, params)
+        if timeout is None:
+            result = lsp_client.request(method, params)
+        else:
+            result = lsp_client.request(method, params, timeout=timeout)
         if result:
             return LSPResponse.full_response(result).to_dict()
         return LSPResponse.degraded_response(
@@ -7,8 +7,9 @@ MAX_REQUEST_SIZE = 16_384
 
 
 class ParsedRequest(TypedDict, total=False):
-    kind: Literal["empty", "json", "text"]
+    kind: Literal["empty", "json", "batch", "text"]
     payload: dict[str, Any]
+    items: list[Any]
     command: str
 
 
@@ -18,32 +19,60 @@ class ReadResult:
     oversized: bool = False
 
 
-def read_request(conn: socket.socket, max_size: int = MAX_REQUEST_SIZE) -> ReadResult:
-    """Read a newline-delimited request with explicit oversized detection.
+class RequestReader:
+    """Newline-delimited request reader that keeps bytes past the newline.
+
+    One-shot connections read a single request; keep-alive connections call
+    ``read()`` repeatedly and pipelined requests already received stay
+    buffered for the next call. A read interrupted by the socket timeout
+    keeps its partial request, so polling readers can simply call it again.
 
-    Semantics:
+    Semantics per request:
     - newline before limit => complete request
     - exact limit + EOF => complete request
     - exact limit + extra byte => oversized request
     """
-    raw_data = b""
 
-    while True:
-        newline_index = raw_data.find(b"\n")
-        if newline_index != -1:
-            return ReadResult(raw_data=raw_data[: newline_index + 1], oversized=False)
-
-        if len(raw_data) == max_size:
-            extra = conn.recv(1)
-            if not extra:
+    def __init__(self, conn: socket.socket, max_size: int = MAX_REQUEST_SIZE) -> None:
+        self.conn = conn
+        self.max_size = max_size
+        self._buffer = b""
+
+    def read(self) -> ReadResult:
+        raw_data = self._buffer
+        self._buffer = b""
+
+        while True:
+            newline_index = raw_data.find(b"\n", 0, self.max_size)
+            if newline_index != -1:
+                self._buffer = raw_data[newline_index + 1 :]
+                return ReadResult(raw_data=raw_data[: newline_index + 1], oversized=False)
+
+            if len(raw_data) >= self.max_size:
+                if len(raw_data) > self.max_size:
+                    return ReadResult(raw_data=raw_data[: self.max_size], oversized=True)
+                extra = self._recv(raw_data, 1)
+                if not extra:
+                    return ReadResult(raw_data=raw_data, oversized=False)
+                return ReadResult(raw_data=raw_data, oversized=True)
+
+            chunk = self._recv(raw_data, min(4096, self.max_size - len(raw_data)))
+            if not chunk:
                 return ReadResult(raw_data=raw_data, oversized=False)
-            return ReadResult(raw_data=raw_data, oversized=True)
 
-        chunk = conn.recv(min(4096, max_size - len(raw_data)))
-        if not chunk:
-            return ReadResult(raw_data=raw_data, oversized=False)
+            raw_data += chunk
+
+    def _recv(self, raw_data: bytes, size: int) -> bytes:
+        try:
+            return self.conn.recv(size)
+        except socket.timeout:
+            self._buffer = raw_data
+            raise
 
-        raw_data += chunk
+
+def read_request(conn: socket.socket, max_size: int = MAX_REQUEST_SIZE) -> ReadResult:
+    """Read a single newline-delimited request (see RequestReader)."""
+    return RequestReader(conn, max_size).read()
 
 
 def decode_request(raw_data: bytes) -> str:
@@ -58,13 +87,15 @@ def parse_request(data: str) -> ParsedRequest:
         req = json.loads(data)
         if isinstance(req, dict) and "method" in req:
             return {"kind": "json", "payload": req}
+        if isinstance(req, list) and req:
+            return {"kind": "batch", "items": req}
     except (json.JSONDecodeError, TypeError):
         pass
 
     return {"kind": "text", "command": data}
 
 
-def build_json_response(payload: dict[str, Any]) -> bytes:
+def build_json_response(payload: dict[str, Any] | list[dict[str, Any]]) -> bytes:
     return json.dumps(payload).encode() + b"\n"
 
 
@@ -89,5 +120,12 @@ def build_health_payload(
     }
 
 
+def with_request_id(request: dict[str, Any], response: dict[str, Any]) -> dict[str, Any]:
+    """Echo the request ``id`` so pipelined responses can be matched out of order."""
+    if "id" not in request:
+        return response
+    return {"id": request["id"], **response}
+
+
 def build_request_too_large_response() -> bytes:
     return build_json_response({"status": "error", "message": "Request too large (max 16KB)"})
@@ -1,24 +1,36 @@
+"""Daemon process: serves LSP, ctx and health requests on a Unix socket.
+
+Requests run on a worker pool; keep-alive connections get their own session
+threads.
+"""
+
 import os
 import signal
 import socket
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from src.infrastructure.daemon.ctx_handler import CtxRequestHandler, is_ctx_method
 from src.infrastructure.daemon.lsp_handler import handle_lsp_request
 from src.infrastructure.daemon.protocol import (
     MAX_REQUEST_SIZE,
+    ParsedRequest,
+    RequestReader,
     build_health_payload,
     build_json_response,
     build_request_too_large_response,
     build_text_response,
     decode_request,
     parse_request,
-    read_request,
+    with_request_id,
 )
 from src.infrastructure.daemon.socket_manager import (
+    DEFAULT_BACKLOG,
     cleanup_runtime_artifacts,
     close_server,
     create_server,
@@ -27,13 +39,35 @@ from src.infrastructure.lsp_client import LSPClient
 from src.infrastructure.telemetry import Telemetry
 from src.platform.daemon_manager import ALLOWED_BASES, is_runtime_dir_allowed
 
+# Connections served in parallel; a slow LSP call only holds its own worker
+DEFAULT_MAX_WORKERS = 8
+# Idle keep-alive connections are closed after this many seconds
+DEFAULT_KEEP_ALIVE_TIMEOUT = 30.0
+# Keep-alive sessions run on their own threads, outside the worker pool;
+# past this many, new keep-alive requests are answered one-shot
+DEFAULT_MAX_SESSIONS = 64
+# How often an idle session wakes up to notice a stop or its idle timeout
+SESSION_POLL_INTERVAL = 0.25
+
 
 @dataclass
 class DaemonRunner:
     runtime_dir: Path
     repo_root: Path
     ttl_seconds: int = 0
+    max_workers: int = DEFAULT_MAX_WORKERS
+    backlog: int = DEFAULT_BACKLOG
+    request_deadline: float | None = None
+    keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT
+    max_sessions: int = DEFAULT_MAX_SESSIONS
     lsp_client: Any = field(default=None, init=False)
+    ctx_handler: CtxRequestHandler | None = field(default=None, init=False)
+    _request_executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _sessions: dict[Any, threading.Thread] = field(default_factory=dict, init=False, repr=False)
+    _sessions_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _ctx_handler_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
     server: socket.socket | None = field(default=None, init=False)
     running: bool = field(default=True, init=False)
     start_time: float = field(default=0.0, init=False)
@@ -58,7 +92,19 @@ class DaemonRunner:
 
         ttl_env = os.environ.get("TRIFECTA_DAEMON_TTL")
         ttl_seconds = int(ttl_env) if ttl_env else 0
-        return cls(runtime_dir=runtime_dir, repo_root=repo_root, ttl_seconds=ttl_seconds)
+        workers_env = os.environ.get("TRIFECTA_DAEMON_WORKERS")
+        backlog_env = os.environ.get("TRIFECTA_DAEMON_BACKLOG")
+        deadline_env = os.environ.get("TRIFECTA_DAEMON_DEADLINE")
+        sessions_env = os.environ.get("TRIFECTA_DAEMON_SESSIONS")
+        return cls(
+            runtime_dir=runtime_dir,
+            repo_root=repo_root,
+            ttl_seconds=ttl_seconds,
+            max_workers=max(1, int(workers_env)) if workers_env else DEFAULT_MAX_WORKERS,
+            backlog=max(1, int(backlog_env)) if backlog_env else DEFAULT_BACKLOG,
+            request_deadline=float(deadline_env) if deadline_env else None,
+            max_sessions=max(0, int(sessions_env)) if sessions_env else DEFAULT_MAX_SESSIONS,
+        )
 
     @property
     def socket_path(self) -> Path:
@@ -70,7 +116,7 @@ class DaemonRunner:
 
     def run(self) -> None:
         try:
-            self.server = create_server(self.socket_path, self.pid_path)
+            self.server = create_server(self.socket_path, self.pid_path, self.backlog)
         except Exception as exc:
             raise RuntimeError(f"Failed to initialize daemon socket: {exc}") from exc
 
@@ -79,6 +125,14 @@ class DaemonRunner:
         self._initialize_lsp_client()
         self._emit_daemon_status()
 
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="daemon-conn"
+        )
+        # Pipelined and batched requests run here, so a keep-alive connection
+        # never waits on a worker its own reader thread is holding
+        self._request_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="daemon-req"
+        )
         try:
             while self.running:
                 if self.ttl_seconds > 0 and (time.time() - self.start_time) > self.ttl_seconds:
@@ -86,13 +140,20 @@ class DaemonRunner:
 
                 try:
                     conn, _ = self.server.accept()
-                    self._handle_connection(conn)
                 except socket.timeout:
                     continue
                 except Exception as exc:
                     sys.stderr.write(f"Daemon error: {exc}\n")
                     break
+                executor.submit(self._serve_connection, conn)
         finally:
+            # Idle sessions end within a poll interval; in-flight requests finish
+            # (bounded by their deadlines) before the LSP client and socket go away
+            self.running = False
+            executor.shutdown(wait=True)
+            self._close_sessions()
+            self._request_executor.shutdown(wait=True)
+            self._request_executor = None
             self.shutdown()
 
     def shutdown(self) -> None:
@@ -119,6 +180,21 @@ class DaemonRunner:
         except Exception:
             self.lsp_client = None
 
+    def _get_ctx_handler(self) -> CtxRequestHandler:
+        # Created on first use: pack, aliases and anchors then stay warm
+        with self._ctx_handler_lock:
+            if self.ctx_handler is None:
+                self.ctx_handler = CtxRequestHandler(self.repo_root)
+            return self.ctx_handler
+
+    def _request_deadline(self, payload: dict[str, Any]) -> float | None:
+        """Per-request LSP deadline: ``deadline_ms`` in the request, else the daemon default."""
+        deadline_ms = payload.get("deadline_ms")
+        if isinstance(deadline_ms, (int, float)) and not isinstance(deadline_ms, bool):
+            if deadline_ms > 0:
+                return deadline_ms / 1000.0
+        return self.request_deadline
+
     def _emit_daemon_status(self) -> None:
         try:
             telem = Telemetry(self.runtime_dir)
@@ -151,39 +227,206 @@ class DaemonRunner:
         finally:
             self._safe_close_connection(conn)
 
-    def _handle_connection(self, conn: Any) -> None:
-        conn.settimeout(5.0)
+    def _serve_connection(self, conn: Any) -> None:
+        # Worker-thread entry point: errors must not escape into the pool
         try:
-            read_result = read_request(conn, MAX_REQUEST_SIZE)
-            if not read_result.raw_data:
-                self._safe_close_connection(conn)
-                return
-            if read_result.oversized:
-                self._safe_send_and_close(conn, build_request_too_large_response())
-                return
-
-            data = decode_request(read_result.raw_data)
+            self._handle_connection(conn)
+        except Exception as exc:
+            sys.stderr.write(f"Daemon error: {exc}\n")
+            self._safe_close_connection(conn)
+
+    def _close_sessions(self) -> None:
+        # Wakes every session blocked in recv; replies in flight can still be sent
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+        for conn, _ in sessions:
+            try:
+                conn.shutdown(socket.SHUT_RD)
+            except Exception:
+                pass
+        for _, thread in sessions:
+            thread.join()
+
+    def _next_request(self, reader: RequestReader) -> ParsedRequest | bytes | None:
+        """Read and parse the next request.
+
+        Returns the error reply to end the connection with if the request is
+        oversized or unreadable, and None on EOF. ``socket.timeout`` propagates.
+        """
+        try:
+            read_result = reader.read()
         except socket.timeout:
-            self._safe_send_and_close(conn, build_text_response("ERROR: Timeout"))
-            return
+            raise
         except Exception as exc:
-            self._safe_send_and_close(conn, build_text_response(f"ERROR: {str(exc)}"))
+            return build_text_response(f"ERROR: {str(exc)}")
+        if not read_result.raw_data:
+            return None
+        if read_result.oversized:
+            return build_request_too_large_response()
+        return parse_request(decode_request(read_result.raw_data))
+
+    def _read_parsed(self, conn: Any, reader: RequestReader) -> ParsedRequest | None:
+        """Read and parse the next request; None once the connection is done with."""
+        try:
+            parsed = self._next_request(reader)
+        except socket.timeout:
+            parsed = build_text_response("ERROR: Timeout")
+        if isinstance(parsed, bytes):
+            self._safe_send_and_close(conn, parsed)
+            return None
+        if parsed is None:
+            self._safe_close_connection(conn)
+        return parsed
+
+    def _handle_connection(self, conn: Any) -> None:
+        conn.settimeout(5.0)
+        reader = RequestReader(conn, MAX_REQUEST_SIZE)
+        parsed = self._read_parsed(conn, reader)
+        if parsed is None:
+            return
+
+        if _opens_keep_alive(parsed) and self._open_session(conn, reader, parsed):
             return
 
-        parsed = parse_request(data)
         if parsed["kind"] == "json":
-            response = handle_lsp_request(parsed["payload"], self.lsp_client)
+            payload = parsed["payload"]
+            response = with_request_id(payload, self._dispatch_json(payload))
             self._safe_send_and_close(conn, build_json_response(response))
             return
 
+        if parsed["kind"] == "batch":
+            responses = self._dispatch_batch(parsed["items"])
+            self._safe_send_and_close(conn, build_json_response(responses))
+            return
+
         if parsed["kind"] == "empty":
             self._safe_close_connection(conn)
             return
 
-        command = parsed["command"]
+        self._safe_send_and_close(conn, self._handle_command(parsed["command"]))
+
+    def _open_session(self, conn: Any, reader: RequestReader, first: ParsedRequest) -> bool:
+        """Hand a keep-alive connection to its own session thread.
+
+        An idle session must not hold a pool worker, or a few idle clients
+        would starve everyone else. Returns False when the session cap is
+        reached; the caller then answers the request one-shot.
+        """
+        if self._request_executor is None:
+            # Not started by run(): serve the session inline
+            self._serve_keep_alive(conn, reader, first)
+            return True
+        with self._sessions_lock:
+            if not self.running or len(self._sessions) >= self.max_sessions:
+                return False
+            thread = threading.Thread(
+                target=self._run_session,
+                args=(conn, reader, first),
+                name="daemon-session",
+                daemon=True,
+            )
+            self._sessions[conn] = thread
+        thread.start()
+        return True
+
+    def _run_session(self, conn: Any, reader: RequestReader, first: ParsedRequest) -> None:
+        try:
+            self._serve_keep_alive(conn, reader, first)
+        except Exception as exc:
+            sys.stderr.write(f"Daemon error: {exc}\n")
+            self._safe_close_connection(conn)
+        finally:
+            with self._sessions_lock:
+                self._sessions.pop(conn, None)
+
+    def _serve_keep_alive(self, conn: Any, reader: RequestReader, first: ParsedRequest) -> None:
+        """Serve pipelined requests on one connection until EOF, idle timeout or stop.
+
+        JSON requests run concurrently and their responses carry the request
+        ``id``, so they may arrive out of order. Batches and text commands
+        are answered in place.
+        """
+        send_lock = threading.Lock()
+        # Only unfinished requests are tracked: a session may serve many
+        in_flight: set[Future[None]] = set()
+
+        def reply(data: bytes) -> None:
+            with send_lock:
+                try:
+                    conn.sendall(data)
+                except Exception as exc:
+                    sys.stderr.write(f"Daemon connection send failed: {exc}\n")
+
+        def answer(payload: dict[str, Any]) -> None:
+            reply(build_json_response(with_request_id(payload, self._dispatch_json(payload))))
+
+        conn.settimeout(SESSION_POLL_INTERVAL)
+        parsed: ParsedRequest | bytes | None = first
+        while parsed is not None and not isinstance(parsed, bytes):
+            if parsed["kind"] == "json":
+                future = self._submit_request(answer, parsed["payload"])
+                in_flight.add(future)
+                future.add_done_callback(in_flight.discard)
+            elif parsed["kind"] == "batch":
+                reply(build_json_response(self._dispatch_batch(parsed["items"])))
+            elif parsed["kind"] == "text":
+                reply(self._handle_command(parsed["command"]))
+                if not self.running:
+                    break
+            parsed = self._read_keep_alive(reader)
+
+        wait(list(in_flight))
+        if isinstance(parsed, bytes):
+            reply(parsed)
+        self._safe_close_connection(conn)
+
+    def _read_keep_alive(self, reader: RequestReader) -> ParsedRequest | bytes | None:
+        """Next request on a session, polling so that a stop is noticed while idle.
+
+        EOF, the idle timeout and a stop end the session quietly (None); an
+        oversized or unreadable request ends it with the same error reply as
+        a one-shot connection.
+        """
+        idle_deadline = time.monotonic() + self.keep_alive_timeout
+        while self.running:
+            try:
+                return self._next_request(reader)
+            except socket.timeout:
+                if time.monotonic() >= idle_deadline:
+                    return None
+        return None
+
+    def _submit_request(self, fn: Callable[..., None], *args: Any) -> Future[None]:
+        if self._request_executor is not None:
+            return self._request_executor.submit(fn, *args)
+        future: Future[None] = Future()
+        fn(*args)
+        future.set_result(None)
+        return future
+
+    def _dispatch_json(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if is_ctx_method(str(payload.get("method", ""))):
+            return self._get_ctx_handler().handle(payload)
+        return handle_lsp_request(
+            payload, self.lsp_client, timeout=self._request_deadline(payload)
+        )
+
+    def _dispatch_batch(self, items: list[Any]) -> list[dict[str, Any]]:
+        """Run batch items concurrently; responses keep the batch order."""
+
+        def run_item(item: Any) -> dict[str, Any]:
+            if not isinstance(item, dict) or "method" not in item:
+                return {"status": "error", "message": "Invalid batch item"}
+            return with_request_id(item, self._dispatch_json(item))
+
+        if self._request_executor is None:
+            return [run_item(item) for item in items]
+        return list(self._request_executor.map(run_item, items))
+
+    def _handle_command(self, command: str) -> bytes:
         if command == "PING":
-            self._safe_send_and_close(conn, build_text_response("PONG"))
-        elif command == "HEALTH":
+            return build_text_response("PONG")
+        if command == "HEALTH":
             lsp_state = self.lsp_client.state.value if self.lsp_client else "unavailable"
             payload = build_health_payload(
                 pid=os.getpid(),
@@ -191,9 +434,17 @@ class DaemonRunner:
                 lsp_state=lsp_state,
                 lsp_enabled=self.lsp_client is not None,
             )
-            self._safe_send_and_close(conn, build_json_response(payload))
-        elif command == "SHUTDOWN":
-            self._safe_send_and_close(conn, build_text_response("OK"))
+            return build_json_response(payload)
+        if command == "SHUTDOWN":
             self.running = False
-        else:
-            self._safe_send_and_close(conn, build_text_response("ERROR: Unknown command"))
+            return build_text_response("OK")
+        return build_text_response("ERROR: Unknown command")
+
+
+def _opens_keep_alive(parsed: ParsedRequest) -> bool:
+    # Request ids opt a connection into keep-alive; id-less requests stay one-shot
+    if parsed["kind"] == "json":
+        return "id" in parsed["payload"]
+    if parsed["kind"] == "batch":
+        return any(isinstance(item, dict) and "id" in item for item in parsed["items"])
+    return False
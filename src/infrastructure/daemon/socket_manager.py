@@ -3,6 +3,8 @@ import socket
 import stat
 from pathlib import Path
 
+DEFAULT_BACKLOG = 64
+
 
 def cleanup_runtime_artifacts(socket_path: Path, pid_path: Path) -> None:
     for path in (socket_path, pid_path):
@@ -20,7 +22,9 @@ def close_server(server: object | None) -> None:
         close_method()
 
 
-def create_server(socket_path: Path, pid_path: Path) -> socket.socket:
+def create_server(
+    socket_path: Path, pid_path: Path, backlog: int = DEFAULT_BACKLOG
+) -> socket.socket:
     socket_path.parent.mkdir(parents=True, exist_ok=True)
     server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
 
@@ -29,7 +33,7 @@ def create_server(socket_path: Path, pid_path: Path) -> socket.socket:
             socket_path.unlink()
         server.bind(str(socket_path))
         os.chmod(socket_path, stat.S_IRUSR | stat.S_IWUSR)
-        server.listen(1)
+        server.listen(backlog)
         server.settimeout(1.0)
         pid_path.write_text(str(os.getpid()))
     except Exception:
@@ -97,10 +97,18 @@ class FileLockedAstCache:
         """Get value from cache with file lock."""
         return self._with_lock("get", lambda: self._inner.get(key))
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get many values under a single file lock acquisition."""
+        return self._with_lock("get_many", lambda: self._inner.get_many(keys))
+
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with file lock."""
         self._with_lock("set", lambda: self._inner.set(key, value))
 
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Set many values under a single file lock acquisition."""
+        self._with_lock("set_many", lambda: self._inner.set_many(items))
+
     def delete(self, key: str) -> bool:
         """Delete value from cache with file lock."""
         return self._with_lock("delete", lambda: self._inner.delete(key))
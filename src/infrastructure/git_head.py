@@ -0,0 +1,143 @@
+"""Checked-out commit SHA read straight from .git, cached per process.
+
+Resolves HEAD the way ``git rev-parse HEAD`` does for the common layouts
+(loose refs, packed-refs, detached HEAD, linked worktrees) without spawning
+git. Results are cached per git directory and revalidated with a few stat()
+calls: the cache is invalidated only when the mtime of HEAD, the loose ref
+file it points to, or packed-refs changes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+_SHA_HEX_LENGTHS = (40, 64)  # SHA-1 and SHA-256 repositories
+
+# git dir -> (stat signature, ref name or None if detached, resolved SHA or None)
+_HEAD_CACHE: dict[Path, tuple[tuple[int, int, int], str | None, str | None]] = {}
+_GIT_DIR_CACHE: dict[str, Path] = {}
+_lock = threading.Lock()
+
+
+def find_git_dir(start: Path) -> Path | None:
+    """Nearest .git directory at or above ``start`` (following worktree .git files)."""
+    key = str(start)
+    with _lock:
+        cached = _GIT_DIR_CACHE.get(key)
+    if cached is not None and (cached / "HEAD").is_file():
+        return cached
+
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        git_dir: Path | None
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            git_dir = _read_gitdir_file(dot_git)
+            if git_dir is None:
+                continue
+        else:
+            continue
+        if (git_dir / "HEAD").is_file():
+            with _lock:
+                _GIT_DIR_CACHE[key] = git_dir
+            return git_dir
+    return None
+
+
+def read_head_sha(start: Path | None = None) -> str | None:
+    """Full SHA of HEAD for the repository containing ``start`` (default: cwd).
+
+    Returns None outside a git repository, on an unborn branch, or when the
+    ref cannot be resolved from the files.
+    """
+    git_dir = find_git_dir(start or Path.cwd())
+    if git_dir is None:
+        return None
+
+    head_mtime = _mtime_ns(git_dir / "HEAD")
+    with _lock:
+        cached = _HEAD_CACHE.get(git_dir)
+    if cached is not None and cached[0][0] == head_mtime:
+        signature, ref, sha = cached
+        if ref is None or _ref_signature(git_dir, ref, head_mtime) == signature:
+            return sha
+
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        signature = _ref_signature(git_dir, ref, head_mtime)
+        sha = _resolve_ref(git_dir, ref)
+    else:
+        ref = None
+        signature = (head_mtime, -1, -1)
+        sha = head if _is_sha(head) else None
+
+    with _lock:
+        _HEAD_CACHE[git_dir] = (signature, ref, sha)
+    return sha
+
+
+def _read_gitdir_file(dot_git: Path) -> Path | None:
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:") :].strip())
+    return git_dir if git_dir.is_absolute() else (dot_git.parent / git_dir).resolve()
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Directory holding shared refs (differs from git_dir in linked worktrees)."""
+    try:
+        common = (git_dir / "commondir").read_text().strip()
+    except OSError:
+        return git_dir
+    common_path = Path(common)
+    return common_path if common_path.is_absolute() else (git_dir / common_path).resolve()
+
+
+def _ref_signature(git_dir: Path, ref: str, head_mtime: int) -> tuple[int, int, int]:
+    common = _common_dir(git_dir)
+    loose = git_dir / ref if (git_dir / ref).exists() else common / ref
+    return head_mtime, _mtime_ns(loose), _mtime_ns(common / "packed-refs")
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> str | None:
+    common = _common_dir(git_dir)
+    for loose in (git_dir / ref, common / ref):
+        try:
+            value = loose.read_text().strip()
+        except OSError:
+            continue
+        return value if _is_sha(value) else None
+
+    try:
+        packed = (common / "packed-refs").read_text()
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name.strip() == ref and _is_sha(sha):
+            return sha
+    return None
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _is_sha(value: str) -> bool:
+    return len(value) in _SHA_HEX_LENGTHS and all(c in "0123456789abcdef" for c in value)
@@ -1,8 +1,9 @@
+import difflib
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.domain.graph_models import GraphEdge, GraphNode, GraphStatus
+from src.domain.graph_models import GraphEdge, GraphFileState, GraphNode, GraphStatus
 
 
 class GraphCommandError(ValueError):
@@ -135,6 +136,40 @@ class GraphStore:
     STATUS_REQUIRED_TABLES = ("graph_index", "nodes", "edges")
     SEARCH_REQUIRED_TABLES = ("nodes",)
     RELATION_REQUIRED_TABLES = ("nodes", "edges")
+    # Trigram index over nodes(symbol_name, qualified_name, file_rel), synced by triggers.
+    # Optional: SQLite builds without FTS5/trigram (and DBs opened read-only before it
+    # existed) fall back to a LIKE scan.
+    _FTS_SCHEMA = (
+        "CREATE VIRTUAL TABLE nodes_fts USING fts5("
+        "symbol_name, qualified_name, file_rel, "
+        "content='nodes', content_rowid='rowid', tokenize='trigram')",
+        "CREATE TRIGGER nodes_fts_insert AFTER INSERT ON nodes BEGIN "
+        "INSERT INTO nodes_fts(rowid, symbol_name, qualified_name, file_rel) "
+        "VALUES (new.rowid, new.symbol_name, new.qualified_name, new.file_rel); END",
+        "CREATE TRIGGER nodes_fts_delete AFTER DELETE ON nodes BEGIN "
+        "INSERT INTO nodes_fts(nodes_fts, rowid, symbol_name, qualified_name, file_rel) "
+        "VALUES ('delete', old.rowid, old.symbol_name, old.qualified_name, old.file_rel); END",
+        "CREATE TRIGGER nodes_fts_update AFTER UPDATE ON nodes BEGIN "
+        "INSERT INTO nodes_fts(nodes_fts, rowid, symbol_name, qualified_name, file_rel) "
+        "VALUES ('delete', old.rowid, old.symbol_name, old.qualified_name, old.file_rel); "
+        "INSERT INTO nodes_fts(rowid, symbol_name, qualified_name, file_rel) "
+        "VALUES (new.rowid, new.symbol_name, new.qualified_name, new.file_rel); END",
+        "INSERT INTO nodes_fts(nodes_fts) VALUES ('rebuild')",
+    )
+    # Exact name, then prefix, then a snake_case/camelCase token starting with the
+    # query, then any other substring of the name; path/qualified-name hits last.
+    _SEARCH_RANK = (
+        "CASE "
+        "WHEN n.symbol_name = :query COLLATE NOCASE THEN 0 "
+        "WHEN n.symbol_name LIKE :prefix ESCAPE '\\' THEN 1 "
+        "WHEN n.symbol_name LIKE :snake_token ESCAPE '\\' "
+        "OR n.symbol_name GLOB :camel_token THEN 2 "
+        "WHEN n.symbol_name LIKE :substring ESCAPE '\\' THEN 3 "
+        "ELSE 4 END"
+    )
+    FUZZY_MIN_RATIO = 0.75
+    FUZZY_CANDIDATES = 200
+    _PATH_CHUNK = 500
     _CALLERS_FOR_NODE_QUERY = (
         "SELECT n.* FROM nodes n "
         "JOIN edges e ON e.from_node_id = n.id "
@@ -305,10 +340,28 @@ class GraphStore:
                 "confidence REAL"
                 ")"
             )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "segment_id TEXT NOT NULL, "
+                "file_rel TEXT NOT NULL, "
+                "content_hash TEXT NOT NULL, "
+                "mtime_ns INTEGER, "
+                "size INTEGER, "
+                "PRIMARY KEY (segment_id, file_rel)"
+                ")"
+            )
+            # files tables created before stat columns existed: NULL stats just force a rehash
+            file_columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+            for column in ("mtime_ns", "size"):
+                if column not in file_columns:
+                    conn.execute(f"ALTER TABLE files ADD COLUMN {column} INTEGER")
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_nodes_segment_search "
                 "ON nodes(segment_id, symbol_name, qualified_name, file_rel)"
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_nodes_segment_file ON nodes(segment_id, file_rel)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_edges_segment_from "
                 "ON edges(segment_id, from_node_id)"
@@ -318,61 +371,86 @@ class GraphStore:
                 "ON edges(segment_id, to_node_id)"
             )
             conn.commit()
+            if "nodes_fts" not in self._list_tables(conn, self._segment_id):
+                self._init_fts(conn)
         except sqlite3.Error as exc:
             raise GraphStoreUnavailableError(self._segment_id, str(exc)) from exc
         finally:
             conn.close()
 
+    def _init_fts(self, conn: sqlite3.Connection) -> None:
+        # Also indexes nodes already present in a DB created before the FTS table.
+        try:
+            for statement in self._FTS_SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.OperationalError:
+            # No FTS5 or no trigram tokenizer in this SQLite build: search_nodes scans.
+            conn.rollback()
+
     def replace_segment(
         self,
         segment_id: str,
         nodes: list[GraphNode],
         edges: list[GraphEdge],
         indexed_at: str | None = None,
+        files: dict[str, GraphFileState] | None = None,
     ) -> None:
         timestamp = indexed_at or datetime.now(timezone.utc).isoformat()
         conn = self._connect(segment_id)
         try:
             conn.execute("DELETE FROM edges WHERE segment_id = ?", (segment_id,))
             conn.execute("DELETE FROM nodes WHERE segment_id = ?", (segment_id,))
-            conn.execute(
-                "INSERT OR REPLACE INTO graph_index(segment_id, indexed_at) VALUES (?, ?)",
-                (segment_id, timestamp),
+            conn.execute("DELETE FROM files WHERE segment_id = ?", (segment_id,))
+            self._write_index(conn, segment_id, nodes, edges, timestamp, files or {})
+            conn.commit()
+        except sqlite3.Error as exc:
+            raise GraphStoreUnavailableError(segment_id, str(exc)) from exc
+        finally:
+            conn.close()
+
+    def replace_files(
+        self,
+        segment_id: str,
+        files: dict[str, GraphFileState],
+        removed_files: list[str],
+        nodes: list[GraphNode],
+        edges: list[GraphEdge],
+        indexed_at: str | None = None,
+        restamped: dict[str, GraphFileState] | None = None,
+    ) -> None:
+        """Swap the graph of the given files only, leaving the rest of the segment intact.
+
+        ``files`` maps each (re)parsed file to its new state;
+        ``nodes``/``edges`` are their complete new graph. Nodes of those files
+        and of ``removed_files`` are dropped together with every edge touching
+        them, in a single transaction. ``restamped`` files kept their content
+        and only get their stored stat refreshed.
+        """
+        timestamp = indexed_at or datetime.now(timezone.utc).isoformat()
+        stale = [
+            {"segment_id": segment_id, "file_rel": file_rel}
+            for file_rel in [*files, *removed_files]
+        ]
+        file_node_ids = (
+            "SELECT id FROM nodes WHERE segment_id = :segment_id AND file_rel = :file_rel"
+        )
+        conn = self._connect(segment_id)
+        try:
+            conn.executemany(
+                "DELETE FROM edges WHERE segment_id = :segment_id AND ("
+                f"from_node_id IN ({file_node_ids}) OR to_node_id IN ({file_node_ids})"
+                ")",
+                stale,
             )
             conn.executemany(
-                "INSERT OR REPLACE INTO nodes("
-                "id, segment_id, file_rel, symbol_name, qualified_name, kind, line, metadata_json"
-                ") VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                [
-                    (
-                        node.id,
-                        node.segment_id,
-                        node.file_rel,
-                        node.symbol_name,
-                        node.qualified_name,
-                        node.kind,
-                        node.line,
-                        node.metadata_json,
-                    )
-                    for node in nodes
-                ],
+                "DELETE FROM nodes WHERE segment_id = :segment_id AND file_rel = :file_rel", stale
             )
             conn.executemany(
-                "INSERT OR REPLACE INTO edges("
-                "id, segment_id, from_node_id, to_node_id, edge_kind, source, confidence"
-                ") VALUES (?, ?, ?, ?, ?, ?, ?)",
-                [
-                    (
-                        edge.id,
-                        edge.segment_id,
-                        edge.from_node_id,
-                        edge.to_node_id,
-                        edge.edge_kind,
-                        edge.source,
-                        edge.confidence,
-                    )
-                    for edge in edges
-                ],
+                "DELETE FROM files WHERE segment_id = :segment_id AND file_rel = :file_rel", stale
+            )
+            self._write_index(
+                conn, segment_id, nodes, edges, timestamp, {**(restamped or {}), **files}
             )
             conn.commit()
         except sqlite3.Error as exc:
@@ -380,6 +458,85 @@ class GraphStore:
         finally:
             conn.close()
 
+    def get_file_states(self, segment_id: str) -> dict[str, GraphFileState]:
+        conn = self._connect(segment_id)
+        try:
+            rows = conn.execute(
+                "SELECT file_rel, content_hash, mtime_ns, size FROM files WHERE segment_id = ?",
+                (segment_id,),
+            ).fetchall()
+        except sqlite3.Error as exc:
+            raise GraphStoreUnavailableError(segment_id, str(exc)) from exc
+        finally:
+            conn.close()
+        return {
+            str(file_rel): GraphFileState(str(content_hash), mtime_ns, size)
+            for file_rel, content_hash, mtime_ns, size in rows
+        }
+
+    @staticmethod
+    def _write_index(
+        conn: sqlite3.Connection,
+        segment_id: str,
+        nodes: list[GraphNode],
+        edges: list[GraphEdge],
+        timestamp: str,
+        files: dict[str, GraphFileState],
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO graph_index(segment_id, indexed_at) VALUES (?, ?)",
+            (segment_id, timestamp),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO files(segment_id, file_rel, content_hash, mtime_ns, size) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (segment_id, file_rel, state.content_hash, state.mtime_ns, state.size)
+                for file_rel, state in files.items()
+            ],
+        )
+        # An upsert, not INSERT OR REPLACE: REPLACE deletes the old row without firing
+        # the nodes_fts delete trigger and would leave a stale index entry behind.
+        conn.executemany(
+            "INSERT INTO nodes("
+            "id, segment_id, file_rel, symbol_name, qualified_name, kind, line, metadata_json"
+            ") VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "segment_id = excluded.segment_id, file_rel = excluded.file_rel, "
+            "symbol_name = excluded.symbol_name, qualified_name = excluded.qualified_name, "
+            "kind = excluded.kind, line = excluded.line, metadata_json = excluded.metadata_json",
+            [
+                (
+                    node.id,
+                    node.segment_id,
+                    node.file_rel,
+                    node.symbol_name,
+                    node.qualified_name,
+                    node.kind,
+                    node.line,
+                    node.metadata_json,
+                )
+                for node in nodes
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO edges("
+            "id, segment_id, from_node_id, to_node_id, edge_kind, source, confidence"
+            ") VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    edge.id,
+                    edge.segment_id,
+                    edge.from_node_id,
+                    edge.to_node_id,
+                    edge.edge_kind,
+                    edge.source,
+                    edge.confidence,
+                )
+                for edge in edges
+            ],
+        )
+
     def get_status(self, segment_id: str) -> GraphStatus:
         conn = self._connect(segment_id)
         try:
@@ -409,25 +566,77 @@ class GraphStore:
         )
 
     def search_nodes(self, segment_id: str, query: str, limit: int = 20) -> list[GraphNode]:
-        pattern = f"%{query.lower()}%"
+        """Nodes whose name, qualified name or path contains ``query``, best matches first.
+
+        Uses the trigram index when present (queries of 3+ characters) and falls
+        back to a LIKE scan otherwise. With no substring match at all, returns
+        typo-tolerant matches on the symbol name (trigram index only).
+        """
+        params = self._search_params(segment_id, query, limit)
         conn = self._connect(segment_id)
         conn.row_factory = sqlite3.Row
         try:
+            use_fts = len(query) >= 3 and "nodes_fts" in self._list_tables(conn, segment_id)
+            if use_fts:
+                params["match"] = self._fts_phrase(query)
+                candidates = "n.rowid IN (SELECT rowid FROM nodes_fts WHERE nodes_fts MATCH :match)"
+            else:
+                candidates = (
+                    "(n.symbol_name LIKE :substring ESCAPE '\\' "
+                    "OR n.qualified_name LIKE :substring ESCAPE '\\' "
+                    "OR n.file_rel LIKE :substring ESCAPE '\\')"
+                )
             rows = conn.execute(
-                "SELECT * FROM nodes "
-                "WHERE segment_id = ? AND ("
-                "lower(symbol_name) LIKE ? OR lower(qualified_name) LIKE ? OR lower(file_rel) LIKE ?"
-                ") "
-                "ORDER BY CASE WHEN lower(symbol_name) = ? THEN 0 ELSE 1 END, file_rel, line "
-                "LIMIT ?",
-                (segment_id, pattern, pattern, pattern, query.lower(), limit),
+                f"SELECT n.* FROM nodes n WHERE n.segment_id = :segment_id AND {candidates} "
+                f"ORDER BY {self._SEARCH_RANK}, n.file_rel, n.line LIMIT :limit",
+                params,
             ).fetchall()
+            if not rows and use_fts:
+                rows = self._fuzzy_search_rows(conn, segment_id, query, limit)
         except sqlite3.Error as exc:
             raise GraphStoreUnavailableError(segment_id, str(exc)) from exc
         finally:
             conn.close()
         return [self._row_to_node(row) for row in rows]
 
+    def _fuzzy_search_rows(
+        self, conn: sqlite3.Connection, segment_id: str, query: str, limit: int
+    ) -> list[sqlite3.Row]:
+        folded = query.lower()
+        trigrams = sorted({folded[i : i + 3] for i in range(len(folded) - 2)})
+        match = "symbol_name : (" + " OR ".join(self._fts_phrase(t) for t in trigrams) + ")"
+        candidates = conn.execute(
+            "SELECT n.* FROM nodes_fts f JOIN nodes n ON n.rowid = f.rowid "
+            "WHERE nodes_fts MATCH ? AND n.segment_id = ? ORDER BY f.rank LIMIT ?",
+            (match, segment_id, self.FUZZY_CANDIDATES),
+        ).fetchall()
+        scored = []
+        for row in candidates:
+            ratio = difflib.SequenceMatcher(None, folded, row["symbol_name"].lower()).ratio()
+            if ratio >= self.FUZZY_MIN_RATIO:
+                scored.append((-ratio, row["file_rel"], row["line"], row))
+        scored.sort(key=lambda item: item[:3])
+        return [row for *_, row in scored[:limit]]
+
+    @staticmethod
+    def _search_params(segment_id: str, query: str, limit: int) -> dict[str, object]:
+        like = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        camel = query[:1].upper() + query[1:]
+        glob = "".join(f"[{char}]" if char in "*?[" else char for char in camel)
+        return {
+            "segment_id": segment_id,
+            "query": query,
+            "limit": limit,
+            "prefix": f"{like}%",
+            "substring": f"%{like}%",
+            "snake_token": f"%\\_{like}%",
+            "camel_token": f"*{glob}*",
+        }
+
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
+
     def get_callers(self, segment_id: str, symbol: str) -> list[GraphNode]:
         target_node = self._resolve_target_node(segment_id, symbol)
         return self.get_callers_for_node(segment_id, target_node.id)
@@ -442,6 +651,107 @@ class GraphStore:
     def get_callees_for_node(self, segment_id: str, node_id: str) -> list[GraphNode]:
         return self._get_related_nodes_for_node(segment_id, node_id, reverse=False)
 
+    def traverse_calls(
+        self,
+        segment_id: str,
+        node_id: str,
+        *,
+        reverse: bool,
+        max_depth: int,
+        limit: int,
+    ) -> list[tuple[GraphNode, int]]:
+        """Transitive callers (``reverse``) or callees of a node up to ``max_depth`` hops.
+
+        Each reachable node is returned once with its shortest hop count, ordered
+        by depth, file and line. Cycles cannot loop: the recursive step is bounded
+        by depth and UNION drops repeated (node, depth) pairs. At most ``limit``
+        rows are returned.
+        """
+        near, far = ("to_node_id", "from_node_id") if reverse else ("from_node_id", "to_node_id")
+        conn = self._connect(segment_id)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                "WITH RECURSIVE reach(id, depth) AS ("
+                "SELECT :node_id, 0 "
+                "UNION "
+                f"SELECT e.{far}, reach.depth + 1 FROM reach "
+                f"JOIN edges e ON e.{near} = reach.id "
+                "WHERE e.segment_id = :segment_id AND e.edge_kind = 'calls' "
+                "AND reach.depth < :max_depth"
+                ") "
+                "SELECT n.*, MIN(reach.depth) AS depth FROM reach "
+                "JOIN nodes n ON n.id = reach.id "
+                "WHERE n.segment_id = :segment_id AND n.id != :node_id "
+                "GROUP BY n.id ORDER BY depth, n.file_rel, n.line LIMIT :limit",
+                {
+                    "node_id": node_id,
+                    "segment_id": segment_id,
+                    "max_depth": max_depth,
+                    "limit": limit,
+                },
+            ).fetchall()
+        except sqlite3.Error as exc:
+            raise GraphStoreUnavailableError(segment_id, str(exc)) from exc
+        finally:
+            conn.close()
+        return [(self._row_to_node(row), int(row["depth"])) for row in rows]
+
+    def find_call_path(
+        self,
+        segment_id: str,
+        from_node_id: str,
+        to_node_id: str,
+        *,
+        max_depth: int,
+    ) -> list[GraphNode] | None:
+        """Shortest chain of calls from one node to another, or None within ``max_depth``."""
+        parents: dict[str, str | None] = {from_node_id: None}
+        frontier = [from_node_id]
+        conn = self._connect(segment_id)
+        conn.row_factory = sqlite3.Row
+        try:
+            for _ in range(max_depth):
+                if to_node_id in parents or not frontier:
+                    break
+                level, frontier = frontier, []
+                for start in range(0, len(level), self._PATH_CHUNK):
+                    chunk = level[start : start + self._PATH_CHUNK]
+                    # Sorted here, not in SQL: an ORDER BY lets the planner pick the
+                    # to_node_id index and scan every edge of the segment.
+                    edges = conn.execute(
+                        "SELECT from_node_id, to_node_id FROM edges "
+                        "WHERE segment_id = ? AND edge_kind = 'calls' "
+                        f"AND from_node_id IN ({', '.join('?' * len(chunk))})",
+                        (segment_id, *chunk),
+                    ).fetchall()
+                    for caller_id, callee_id in sorted(tuple(edge) for edge in edges):
+                        if callee_id not in parents:
+                            parents[callee_id] = caller_id
+                            frontier.append(callee_id)
+            if to_node_id not in parents:
+                return None
+
+            chain: list[str] = []
+            current: str | None = to_node_id
+            while current is not None:
+                chain.append(current)
+                current = parents[current]
+            chain.reverse()
+            # Primary-key lookups only; a segment_id term would steer the planner
+            # to the (segment_id, ...) indexes instead.
+            rows = conn.execute(
+                f"SELECT * FROM nodes WHERE id IN ({', '.join('?' * len(chain))})", chain
+            ).fetchall()
+        except sqlite3.Error as exc:
+            raise GraphStoreUnavailableError(segment_id, str(exc)) from exc
+        finally:
+            conn.close()
+        nodes_by_id = {
+            row["id"]: self._row_to_node(row) for row in rows if row["segment_id"] == segment_id
+        }
+        return [nodes_by_id[node_id] for node_id in chain if node_id in nodes_by_id]
+
     def find_target_candidates(self, segment_id: str, symbol: str) -> list[GraphNode]:
         conn = self._connect(segment_id)
         conn.row_factory = sqlite3.Row
@@ -64,6 +64,8 @@ class LSPClient:
         self._next_id = 1000
         self._pending_requests: Dict[int, Any] = {}
         self._request_events: Dict[int, threading.Event] = {}
+        # Concurrent daemon requests share stdin; one framed message at a time
+        self._write_lock = threading.Lock()
 
     def start(self) -> None:
         """Start LSP server in background."""
@@ -522,8 +524,9 @@ class LSPClient:
         try:
             content = json.dumps(msg).encode("utf-8")
             header = f"Content-Length: {len(content)}\r\n\r\n".encode("ascii")
-            self.process.stdin.write(header + content)
-            self.process.stdin.flush()
+            with self._write_lock:
+                self.process.stdin.write(header + content)
+                self.process.stdin.flush()
             return True
         except (OSError, ValueError, BrokenPipeError):
             # Silently ignore write errors during shutdown
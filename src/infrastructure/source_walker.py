@@ -0,0 +1,160 @@
+"""Single-pass, pruning source discovery for segment indexing.
+
+``Path.glob`` walks the tree once per pattern and only filters excluded
+directories after the fact, so ``.git``/``.venv``/``node_modules`` are
+traversed repeatedly. ``walk_sources`` compiles every include pattern into one
+matcher, walks the tree once with ``os.scandir`` and never descends into an
+excluded directory or into a directory no pattern can reach.
+
+Patterns use pathlib glob syntax relative to the root: ``*`` and ``?`` match
+within one path component and ``**`` matches zero or more directories
+(character classes are not supported).
+Matching is case-sensitive and does not follow directory symlinks, like
+``Path.glob`` with ``**``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".venv",
+        "node_modules",
+        "dist",
+        "build",
+        "_ctx",
+        "__pycache__",
+        ".pytest_cache",
+    }
+)
+
+_WILDCARD_CHARS = frozenset("*?")
+
+
+def _translate_segment(segment: str) -> str:
+    out: list[str] = []
+    for char in segment:
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        else:
+            out.append(re.escape(char))
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class _CompiledPattern:
+    """One include pattern: regex plus the literal directory prefix it lives under."""
+
+    regex: re.Pattern[str]
+    prefix: tuple[str, ...]
+    recursive: bool
+    depth: int
+
+    @classmethod
+    def compile(cls, pattern: str) -> "_CompiledPattern":
+        segments = [segment for segment in pattern.split("/") if segment]
+        if not segments:
+            raise ValueError(f"Empty source pattern: {pattern!r}")
+
+        prefix: list[str] = []
+        for segment in segments[:-1]:
+            if segment == "**" or _WILDCARD_CHARS.intersection(segment):
+                break
+            prefix.append(segment)
+
+        parts: list[str] = []
+        for index, segment in enumerate(segments):
+            if segment == "**":
+                # "**/" matches zero or more whole directories
+                parts.append("(?:[^/]+/)*")
+                continue
+            parts.append(_translate_segment(segment))
+            if index < len(segments) - 1:
+                parts.append("/")
+        return cls(
+            regex=re.compile("".join(parts) + r"\Z"),
+            prefix=tuple(prefix),
+            recursive="**" in segments,
+            depth=len(segments) - 1,
+        )
+
+    def may_contain(self, dir_parts: tuple[str, ...]) -> bool:
+        """True if files in or below ``dir_parts`` (relative to the root) can match."""
+        shared = min(len(dir_parts), len(self.prefix))
+        if dir_parts[:shared] != self.prefix[:shared]:
+            return False
+        return self.recursive or len(dir_parts) <= self.depth
+
+
+class SourceMatcher:
+    """All include patterns and excluded directory names compiled once."""
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        exclude_dirs: Collection[str] = DEFAULT_EXCLUDE_DIRS,
+    ) -> None:
+        self.patterns = [_CompiledPattern.compile(pattern) for pattern in patterns]
+        self.exclude_dirs = frozenset(exclude_dirs)
+
+    def match(self, rel_path: str) -> int | None:
+        """Index of the first pattern matching a root-relative POSIX path."""
+        for index, pattern in enumerate(self.patterns):
+            if pattern.regex.match(rel_path):
+                return index
+        return None
+
+    def should_descend(self, dir_parts: tuple[str, ...]) -> bool:
+        if dir_parts and dir_parts[-1] in self.exclude_dirs:
+            return False
+        return any(pattern.may_contain(dir_parts) for pattern in self.patterns)
+
+
+def walk_sources(
+    root: Path,
+    patterns: Sequence[str],
+    exclude_dirs: Collection[str] = DEFAULT_EXCLUDE_DIRS,
+) -> list[Path]:
+    """Files under ``root`` matching any pattern, in a single pruned walk.
+
+    Results are ordered by the first pattern each file matches, then by path,
+    so callers that treat earlier patterns as higher priority keep doing so.
+    Every file is returned once even if several patterns match it.
+    """
+    matcher = SourceMatcher(patterns, exclude_dirs)
+    matches: list[tuple[int, tuple[str, ...], Path]] = []
+    if not matcher.should_descend(()):
+        return []
+
+    stack: list[tuple[str, tuple[str, ...]]] = [(os.fspath(root), ())]
+    while stack:
+        dir_path, dir_parts = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    parts = (*dir_parts, entry.name)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if matcher.should_descend(parts):
+                                stack.append((entry.path, parts))
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    pattern_index = matcher.match("/".join(parts))
+                    if pattern_index is not None:
+                        matches.append((pattern_index, parts, Path(entry.path)))
+        except OSError:
+            continue
+
+    matches.sort(key=lambda item: (item[0], item[1]))
+    return [path for _, _, path in matches]
@@ -4,6 +4,9 @@ import os
 import hashlib
 import re
 import tempfile
+import threading
+import weakref
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -73,6 +76,143 @@ def _sanitize_event(event: dict[str, Any]) -> dict[str, Any]:
     return event
 
 
+WATERMARK_FILENAME = "events.jsonl.watermark"
+
+
+def _read_watermark(watermark_file: Path, inode: int) -> int:
+    """Byte offset events.jsonl is normalized up to; 0 if unknown or for another inode."""
+    try:
+        data = json.loads(watermark_file.read_text())
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(data, dict) or data.get("inode") != inode:
+        return 0
+    offset = data.get("offset")
+    return offset if isinstance(offset, int) and offset >= 0 else 0
+
+
+def _write_watermark(watermark_file: Path, inode: int, offset: int) -> None:
+    try:
+        watermark_file.write_text(json.dumps({"inode": inode, "offset": offset}))
+    except OSError:
+        pass
+
+
+class _EventBuffer:
+    """Buffered events.jsonl writer.
+
+    Serialized lines are queued and appended in batches: when ``max_batch``
+    lines are pending, every ``flush_interval_s`` from a shared background
+    thread, on ``flush()``, and when the owning Telemetry is collected or the
+    process exits. Each batch is one ``write`` on an ``O_APPEND`` descriptor,
+    so lines from concurrent processes never interleave. If writes keep
+    failing the buffer holds at most ``capacity`` lines; the oldest are
+    dropped and counted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_batch: int = 64,
+        capacity: int = 4096,
+        flush_interval_s: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.max_batch = max_batch
+        self.flush_interval_s = flush_interval_s
+        self.emitted = 0
+        self.dropped = 0
+        self._lines: deque[str] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        _BackgroundFlusher.live.add(self)
+
+    def append(self, line: str) -> None:
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self.dropped += 1
+            self._lines.append(line)
+            self.emitted += 1
+            pending = len(self._lines)
+        if pending >= self.max_batch:
+            self.flush()
+        else:
+            _BackgroundFlusher.watch(self)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._lines:
+                return
+            data = "".join(self._lines).encode()
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                finally:
+                    os.close(fd)
+            except OSError:
+                return  # Lines stay queued for the next attempt
+            self._lines.clear()
+
+    @property
+    def drop_rate(self) -> float:
+        return self.dropped / self.emitted if self.emitted else 0.0
+
+
+class _BackgroundFlusher:
+    """Daemon thread flushing every buffer with pending events.
+
+    Runs only while some buffer has pending events, so idle processes (and
+    processes about to fork) carry no extra thread.
+    """
+
+    live: "weakref.WeakSet[_EventBuffer]" = weakref.WeakSet()
+    _buffers: "weakref.WeakSet[_EventBuffer]" = weakref.WeakSet()
+    _lock = threading.Lock()
+    _thread: threading.Thread | None = None
+
+    @classmethod
+    def watch(cls, buffer: _EventBuffer) -> None:
+        with cls._lock:
+            cls._buffers.add(buffer)
+            if cls._thread is None:
+                cls._thread = threading.Thread(
+                    target=cls._run, name="telemetry-flush", daemon=True
+                )
+                cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            with cls._lock:
+                interval = min((buffer.flush_interval_s for buffer in cls._buffers), default=0.0)
+            time.sleep(interval)
+            with cls._lock:
+                buffers = list(cls._buffers)
+                cls._buffers.clear()
+                if not buffers:
+                    cls._thread = None
+                    return
+            for buffer in buffers:
+                buffer.flush()
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        # The thread did not survive the fork and the parent still owns (and
+        # will write) the pending lines: start clean in the child.
+        cls._lock = threading.Lock()
+        cls._thread = None
+        for buffer in list(cls.live):
+            buffer._lock = threading.Lock()
+            buffer._lines.clear()
+        cls._buffers.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_BackgroundFlusher._after_fork_in_child)
+
+
 class Telemetry:
     def __init__(self, root: Path | None = None, level: str = "full"):
         # KILL SWITCH: Detect pre-commit or explicit off mode
@@ -104,6 +244,7 @@ class Telemetry:
             self._ctx_dir = Path(telemetry_dir_override)
             self._ctx_dir.mkdir(parents=True, exist_ok=True)
             self._normalize_events_file()
+            self._open_event_buffer()
             return
 
         # Default mode: use _ctx/telemetry in segment
@@ -119,10 +260,16 @@ class Telemetry:
 
         self._ctx_dir.mkdir(parents=True, exist_ok=True)
         self._normalize_events_file()
+        self._open_event_buffer()
 
         # Load prev metrics if needed?
         # For restoration simple start.
 
+    def _open_event_buffer(self) -> None:
+        self._events = _EventBuffer(self._ctx_dir / "events.jsonl")
+        # Pending events are written when this instance is collected or at exit
+        weakref.finalize(self, self._events.flush)
+
     def incr(self, key: str, val: int = 1):
         self.metrics[key] = self.metrics.get(key, 0) + val
 
@@ -182,16 +329,19 @@ class Telemetry:
         # Sanitize PII before persisting
         payload = _sanitize_event(payload)
 
-        # Write to events.jsonl
-        with open(self._ctx_dir / "events.jsonl", "a") as f:
-            content = json.dumps(payload)
-            if not content.endswith("\n"):
-                content += "\n"
-            f.write(content)
+        # Queue for events.jsonl (written in batches, see _EventBuffer)
+        self._events.append(json.dumps(payload) + "\n")
+
+    def flush_events(self) -> None:
+        """Write buffered events to events.jsonl without touching last_run.json."""
+        if self.level == "off":
+            return
+        self._events.flush()
 
     def flush(self):
         if self.level == "off":
             return
+        self._events.flush()
         # Write last_run.json
         # Aggregate logic
         summary = {
@@ -209,7 +359,10 @@ class Telemetry:
                 "lsp_fallback_count": self.metrics.get("lsp_fallback_count", 0),
                 "lsp_request_count": self.metrics.get("lsp_request_count", 0),
             },
-            "telemetry_drops": {"drop_rate": 0.0},
+            "telemetry_drops": {
+                "drop_rate": round(self._events.drop_rate, 6),
+                "dropped": self._events.dropped,
+            },
         }
 
         # Add latencies if any timings were observed
@@ -250,16 +403,67 @@ class Telemetry:
 
         Keeps telemetry tripwires stable by ensuring every persisted row has:
         run_id, segment_id (8-hex), cmd, args, result, timing_ms, warnings, x.
+
+        Only lines appended since the last check are parsed: events.jsonl.watermark
+        records the file's inode and the byte offset up to which it is known to be
+        normalized, so construction cost does not grow with telemetry history. A
+        file without watermark (or rotated/truncated since) is checked once in full.
         """
         events_file = self._ctx_dir / "events.jsonl"
-        if not events_file.exists():
+        watermark_file = self._ctx_dir / WATERMARK_FILENAME
+        try:
+            stat = events_file.stat()
+        except OSError:
+            return
+
+        start = _read_watermark(watermark_file, stat.st_ino)
+        if start > stat.st_size:
+            start = 0
+        if start == stat.st_size:
+            return
+
+        try:
+            with open(events_file, "rb") as f:
+                f.seek(start)
+                tail = f.read(stat.st_size - start)
+        except OSError:
+            return
+        # Leave a partially written last line for a later check
+        end = tail.rfind(b"\n") + 1
+        if end == 0:
+            return
+
+        lines = tail[:end].decode(errors="replace").splitlines()
+        normalized_lines, changed = self._normalize_lines(lines)
+        if not changed:
+            _write_watermark(watermark_file, stat.st_ino, start + end)
             return
 
         try:
-            lines = events_file.read_text().splitlines()
+            with open(events_file, "rb") as f:
+                head = f.read(start)
+                f.seek(start + end)
+                rest = f.read()
+            normalized = "".join(line + "\n" for line in normalized_lines).encode()
+            # Atomic write: write to temp file, then rename (POSIX atomic)
+            fd, tmp_path = tempfile.mkstemp(dir=events_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(head + normalized + rest)
+                os.replace(tmp_path, events_file)
+            except OSError:
+                # Clean up temp file on failure
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                return
+            _write_watermark(watermark_file, events_file.stat().st_ino, len(head) + len(normalized))
         except OSError:
             return
 
+    def _normalize_lines(self, lines: list[str]) -> tuple[list[str], bool]:
+        """Normalized rows (unparseable ones dropped) and whether anything changed."""
         normalized_lines: list[str] = []
         changed = False
 
@@ -277,51 +481,37 @@ class Telemetry:
                 changed = True
                 continue
 
+            row_changed = False
             if "run_id" not in row:
                 row["run_id"] = self.run_id
-                changed = True
+                row_changed = True
 
             sid = row.get("segment_id")
             if not isinstance(sid, str) or not re.match(r"^[0-9a-f]{8}$", sid):
                 row["segment_id"] = self.segment_id
-                changed = True
+                row_changed = True
 
             if "cmd" not in row:
                 row["cmd"] = "telemetry.legacy"
-                changed = True
+                row_changed = True
             if "args" not in row or not isinstance(row["args"], dict):
                 row["args"] = {}
-                changed = True
+                row_changed = True
             if "result" not in row or not isinstance(row["result"], dict):
                 row["result"] = {}
-                changed = True
+                row_changed = True
             if "timing_ms" not in row:
                 row["timing_ms"] = 1
-                changed = True
+                row_changed = True
             if "warnings" not in row or not isinstance(row["warnings"], list):
                 row["warnings"] = []
-                changed = True
+                row_changed = True
             if "x" not in row or not isinstance(row["x"], dict):
                 row["x"] = {}
-                changed = True
+                row_changed = True
 
-            normalized_lines.append(json.dumps(row))
+            # Rows already in shape keep their exact bytes
+            normalized_lines.append(json.dumps(row) if row_changed else line)
+            changed = changed or row_changed
 
-        if changed:
-            try:
-                content = "\n".join(normalized_lines) + ("\n" if normalized_lines else "")
-                # Atomic write: write to temp file, then rename (POSIX atomic)
-                fd, tmp_path = tempfile.mkstemp(dir=events_file.parent, suffix=".tmp")
-                try:
-                    with os.fdopen(fd, "w") as f:
-                        f.write(content)
-                    os.replace(tmp_path, events_file)
-                except OSError:
-                    # Clean up temp file on failure
-                    try:
-                        os.unlink(tmp_path)
-                    except OSError:
-                        pass
-                    return
-            except OSError:
-                return
+        return normalized_lines, changed
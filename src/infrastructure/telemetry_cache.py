@@ -80,6 +80,46 @@ class TelemetryAstCache:
 
         return value
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get many values; emits the same per-key hit/miss events as get()."""
+        t0 = time.perf_counter_ns()
+        found = self._inner.get_many(keys)
+        # One backend call: its time is spread over the keys
+        elapsed_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        timing_ms = max(1, elapsed_ms // max(1, len(keys)))
+
+        for key in keys:
+            status = "hit" if key in found else "miss"
+            self._tel.event(
+                cmd=f"ast.cache.{status}",
+                args={"cache_key": key},
+                result={
+                    "backend": self._backend,
+                    "segment_id": self._segment_id,
+                },
+                timing_ms=timing_ms,
+            )
+
+        return found
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Set many values; emits one ast.cache.write event per key."""
+        t0 = time.perf_counter_ns()
+        self._inner.set_many(items)
+        elapsed_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        timing_ms = max(1, elapsed_ms // max(1, len(items)))
+
+        for key in items:
+            self._tel.event(
+                cmd="ast.cache.write",
+                args={"cache_key": key},
+                result={
+                    "backend": self._backend,
+                    "segment_id": self._segment_id,
+                },
+                timing_ms=timing_ms,
+            )
+
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with telemetry."""
         t0 = time.perf_counter_ns()
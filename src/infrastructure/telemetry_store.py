@@ -0,0 +1,348 @@
+"""Indexed, incrementally compacted copy of events.jsonl for telemetry reports.
+
+events.jsonl stays the append-only source of truth. Readers (stats, report,
+export, chart, health, zero-hit reports) go through TelemetryStore, which
+copies lines appended since its watermark into a SQLite database next to the
+log (``events.db``) and keeps per (day, cmd, source) counters up to date.
+Windowed queries then touch only the rows in the window, and per-source
+search counters come from the daily aggregates, so report cost follows the
+window queried rather than the whole history.
+
+The watermark is the events.jsonl inode, the byte offset ingested so far and
+the bytes just before that offset; if the file was rotated, truncated or
+rewritten the store is rebuilt from scratch.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+STORE_FILENAME = "events.db"
+_TAIL_BYTES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermark (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    tail BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    ts REAL,
+    day TEXT NOT NULL,
+    cmd TEXT NOT NULL,
+    source TEXT NOT NULL,
+    hits REAL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_cmd_ts ON events(cmd, ts);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+CREATE TABLE IF NOT EXISTS daily_counts (
+    day TEXT NOT NULL,
+    cmd TEXT NOT NULL,
+    source TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    with_hits INTEGER NOT NULL,
+    zero_hits INTEGER NOT NULL,
+    missing_hits INTEGER NOT NULL,
+    first_seq INTEGER NOT NULL,
+    PRIMARY KEY (day, cmd, source)
+) WITHOUT ROWID;
+"""
+
+# Stored for a result.hits that is present but not a number (NULL means absent)
+_INVALID_HITS = -1.0
+
+
+def parse_event_ts(value: Any) -> datetime | None:
+    """Aware datetime for an event ``ts`` (naive values are taken as UTC); None if invalid."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+class TelemetryStore:
+    """SQLite index over a telemetry directory's events.jsonl."""
+
+    def __init__(self, telemetry_dir: Path) -> None:
+        self.telemetry_dir = telemetry_dir
+        self.events_path = telemetry_dir / "events.jsonl"
+        self.db_path = telemetry_dir / STORE_FILENAME
+        if not self.events_path.exists():
+            self._open(":memory:")
+            return
+        try:
+            self._open(self.db_path)
+        except sqlite3.Error:
+            self._open(":memory:")
+
+    def _open(self, database: Path | str) -> None:
+        self._conn = sqlite3.connect(database, timeout=10)
+        try:
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    @classmethod
+    def for_segment(cls, segment_path: Path) -> "TelemetryStore":
+        """Store for ``<segment>/_ctx/telemetry``, synced with events.jsonl."""
+        store = cls(segment_path / "_ctx" / "telemetry")
+        store.sync()
+        return store
+
+    def __enter__(self) -> "TelemetryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def sync(self) -> int:
+        """Ingest complete lines appended to events.jsonl since the watermark.
+
+        A database that cannot be written (read-only segment) is replaced by an
+        in-memory one, rebuilt from the whole log.
+
+        Returns:
+            Number of events added.
+        """
+        try:
+            return self._sync_transaction()
+        except sqlite3.Error:
+            self._conn.close()
+            self._open(":memory:")
+            return self._sync_transaction()
+
+    def _sync_transaction(self) -> int:
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = self._sync_locked()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return added
+
+    def _sync_locked(self) -> int:
+        conn = self._conn
+        try:
+            stat = self.events_path.stat()
+        except OSError:
+            self._reset()
+            return 0
+
+        row = conn.execute("SELECT inode, offset, tail FROM watermark WHERE id = 0").fetchone()
+        inode, offset, tail = row if row else (None, 0, b"")
+        with open(self.events_path, "rb") as f:
+            if inode != stat.st_ino or offset > stat.st_size:
+                offset = 0
+            elif offset:
+                f.seek(offset - len(tail))
+                if f.read(len(tail)) != tail:
+                    offset = 0
+            if offset == 0:
+                self._reset()
+            if offset == stat.st_size:
+                return 0
+            f.seek(offset)
+            chunk = f.read(stat.st_size - offset)
+
+        # Leave a partially written last line for a later sync
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+
+        next_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM events").fetchone()[0]
+        rows = list(_event_rows(chunk[:end].decode(errors="replace").splitlines(), next_seq))
+        conn.executemany(
+            "INSERT INTO events (seq, ts, day, cmd, source, hits, raw) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            "INSERT INTO daily_counts "
+            "(day, cmd, source, events, with_hits, zero_hits, missing_hits, first_seq) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(day, cmd, source) DO UPDATE SET "
+            "events = events + excluded.events, "
+            "with_hits = with_hits + excluded.with_hits, "
+            "zero_hits = zero_hits + excluded.zero_hits, "
+            "missing_hits = missing_hits + excluded.missing_hits",
+            _daily_rows(rows),
+        )
+
+        # Bytes just before the new offset, to detect an in-place rewrite on the next sync
+        new_tail = ((tail if offset else b"") + chunk[:end])[-_TAIL_BYTES:]
+        conn.execute(
+            "INSERT OR REPLACE INTO watermark (id, inode, offset, tail) VALUES (0, ?, ?, ?)",
+            (stat.st_ino, offset + end, new_tail),
+        )
+        return len(rows)
+
+    def _reset(self) -> None:
+        self._conn.execute("DELETE FROM watermark")
+        self._conn.execute("DELETE FROM events")
+        self._conn.execute("DELETE FROM daily_counts")
+
+    def count(self) -> int:
+        """Number of events ingested."""
+        row = self._conn.execute("SELECT COALESCE(SUM(events), 0) FROM daily_counts").fetchone()
+        return int(row[0])
+
+    def events(
+        self,
+        since: datetime | None = None,
+        cmd: str | None = None,
+        strict: bool = False,
+        include_undated: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Events in log order, optionally limited to one ``cmd`` and a time window.
+
+        Args:
+            since: Keep events at or after this time (after it when ``strict``)
+            cmd: Keep only events with this ``cmd``
+            strict: Use ``ts > since`` instead of ``ts >= since``
+            include_undated: With ``since``, also keep events without a valid ``ts``
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if cmd is not None:
+            clauses.append("cmd = ?")
+            params.append(cmd)
+        if since is not None:
+            window = f"ts {'>' if strict else '>='} ?"
+            clauses.append(f"({window} OR ts IS NULL)" if include_undated else window)
+            params.append(since.timestamp())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        # Sorted here rather than with ORDER BY so the planner keeps using the ts index
+        rows = sorted(self._conn.execute(f"SELECT seq, raw FROM events{where}", params))
+        return [json.loads(raw) for _, raw in rows]
+
+    def counts_by_cmd(self) -> dict[str, int]:
+        """Event count per ``cmd`` over the whole history."""
+        rows = self._conn.execute(
+            "SELECT cmd, SUM(events) FROM daily_counts GROUP BY cmd ORDER BY MIN(first_seq)"
+        )
+        return dict(rows.fetchall())
+
+    def search_counts(
+        self, cmd: str = "ctx.search", since: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Per-source counters for ``cmd``, in order of each source's first event.
+
+        Whole days after ``since`` come from the daily aggregates; only events of
+        the day containing ``since`` are read row by row (``ts > since``, undated
+        events excluded). Without ``since`` every event counts.
+
+        Returns:
+            Dicts with source, events, with_hits (hits > 0), zero_hits (hits == 0)
+            and missing_hits (no numeric result.hits).
+        """
+        if since is None:
+            rows = self._conn.execute(
+                "SELECT source, MIN(first_seq), SUM(events), SUM(with_hits), SUM(zero_hits), "
+                "SUM(missing_hits) FROM daily_counts WHERE cmd = ? GROUP BY source",
+                (cmd,),
+            ).fetchall()
+        else:
+            boundary = since.astimezone(timezone.utc).date().isoformat()
+            rows = self._conn.execute(
+                "SELECT source, first_seq, events, with_hits, zero_hits, missing_hits "
+                "FROM daily_counts WHERE cmd = ? AND day > ? "
+                "UNION ALL "
+                "SELECT source, seq, 1, hits > 0, hits = 0, hits IS NULL FROM events "
+                "WHERE cmd = ? AND ts > ? AND day = ?",
+                (cmd, boundary, cmd, since.timestamp(), boundary),
+            ).fetchall()
+
+        totals: dict[str, list[int]] = {}
+        for source, first_seq, *counts in rows:
+            current = totals.setdefault(source, [first_seq, 0, 0, 0, 0])
+            current[0] = min(current[0], first_seq)
+            for i, value in enumerate(counts, start=1):
+                current[i] += value or 0
+        ordered = sorted(totals.items(), key=lambda item: item[1][0])
+        return [
+            {
+                "source": source,
+                "events": events,
+                "with_hits": with_hits,
+                "zero_hits": zero_hits,
+                "missing_hits": missing_hits,
+            }
+            for source, (_, events, with_hits, zero_hits, missing_hits) in ordered
+        ]
+
+
+def _event_rows(lines: list[str], next_seq: int) -> Iterator[tuple[Any, ...]]:
+    seq = next_seq
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(event, dict):
+            continue
+
+        ts = parse_event_ts(event.get("ts"))
+        x = event.get("x")
+        source = x.get("source", "unknown") if isinstance(x, dict) else "unknown"
+        result = event.get("result")
+        hits = None
+        if isinstance(result, dict) and "hits" in result:
+            hits = result["hits"]
+            if isinstance(hits, bool) or not isinstance(hits, (int, float)):
+                hits = _INVALID_HITS
+        yield (
+            seq,
+            ts.timestamp() if ts else None,
+            ts.astimezone(timezone.utc).date().isoformat() if ts else "",
+            str(event.get("cmd", "")),
+            str(source),
+            hits,
+            line,
+        )
+        seq += 1
+
+
+def _daily_rows(rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    counters: dict[tuple[str, str, str], Counter[str]] = {}
+    first_seq: dict[tuple[str, str, str], int] = {}
+    for seq, _, day, cmd, source, hits, _ in rows:
+        key = (day, cmd, source)
+        counter = counters.setdefault(key, Counter())
+        first_seq.setdefault(key, seq)
+        counter["events"] += 1
+        if hits is None:
+            counter["missing_hits"] += 1
+        elif hits > 0:
+            counter["with_hits"] += 1
+        elif hits == 0:
+            counter["zero_hits"] += 1
+    return [
+        (
+            *key,
+            counter["events"],
+            counter["with_hits"],
+            counter["zero_hits"],
+            counter["missing_hits"],
+            first_seq[key],
+        )
+        for key, counter in counters.items()
+    ]
@@ -704,3 +704,33 @@ def test_graph_cli_keeps_top_level_edge_while_ignoring_nested_calls(tmp_path: Pa
     assert json.loads(index_result.output)["edge_count"] == 1
     assert [node["symbol_name"] for node in json.loads(callers_result.output)["nodes"]] == ["root"]
     assert [node["symbol_name"] for node in json.loads(callees_result.output)["nodes"]] == ["leaf"]
+
+
+def test_graph_cli_depth_and_path_commands(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    (source_dir / "sample.py").write_text(
+        "def leaf():\n"
+        "    return 1\n\n"
+        "def middle():\n"
+        "    return leaf()\n\n"
+        "def root():\n"
+        "    return middle()\n"
+    )
+    runner.invoke(app, ["graph", "index", "--segment", str(segment), "--json"])
+
+    callers_result = runner.invoke(
+        app,
+        ["graph", "callers", "--segment", str(segment), "--symbol", "leaf", "--depth", "2"],
+    )
+    path_result = runner.invoke(
+        app, ["graph", "path", "root", "leaf", "--segment", str(segment), "--json"]
+    )
+
+    assert callers_result.exit_code == 0, callers_result.output
+    assert "- root [function] src/pkg/sample.py:7 (depth 2)" in callers_result.output
+    assert path_result.exit_code == 0, path_result.output
+    payload = json.loads(path_result.output)
+    assert payload["found"] is True
+    assert [node["symbol_name"] for node in payload["nodes"]] == ["root", "middle", "leaf"]
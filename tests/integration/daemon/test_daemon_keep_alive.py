@@ -0,0 +1,140 @@
+import json
+import socket
+import time
+
+import pytest
+
+from bench_daemon_load import send_line
+from src.infrastructure.daemon.client import DaemonConnection
+from tests.integration.daemon.test_daemon_load import daemon  # noqa: F401
+
+
+def _hover(deadline_ms: int | None = None) -> dict:
+    request: dict = {"method": "textDocument/hover", "params": {}}
+    if deadline_ms is not None:
+        request["deadline_ms"] = deadline_ms
+    return request
+
+
+def test_connection_is_reused_across_requests(daemon) -> None:  # noqa: F811
+    runner, _ = daemon
+    connection = DaemonConnection(runner.socket_path)
+
+    first = connection.request("textDocument/hover", {})
+    sock = connection._sock
+    second = connection.request("textDocument/definition", {})
+
+    assert first is not None and first["status"] == "ok"
+    assert second is not None and second["data"] == {"method": "textDocument/definition"}
+    assert connection._sock is sock
+    assert "id" not in second
+    connection.close()
+
+
+def test_pipelined_replies_arrive_out_of_order(daemon) -> None:  # noqa: F811
+    runner, _ = daemon
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(10)
+    sock.connect(str(runner.socket_path))
+    sock.sendall(
+        json.dumps({"id": "slow", **_hover()}).encode()
+        + b"\n"
+        + json.dumps({"id": "fast", **_hover(deadline_ms=50)}).encode()
+        + b"\n"
+    )
+
+    buffer = b""
+    while buffer.count(b"\n") < 2:
+        buffer += sock.recv(65536)
+    sock.close()
+
+    ids = [json.loads(line)["id"] for line in buffer.splitlines()]
+    assert ids == ["fast", "slow"]
+
+
+def test_pipeline_and_batch_keep_request_order(daemon) -> None:  # noqa: F811
+    runner, lsp_client = daemon
+    connection = DaemonConnection(runner.socket_path)
+
+    started = time.perf_counter()
+    piped = connection.pipeline([_hover(), _hover(deadline_ms=50)])
+    batched = connection.batch([_hover(deadline_ms=50), _hover()])
+    elapsed = time.perf_counter() - started
+
+    assert [reply["response_state"] for reply in piped] == ["complete", "degraded"]
+    assert [reply["response_state"] for reply in batched] == ["degraded", "complete"]
+    # Each group ran its slow request concurrently with the fast one
+    assert elapsed < 2 * 1.0 + 0.8
+    assert lsp_client.max_in_flight == 2
+    connection.close()
+
+
+def test_reconnects_after_idle_timeout(daemon) -> None:  # noqa: F811
+    runner, _ = daemon
+    runner.keep_alive_timeout = 0.2
+    connection = DaemonConnection(runner.socket_path)
+
+    assert connection.request("textDocument/definition", {}) is not None
+    stale = connection._sock
+    time.sleep(0.5)
+    reply = connection.request("textDocument/definition", {})
+
+    assert reply is not None and reply["status"] == "ok"
+    assert connection._sock is not stale
+    connection.close()
+
+
+def _open_idle_sessions(runner, count: int) -> list[DaemonConnection]:
+    connections = [DaemonConnection(runner.socket_path) for _ in range(count)]
+    for connection in connections:
+        reply = connection.pipeline([_hover(deadline_ms=10)])[0]
+        assert reply is not None and reply["status"] == "ok"
+    return connections
+
+
+@pytest.mark.parametrize("daemon", [{"max_workers": 2}], indirect=True)
+def test_ping_is_served_while_keep_alive_clients_idle(daemon) -> None:  # noqa: F811
+    runner, _ = daemon
+    idle = _open_idle_sessions(runner, 3)
+
+    started = time.perf_counter()
+    reply = send_line(runner.socket_path, b"PING\n", timeout=5.0)
+    elapsed = time.perf_counter() - started
+
+    assert reply == b"PONG\n"
+    assert elapsed < 1.0
+    assert len(runner._sessions) == 3
+    for connection in idle:
+        connection.close()
+
+
+@pytest.mark.parametrize("daemon", [{"max_workers": 2}], indirect=True)
+def test_stop_does_not_wait_for_idle_sessions(daemon) -> None:  # noqa: F811
+    runner, lsp_client = daemon
+    idle = _open_idle_sessions(runner, 3)
+
+    started = time.perf_counter()
+    assert send_line(runner.socket_path, b"SHUTDOWN\n", timeout=5.0) == b"OK\n"
+    while runner.socket_path.exists() and time.perf_counter() - started < 10:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    assert not runner.socket_path.exists()
+    assert elapsed < 2.0
+    assert lsp_client._never.is_set()
+    assert runner._sessions == {}
+    for connection in idle:
+        connection.close()
+
+
+@pytest.mark.parametrize("daemon", [{"max_sessions": 1}], indirect=True)
+def test_keep_alive_requests_past_session_cap_are_answered_one_shot(daemon) -> None:  # noqa: F811
+    runner, _ = daemon
+    first, second = _open_idle_sessions(runner, 2)
+
+    reply = second.request("textDocument/definition", {})
+
+    assert reply is not None and reply["data"] == {"method": "textDocument/definition"}
+    assert len(runner._sessions) == 1
+    first.close()
+    second.close()
@@ -0,0 +1,134 @@
+import json
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bench_daemon_load import percentile, run_load, send_line
+from src.infrastructure.daemon.runner import DaemonRunner
+from src.infrastructure.lsp_client import LSPState
+
+SLOW_LSP_SECONDS = 1.0
+
+
+class SlowLSPClient:
+    """Ready LSP client whose requests take SLOW_LSP_SECONDS (or the deadline)."""
+
+    def __init__(self) -> None:
+        self.state = LSPState.READY
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._never = threading.Event()
+
+    def is_ready(self) -> bool:
+        return True
+
+    def stop(self) -> None:
+        self._never.set()
+
+    def request(self, method: str, params: dict, timeout: float | None = None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if timeout is not None and timeout < SLOW_LSP_SECONDS:
+                self._never.wait(timeout)
+                return None
+            time.sleep(SLOW_LSP_SECONDS)
+            return {"method": method}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def daemon(request, monkeypatch):
+    # AF_UNIX paths are length-limited; pytest tmp paths can be too long
+    runtime_dir = Path(tempfile.mkdtemp(prefix="tfd", dir="/tmp"))
+    monkeypatch.setenv("TRIFECTA_NO_TELEMETRY", "1")
+    settings = {"max_workers": 8, **getattr(request, "param", {})}
+    runner = DaemonRunner(runtime_dir=runtime_dir, repo_root=runtime_dir, **settings)
+    lsp_client = SlowLSPClient()
+    monkeypatch.setattr(runner, "_install_signal_handlers", lambda: None)
+    monkeypatch.setattr(
+        runner, "_initialize_lsp_client", lambda: setattr(runner, "lsp_client", lsp_client)
+    )
+
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 5
+    while not runner.socket_path.exists() and time.time() < deadline:
+        time.sleep(0.01)
+
+    yield runner, lsp_client
+
+    try:
+        send_line(runner.socket_path, b"SHUTDOWN\n", timeout=5.0)
+    except OSError:
+        pass
+    thread.join(timeout=10)
+    shutil.rmtree(runtime_dir, ignore_errors=True)
+
+
+def _hover_line(deadline_ms: int | None = None) -> bytes:
+    request: dict = {"method": "textDocument/hover", "params": {}}
+    if deadline_ms is not None:
+        request["deadline_ms"] = deadline_ms
+    return json.dumps(request).encode() + b"\n"
+
+
+def test_percentile_nearest_rank() -> None:
+    samples = [float(n) for n in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+@pytest.mark.slow
+def test_slow_lsp_request_does_not_block_other_clients(daemon) -> None:
+    runner, _ = daemon
+    slow_replies: list[bytes] = []
+    slow = threading.Thread(
+        target=lambda: slow_replies.append(send_line(runner.socket_path, _hover_line(), 10.0))
+    )
+    slow.start()
+    time.sleep(0.1)
+
+    report = run_load(runner.socket_path, clients=6, requests_per_client=20)
+    slow.join()
+
+    print(f"\nPING under a {SLOW_LSP_SECONDS}s LSP request: {report}")
+    assert report["errors"] == 0
+    assert report["requests"] == 120
+    assert report["p99_ms"] < SLOW_LSP_SECONDS * 1000 / 2
+    assert json.loads(slow_replies[0])["status"] == "ok"
+
+
+@pytest.mark.slow
+def test_concurrent_lsp_requests_are_multiplexed(daemon) -> None:
+    runner, lsp_client = daemon
+
+    report = run_load(runner.socket_path, clients=4, requests_per_client=1, payload=_hover_line())
+
+    print(f"\n4 parallel {SLOW_LSP_SECONDS}s LSP requests: {report}")
+    assert report["errors"] == 0
+    assert lsp_client.max_in_flight == 4
+    assert report["wall_s"] < SLOW_LSP_SECONDS * 2
+
+
+@pytest.mark.slow
+def test_request_deadline_bounds_lsp_wait(daemon) -> None:
+    runner, _ = daemon
+
+    started = time.perf_counter()
+    reply = json.loads(send_line(runner.socket_path, _hover_line(deadline_ms=100), 10.0))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < SLOW_LSP_SECONDS / 2
+    assert reply["status"] == "ok"
+    assert reply["fallback_reason"] == "lsp_request_timeout"
@@ -44,6 +44,7 @@ def mock_context_service():
         preview="Agent configuration...",
     )
     service.search = Mock(return_value=MagicMock(hits=[mock_hit]))
+    service.search_terms = lambda queries, k=5: [service.search(q, k=k) for q in queries]
     return service
 
 
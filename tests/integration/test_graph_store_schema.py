@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from src.domain.graph_models import GraphEdge, GraphNode
+from src.domain.graph_models import GraphEdge, GraphFileState, GraphNode
 from src.infrastructure.graph_store import (
     GraphStore,
     GraphStoreIncompleteError,
@@ -209,3 +209,111 @@ def test_graph_store_relations_are_scoped_to_segment_id(tmp_path: Path) -> None:
     store.replace_segment(foreign_segment, [foreign_root], [leaking_edge])
 
     assert store.get_callers(primary_segment, "leaf") == []
+
+
+def _named_node(symbol_name: str, file_rel: str = "src/pkg/sample.py", line: int = 1) -> GraphNode:
+    return replace(
+        _sample_node(),
+        id=f"seg_1234:{file_rel}:{symbol_name}",
+        file_rel=file_rel,
+        symbol_name=symbol_name,
+        qualified_name=symbol_name,
+        line=line,
+    )
+
+
+def test_graph_store_search_ranks_exact_prefix_token_then_substring(tmp_path: Path) -> None:
+    store = GraphStore(tmp_path / "graph.db")
+    store.replace_segment(
+        "seg_1234",
+        [
+            _named_node("precache", line=1),
+            _named_node("getCacheStats", line=2),
+            _named_node("warm_cache", line=3),
+            _named_node("cache_get", line=4),
+            _named_node("Cache", line=5),
+            _named_node("run", file_rel="src/cache/runner.py"),
+        ],
+        [],
+    )
+
+    results = store.search_nodes("seg_1234", "cache")
+
+    assert [node.symbol_name for node in results] == [
+        "Cache",
+        "cache_get",
+        "getCacheStats",
+        "warm_cache",
+        "precache",
+        "run",
+    ]
+    assert [node.symbol_name for node in store.search_nodes("seg_1234", "cache", limit=2)] == [
+        "Cache",
+        "cache_get",
+    ]
+
+
+def test_graph_store_search_tolerates_typos(tmp_path: Path) -> None:
+    store = GraphStore(tmp_path / "graph.db")
+    store.replace_segment(
+        "seg_1234", [_named_node("process_batch"), _named_node("render_page")], []
+    )
+
+    results = store.search_nodes("seg_1234", "procss_batch")
+
+    assert [node.symbol_name for node in results] == ["process_batch"]
+    assert store.search_nodes("seg_1234", "zzzqqq") == []
+
+
+def test_graph_store_search_index_follows_file_replacements(tmp_path: Path) -> None:
+    store = GraphStore(tmp_path / "graph.db")
+    store.replace_segment(
+        "seg_1234", [_named_node("old_name")], [], files={"a": GraphFileState("1")}
+    )
+
+    store.replace_files(
+        "seg_1234", {"src/pkg/sample.py": GraphFileState("2")}, [], [_named_node("new_name")], []
+    )
+
+    assert store.search_nodes("seg_1234", "old_name") == []
+    assert [node.symbol_name for node in store.search_nodes("seg_1234", "new_na")] == ["new_name"]
+
+
+def test_graph_store_search_indexes_nodes_of_db_created_without_fts(tmp_path: Path) -> None:
+    db_path = tmp_path / "graph.db"
+    GraphStore(db_path).replace_segment("seg_1234", [_named_node("legacy_symbol")], [])
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE nodes_fts")
+        for trigger in ("insert", "delete", "update"):
+            conn.execute(f"DROP TRIGGER nodes_fts_{trigger}")
+
+    readonly = GraphStore.open_readonly(
+        db_path, "seg_1234", required_tables=GraphStore.SEARCH_REQUIRED_TABLES
+    )
+    assert [node.symbol_name for node in readonly.search_nodes("seg_1234", "legacy")] == [
+        "legacy_symbol"
+    ]
+
+    reopened = GraphStore(db_path)
+    with sqlite3.connect(db_path) as conn:
+        indexed = conn.execute("SELECT COUNT(*) FROM nodes_fts").fetchone()[0]
+    assert indexed == 1
+    assert [node.symbol_name for node in reopened.search_nodes("seg_1234", "legacy")] == [
+        "legacy_symbol"
+    ]
+
+
+def test_graph_store_adds_stat_columns_to_files_table_without_them(tmp_path: Path) -> None:
+    db_path = tmp_path / "graph.db"
+    GraphStore(db_path).replace_segment(
+        "seg_1234", [], [], files={"a.py": GraphFileState("1", 5, 7)}
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE files")
+        conn.execute(
+            "CREATE TABLE files (segment_id TEXT NOT NULL, file_rel TEXT NOT NULL, "
+            "content_hash TEXT NOT NULL, PRIMARY KEY (segment_id, file_rel))"
+        )
+        conn.execute("INSERT INTO files VALUES ('seg_1234', 'a.py', '1')")
+
+    assert GraphStore(db_path).get_file_states("seg_1234") == {"a.py": GraphFileState("1")}
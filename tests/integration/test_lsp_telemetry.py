@@ -11,6 +11,7 @@ def test_lsp_events_schema_pr1():
     t = Telemetry(Path.cwd())
     t.event("lsp.spawn", {}, {"status": "ok"}, 1, lsp_state="WARMING")
     t.event("lsp.fallback", {}, {"status": "ok"}, 0, reason="test", fallback_to="ast")
+    t.flush()
 
     events_file = Path("_ctx/telemetry/events.jsonl")
     lines = events_file.read_text().splitlines()
@@ -103,6 +104,7 @@ def test_timing_ms_min_1_for_lsp_events():
     t = Telemetry(Path.cwd())
     # Try to log 0
     t.event("lsp.test_zero", {}, {}, 0)
+    t.flush()
 
     events_file = Path("_ctx/telemetry/events.jsonl")
     lines = events_file.read_text().splitlines()
@@ -0,0 +1,219 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.application.context_service import ContextService
+from src.application.search_get_usecases import GetChunkUseCase, SearchUseCase
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack
+from src.infrastructure import cli
+from src.infrastructure.daemon.ctx_handler import CtxRequestHandler
+from src.infrastructure.daemon.runner import DaemonRunner
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+TEXTS = {
+    "skill:one": "# Skill\nservice layer and repository pattern\n",
+    "agent:two": "# Agent\ntelemetry events and service wiring\n",
+}
+
+
+def _write_pack(segment: Path, texts: dict[str, str]) -> None:
+    ctx_dir = segment / "_ctx"
+    ctx_dir.mkdir(exist_ok=True)
+    pack = ContextPack(
+        segment="test",
+        chunks=[
+            ContextChunk(
+                id=cid,
+                doc=cid.split(":")[0],
+                title_path=[f"{cid.split(':')[0]}.md"],
+                text=text,
+                char_count=len(text),
+                token_est=len(text) // 4,
+                source_path=f"{cid.split(':')[0]}.md",
+            )
+            for cid, text in texts.items()
+        ],
+        index=[
+            ContextIndexEntry(
+                id=cid, title_path_norm=f"{cid.split(':')[0]}.md", preview=text, token_est=1
+            )
+            for cid, text in texts.items()
+        ],
+    )
+    (ctx_dir / "context_pack.json").write_text(pack.model_dump_json(indent=2))
+
+
+@pytest.fixture
+def segment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TRIFECTA_NO_TELEMETRY", "1")
+    _write_pack(tmp_path, TEXTS)
+    (tmp_path / "_ctx" / "aliases.yaml").write_text(
+        "schema_version: 1\naliases:\n  service: [repository, telemetry]\n"
+    )
+    return tmp_path
+
+
+def _count_loads(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = ContextService._load_pack
+
+    def counting_load(self: ContextService) -> ContextPack:
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(ContextService, "_load_pack", counting_load)
+    return calls
+
+
+def _search(handler: CtxRequestHandler, segment: Path, query: str) -> dict:
+    return handler.handle(
+        {"method": "ctx.search", "params": {"segment": str(segment), "query": query, "limit": 5}}
+    )
+
+
+def test_search_matches_in_process_output(segment: Path) -> None:
+    expected = SearchUseCase(FileSystemAdapter()).execute(segment, "service", limit=5)
+
+    response = _search(CtxRequestHandler(segment), segment, "service")
+
+    assert response == {"status": "ok", "method": "ctx.search", "output": expected}
+
+
+def test_get_matches_in_process_output(segment: Path) -> None:
+    expected = GetChunkUseCase(FileSystemAdapter()).execute(segment, ["agent:two"], mode="raw")
+
+    response = CtxRequestHandler(segment).handle(
+        {
+            "method": "ctx.get",
+            "params": {"segment": str(segment), "ids": ["agent:two"], "mode": "raw"},
+        }
+    )
+
+    assert response["output"] == expected
+
+
+def test_pack_stays_warm_until_rewritten(segment: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_loads(monkeypatch)
+    handler = CtxRequestHandler(segment)
+
+    _search(handler, segment, "service")
+    _search(handler, segment, "telemetry")
+    assert len(calls) == 1
+
+    pack_path = segment / "_ctx" / "context_pack.json"
+    stat = pack_path.stat()
+    _write_pack(segment, {"skill:three": "# Skill\nzebra crossing\n"})
+    os.utime(pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    response = _search(handler, segment, "zebra")
+
+    assert len(calls) == 2
+    assert "skill:three" in response["output"]
+
+
+def test_aliases_reload_when_yaml_changes(segment: Path) -> None:
+    handler = CtxRequestHandler(segment)
+    assert handler.cache.aliases(segment) == {"service": ["repository", "telemetry"]}
+
+    aliases_path = segment / "_ctx" / "aliases.yaml"
+    aliases_path.write_text("schema_version: 1\naliases:\n  service: [wiring]\n")
+    stat = aliases_path.stat()
+    os.utime(aliases_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert handler.cache.aliases(segment) == {"service": ["wiring"]}
+
+
+def test_last_run_describes_only_the_latest_request(
+    segment: Path, tmp_path_factory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    telemetry_dir = tmp_path_factory.mktemp("telemetry")
+    monkeypatch.delenv("TRIFECTA_NO_TELEMETRY")
+    monkeypatch.setenv("TRIFECTA_TELEMETRY_DIR", str(telemetry_dir))
+    handler = CtxRequestHandler(segment)
+
+    for query in ("service", "telemetry", "wiring"):
+        _search(handler, segment, query)
+
+    last_run = json.loads((telemetry_dir / "last_run.json").read_text())
+    assert last_run["latencies"]["ctx.search"]["count"] == 1
+
+
+def test_rejects_segment_outside_repo_root(segment: Path, tmp_path_factory) -> None:
+    other = tmp_path_factory.mktemp("other")
+
+    response = _search(CtxRequestHandler(segment), other, "service")
+
+    assert response["status"] == "error"
+    assert "outside daemon repo root" in response["message"]
+
+
+def test_reports_missing_params(segment: Path) -> None:
+    response = CtxRequestHandler(segment).handle(
+        {"method": "ctx.get", "params": {"segment": str(segment)}}
+    )
+
+    assert response == {"status": "error", "method": "ctx.get", "message": "missing param: ids"}
+
+
+def test_runner_dispatches_ctx_methods(segment: Path) -> None:
+    from tests.unit.daemon.test_runner import FakeConnection
+
+    runner = DaemonRunner(runtime_dir=segment, repo_root=segment)
+    request = {"method": "ctx.search", "params": {"segment": str(segment), "query": "wiring"}}
+    conn = FakeConnection(json.dumps(request).encode() + b"\n")
+
+    runner._handle_connection(conn)
+
+    response = json.loads(conn.sent[0])
+    assert response["status"] == "ok"
+    assert "agent:two" in response["output"]
+    assert conn.closed
+
+
+def test_cli_search_routes_to_daemon(segment: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict] = []
+
+    class FakeConnection:
+        def request(self, method: str, params: dict) -> dict:
+            requests.append({"method": method, "params": params})
+            return {"status": "ok", "method": method, "output": "FROM DAEMON"}
+
+    socket_file = segment / "socket"
+    socket_file.touch()
+    monkeypatch.setattr(
+        "src.infrastructure.daemon.client.daemon_socket_path", lambda _runtime: socket_file
+    )
+    monkeypatch.setattr(
+        "src.infrastructure.daemon.client.get_connection", lambda _path: FakeConnection()
+    )
+    echoed: list[str] = []
+    monkeypatch.setattr(cli.typer, "echo", lambda msg="", **_: echoed.append(msg))
+
+    cli.search(
+        query="service",
+        segment=str(segment),
+        limit=3,
+        telemetry_level="off",
+        no_lint=True,
+        explain=False,
+        explain_format="json",
+    )
+
+    assert echoed == ["FROM DAEMON"]
+    assert requests[0]["params"]["segment"] == str(segment.resolve())
+    assert requests[0]["params"]["limit"] == 3
+
+
+def test_cli_falls_back_when_routing_disabled(
+    segment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRIFECTA_DAEMON_ROUTE", "0")
+    monkeypatch.setattr(
+        "src.infrastructure.daemon.client.get_connection",
+        lambda *a, **k: pytest.fail("daemon must not be contacted"),
+    )
+
+    assert cli._route_ctx_to_daemon(str(segment), "ctx.search", {"query": "x"}) is None
@@ -1,6 +1,7 @@
 from src.infrastructure.daemon.protocol import (
     MAX_REQUEST_SIZE,
     ReadResult,
+    RequestReader,
     build_health_payload,
     build_json_response,
     build_request_too_large_response,
@@ -8,6 +9,7 @@ from src.infrastructure.daemon.protocol import (
     decode_request,
     parse_request,
     read_request,
+    with_request_id,
 )
 
 
@@ -95,3 +97,23 @@ def test_read_request_stops_at_newline_before_limit() -> None:
     conn = FakeConnection(b"PING\nTRAILING")
 
     assert read_request(conn, MAX_REQUEST_SIZE) == ReadResult(raw_data=b"PING\n")
+
+
+def test_request_reader_keeps_pipelined_requests() -> None:
+    reader = RequestReader(FakeConnection(b'{"id":1,"method":"a"}\n{"id":2,"method":"b"}\nPI'))
+
+    assert reader.read() == ReadResult(raw_data=b'{"id":1,"method":"a"}\n')
+    assert reader.read() == ReadResult(raw_data=b'{"id":2,"method":"b"}\n')
+    assert reader.read() == ReadResult(raw_data=b"PI")
+    assert reader.read() == ReadResult(raw_data=b"")
+
+
+def test_parse_request_batch_envelope() -> None:
+    parsed = parse_request('[{"id":1,"method":"a"},{"method":"b"}]')
+
+    assert parsed == {"kind": "batch", "items": [{"id": 1, "method": "a"}, {"method": "b"}]}
+
+
+def test_with_request_id_echoes_only_present_ids() -> None:
+    assert with_request_id({"id": 7, "method": "a"}, {"status": "ok"}) == {"id": 7, "status": "ok"}
+    assert with_request_id({"method": "a"}, {"status": "ok"}) == {"status": "ok"}
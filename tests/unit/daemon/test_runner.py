@@ -177,3 +177,82 @@ def test_exact_limit_request_with_eof_is_processed(tmp_path: Path) -> None:
     runner._handle_connection(conn)
 
     assert conn.sent == [b"ERROR: Unknown command\n"]
+
+
+def test_from_env_reads_concurrency_settings(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("TRIFECTA_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("TRIFECTA_REPO_ROOT", str(tmp_path))
+    monkeypatch.setenv("TRIFECTA_DAEMON_WORKERS", "3")
+    monkeypatch.setenv("TRIFECTA_DAEMON_BACKLOG", "128")
+    monkeypatch.setenv("TRIFECTA_DAEMON_DEADLINE", "2.5")
+    monkeypatch.setenv("TRIFECTA_DAEMON_SESSIONS", "16")
+
+    runner = DaemonRunner.from_env([tmp_path])
+
+    assert (runner.max_workers, runner.backlog, runner.request_deadline) == (3, 128, 2.5)
+    assert runner.max_sessions == 16
+
+
+def test_json_request_deadline_is_passed_to_lsp_client(tmp_path: Path) -> None:
+    class DeadlineLSPClient(FakeLSPClient):
+        timeouts: list[float | None] = []
+
+        def request(self, method: str, params: dict, timeout: float | None = None):
+            self.timeouts.append(timeout)
+            return {"method": method}
+
+    runner = make_runner(tmp_path)
+    runner.request_deadline = 4.0
+    runner.lsp_client = DeadlineLSPClient(LSPState.READY)
+
+    for line in (b'{"method":"hover","deadline_ms":250}\n', b'{"method":"hover"}\n'):
+        runner._handle_connection(FakeConnection(line))
+
+    assert runner.lsp_client.timeouts == [0.25, 4.0]
+
+
+def test_request_id_keeps_connection_open_for_pipelined_requests(tmp_path: Path) -> None:
+    runner = make_runner(tmp_path)
+    runner.lsp_client = FakeLSPClient(LSPState.READY)
+    conn = FakeConnection(
+        b'{"id":1,"method":"textDocument/hover"}\n'
+        b"PING\n"
+        b'{"id":2,"method":"textDocument/definition"}\n'
+    )
+
+    runner._handle_connection(conn)
+
+    replies = [json.loads(data) if data.startswith(b"{") else data for data in conn.sent]
+    assert [reply["id"] if isinstance(reply, dict) else reply for reply in replies] == [
+        1,
+        b"PONG\n",
+        2,
+    ]
+    assert replies[2]["data"] == {"method": "textDocument/definition", "params": {}}
+    assert conn.closed is True
+
+
+def test_batch_request_answers_in_order(tmp_path: Path) -> None:
+    runner = make_runner(tmp_path)
+    runner.lsp_client = FakeLSPClient(LSPState.READY)
+    conn = FakeConnection(b'[{"method":"a","params":{"n":1}},"bogus",{"method":"b"}]\n')
+
+    runner._handle_connection(conn)
+
+    replies = json.loads(conn.sent[0])
+    assert replies[0]["data"] == {"method": "a", "params": {"n": 1}}
+    assert replies[1] == {"status": "error", "message": "Invalid batch item"}
+    assert replies[2]["data"] == {"method": "b", "params": {}}
+    assert conn.closed is True
+
+
+def test_oversized_request_on_keep_alive_connection_gets_error_reply(tmp_path: Path) -> None:
+    runner = make_runner(tmp_path)
+    runner.lsp_client = FakeLSPClient(LSPState.READY)
+    conn = FakeConnection(b'{"id":1,"method":"textDocument/hover"}\n' + b"x" * 16_385)
+
+    runner._handle_connection(conn)
+
+    assert json.loads(conn.sent[0])["id"] == 1
+    assert conn.sent[1] == b'{"status": "error", "message": "Request too large (max 16KB)"}\n'
+    assert conn.closed is True
@@ -16,13 +16,14 @@ class FakeServer:
         self.socket_path = socket_path
         self.closed = False
         self.timeout: float | None = None
+        self.backlog: int | None = None
 
     def bind(self, _: str) -> None:
         self.socket_path.parent.mkdir(parents=True, exist_ok=True)
         self.socket_path.write_text("")
 
-    def listen(self, _: int) -> None:
-        return None
+    def listen(self, backlog: int) -> None:
+        self.backlog = backlog
 
     def settimeout(self, value: float) -> None:
         self.timeout = value
@@ -57,10 +58,11 @@ def test_create_server_writes_pid_and_sets_timeout(monkeypatch, tmp_path: Path)
     monkeypatch.setattr(socket, "socket", lambda *args, **kwargs: fake_server)
     monkeypatch.setattr(os, "chmod", lambda *_args, **_kwargs: None)
 
-    server = create_server(socket_path, pid_path)
+    server = create_server(socket_path, pid_path, backlog=16)
 
     assert server is fake_server
     assert fake_server.timeout == 1.0
+    assert fake_server.backlog == 16
     assert pid_path.read_text() == str(os.getpid())
 
 
@@ -0,0 +1,114 @@
+"""Unit tests for the compiled alias index and its on-disk cache."""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+import yaml  # type: ignore[import-untyped]
+
+from src.application.query_expander import QueryExpander
+from src.domain.alias_index import AliasIndex
+from src.infrastructure import aliases_fs
+from src.infrastructure.aliases_fs import COMPILED_ALIASES_FILENAME, AliasMerger
+
+
+def _write_aliases(path: Path, aliases: dict[str, list[str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump({"schema_version": 1, "aliases": aliases}))
+
+
+def _scan_expand(aliases: dict[str, list[str]], query: str, tokens: list[str]) -> list:
+    """Reference expansion: linear scan of every alias for reverse lookups."""
+    terms = [(query, 1.0)]
+    added = {query}
+
+    def add(term: str) -> None:
+        if term not in added and len(added) - 1 < QueryExpander.MAX_EXTRA_TERMS:
+            terms.append((term, 0.7))
+            added.add(term)
+
+    for term in [query, *tokens]:
+        if term != query and len(added) - 1 >= QueryExpander.MAX_EXTRA_TERMS:
+            break
+        for synonym in aliases.get(term, []):
+            add(synonym)
+        for key, synonyms in aliases.items():
+            if term in synonyms:
+                add(key)
+    return terms
+
+
+def test_expansion_matches_linear_scan() -> None:
+    rng = random.Random(3)
+    words = [f"w{i}" for i in range(60)]
+    aliases = {f"k{i}": rng.sample(words, rng.randint(1, 4)) for i in range(40)}
+    aliases["w1"] = ["k2", "w5"]
+    expander = QueryExpander(aliases)
+
+    for _ in range(200):
+        tokens = rng.sample(words + list(aliases), rng.randint(1, 4))
+        query = " ".join(tokens)
+        assert expander.expand(query, tokens) == _scan_expand(aliases, query, tokens)
+        assert expander.expand(tokens[0], tokens[:1]) == _scan_expand(aliases, tokens[0], tokens[:1])
+
+
+def test_expansion_metadata_lists_keys_in_alias_order() -> None:
+    expander = QueryExpander(AliasIndex.from_aliases({"b": ["x"], "a": ["x", "y"], "c": ["z"]}))
+
+    meta = expander.get_expansion_metadata([("q", 1.0), ("y", 0.7), ("x", 0.7)])
+
+    assert meta["alias_keys_used"] == ["b", "a"]
+
+
+def test_index_is_cached_and_reused_without_parsing_yaml(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ctx = tmp_path / "_ctx"
+    _write_aliases(ctx / "aliases.yaml", {"parser": ["tree_sitter"]})
+    _write_aliases(ctx / "aliases.generated.yaml", {"parser": ["ignored"], "db": ["sqlite"]})
+
+    index = AliasMerger(tmp_path).index()
+    assert index.forward == {"parser": ["tree_sitter"], "db": ["sqlite"]}
+    assert index.keys_for("sqlite") == ["db"]
+    assert (ctx / COMPILED_ALIASES_FILENAME).exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("alias YAML parsed again")
+
+    monkeypatch.setattr(aliases_fs.yaml, "safe_load", fail)
+    assert AliasMerger(tmp_path).index() == index
+
+    # A touch without content change is revalidated by hash, not re-parsed
+    stat = (ctx / "aliases.yaml").stat()
+    os.utime(ctx / "aliases.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert AliasMerger(tmp_path).index() == index
+
+
+def test_index_is_rebuilt_when_a_source_changes(tmp_path: Path) -> None:
+    ctx = tmp_path / "_ctx"
+    _write_aliases(ctx / "aliases.yaml", {"parser": ["tree_sitter"]})
+    assert AliasMerger(tmp_path).index().synonyms("parser") == ["tree_sitter"]
+
+    _write_aliases(ctx / "aliases.generated.yaml", {"db": ["sqlite"]})
+    assert AliasMerger(tmp_path).index().keys_for("sqlite") == ["db"]
+
+    _write_aliases(ctx / "aliases.yaml", {"parser": ["ast_parser", "lexer"]})
+    assert AliasMerger(tmp_path).index().synonyms("parser") == ["ast_parser", "lexer"]
+
+    (ctx / "aliases.generated.yaml").unlink()
+    assert AliasMerger(tmp_path).index().forward == {"parser": ["ast_parser", "lexer"]}
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path: Path) -> None:
+    ctx = tmp_path / "_ctx"
+    _write_aliases(ctx / "aliases.yaml", {"parser": ["tree_sitter"]})
+    (ctx / COMPILED_ALIASES_FILENAME).write_text("{not json")
+
+    assert AliasMerger(tmp_path).index().synonyms("parser") == ["tree_sitter"]
+    assert AliasMerger(tmp_path).index().synonyms("parser") == ["tree_sitter"]
+
+
+def test_segment_without_aliases_writes_no_cache(tmp_path: Path) -> None:
+    assert not AliasMerger(tmp_path).index()
+    assert not (tmp_path / "_ctx" / COMPILED_ALIASES_FILENAME).exists()
@@ -47,3 +47,216 @@ def test_hit_rate_empty_cache():
     assert stats.hit_rate == 0.0, f"Empty cache should have hit_rate=0.0, got {stats.hit_rate}"
     assert stats.hits == 0
     assert stats.misses == 0
+
+
+def test_lru_evicts_least_recently_used():
+    """A get refreshes recency, so the untouched key is evicted first."""
+    cache = InMemoryLRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_byte_accounting_on_overwrite_and_delete():
+    """Overwrites and deletes subtract the size recorded at insertion."""
+    cache = InMemoryLRUCache()
+    cache.set("k", "x" * 10)  # '"xxxxxxxxxx"' = 12 bytes
+    cache.set("k", "x" * 20)
+    assert cache.stats().current_bytes == 22
+
+    assert cache.delete("k") is True
+    assert cache.delete("k") is False
+    assert cache.stats().current_bytes == 0
+
+
+def test_byte_limit_evicts_and_skips_oversized_values():
+    """Entries are evicted to fit max_bytes; a value larger than the limit is not cached."""
+    cache = InMemoryLRUCache(max_bytes=30)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 10)
+
+    cache.set("c", "x" * 10)
+    assert cache.get("a") is None
+    assert cache.stats().current_bytes == 24
+
+    cache.set("huge", "x" * 100)
+    assert cache.get("huge") is None
+    assert cache.stats().entries == 2
+
+
+def test_concurrent_access_keeps_counters_consistent():
+    """Parallel set/get keeps entries and bytes in sync with the stored values."""
+    import threading
+
+    cache = InMemoryLRUCache(max_entries=50)
+
+    def worker(offset: int) -> None:
+        for i in range(500):
+            key = f"k{(offset + i) % 80}"
+            cache.set(key, i)
+            cache.get(key)
+
+    threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats.entries <= 50
+    assert stats.hits + stats.misses == 8 * 500
+    assert stats.current_bytes == sum(e.size_bytes for e in cache._cache.values())
+
+
+def _scan_counters(db_path):
+    import sqlite3
+
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(value_bytes), 0) FROM cache"
+        ).fetchone()
+
+
+def test_sqlite_cache_uses_wal_and_counter_table(tmp_path):
+    """Counters kept by triggers match a full scan after upserts, deletes and evictions."""
+    import sqlite3
+
+    db_path = tmp_path / "cache.db"
+    cache = SQLiteCache(db_path, max_entries=3)
+    cache.set("a", "x" * 10)
+    cache.set("a", "x" * 20)
+    cache.set_many({"b": [1, 2], "c": {"k": "v"}})
+    cache.set("d", "y")  # evicts
+    cache.delete("b")
+
+    stats = cache.stats()
+    assert (stats.entries, stats.current_bytes) == _scan_counters(db_path)
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_cache_get_defers_access_time_writes(tmp_path):
+    """get() only reads; last_access reaches the DB on flush (stats flushes first)."""
+    import sqlite3
+
+    db_path = tmp_path / "cache.db"
+    cache = SQLiteCache(db_path)
+    cache.set("k", {"v": 1})
+
+    def last_access():
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("SELECT last_access, created_at FROM cache").fetchone()
+
+    assert cache.get("k") == {"v": 1}
+    accessed, created = last_access()
+    assert accessed == created
+
+    stats = cache.stats()
+    accessed, created = last_access()
+    assert accessed > created
+    assert (stats.hits, stats.misses) == (1, 0)
+
+
+def test_sqlite_cache_get_many_and_set_many(tmp_path):
+    """Bulk APIs round-trip in one call; missing keys are omitted."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set_many({f"k{i}": {"i": i} for i in range(600)})
+
+    found = cache.get_many([f"k{i}" for i in range(0, 1200, 2)])
+
+    assert len(found) == 300
+    assert found["k598"] == {"i": 598}
+    assert cache.stats().entries == 600
+
+
+def test_sqlite_cache_seeds_counters_for_existing_db(tmp_path):
+    """A DB written before the counter table gets counters seeded from its rows."""
+    import sqlite3
+
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL, value_bytes INTEGER NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO cache VALUES (?, ?, ?, ?, ?)",
+            [("a", '"1"', 1.0, 2.0, 3), ("b", '"22"', 1.0, 1.0, 4)],
+        )
+
+    stats = SQLiteCache(db_path).stats()
+
+    assert (stats.entries, stats.current_bytes, stats.hits, stats.misses) == (2, 7, 1, 1)
+
+
+def test_sqlite_cache_seeds_counters_only_once(tmp_path):
+    """Reopening a DB with a counter row does not rescan the cache table."""
+    db_path = tmp_path / "cache.db"
+    SQLiteCache(db_path).set("a", "x")
+
+    cache = SQLiteCache(db_path)
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+    cache._init_db()
+
+    assert not any("COUNT(*)" in statement for statement in statements)
+    assert cache.stats().entries == 1
+
+
+def test_sqlite_cache_overwrite_at_capacity_does_not_evict(tmp_path):
+    """Overwriting an existing key adds no entry, so it must not trigger eviction."""
+    cache = SQLiteCache(tmp_path / "cache.db", max_entries=3)
+    cache.set_many({"a": 1, "b": 2, "c": 3})
+
+    cache.set("a", 10)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 10, "b": 2, "c": 3}
+    assert cache.stats().entries == 3
+
+
+def test_in_memory_bulk_api_counts_hits_and_misses():
+    """get_many counts a hit or miss per key like get()."""
+    cache = InMemoryLRUCache()
+    cache.set_many({"a": 1, "b": 2})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 2)
+
+
+def test_wrappers_forward_bulk_calls(tmp_path):
+    """FileLockedAstCache takes one lock per batch; TelemetryAstCache emits per-key events."""
+    from src.infrastructure.file_locked_cache import FileLockedAstCache
+    from src.infrastructure.telemetry_cache import TelemetryAstCache
+
+    class RecordingTelemetry:
+        def __init__(self):
+            self.events = []
+
+        def event(self, cmd, args, result, timing_ms, **kwargs):
+            self.events.append((cmd, args.get("cache_key")))
+
+    locked = FileLockedAstCache(InMemoryLRUCache(), lock_path=tmp_path / "cache.lock")
+    operations = []
+    original = locked._with_lock
+    locked._with_lock = lambda op, fn: operations.append(op) or original(op, fn)
+    telemetry = RecordingTelemetry()
+    cache = TelemetryAstCache(locked, telemetry, segment_id="seg")
+
+    cache.set_many({"a": 1, "b": 2})
+    found = cache.get_many(["a", "z"])
+
+    assert found == {"a": 1}
+    assert operations == ["set_many", "get_many"]
+    assert telemetry.events == [
+        ("ast.cache.write", "a"),
+        ("ast.cache.write", "b"),
+        ("ast.cache.hit", "a"),
+        ("ast.cache.miss", "z"),
+    ]
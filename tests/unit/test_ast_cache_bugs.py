@@ -170,3 +170,51 @@ def test_cache_error_handling() -> None:
     result2 = builder.build(file_path, content)
     assert result2.status == "hit", "Error should be cached"
     assert result2.symbols == [], "Cached error should have empty symbols"
+
+
+def test_build_many_batches_lookups_and_writes(tmp_path: Path) -> None:
+    """
+    build_many() hace un get_many y un set_many, parsea solo los misses y
+    mantiene el orden de entrada.
+    """
+    from src.domain.ast_cache import SQLiteCache
+
+    class CountingCache(SQLiteCache):
+        calls: list[str] = []
+
+        def get_many(self, keys):
+            self.calls.append("get_many")
+            return super().get_many(keys)
+
+        def set_many(self, items):
+            self.calls.append(f"set_many:{len(items)}")
+            super().set_many(items)
+
+    cache = CountingCache(tmp_path / "cache.db")
+    builder = SkeletonMapBuilder(cache=cache, segment_id="seg")
+    contents = {
+        Path("a.py"): "def a(): pass\n",
+        Path("b.py"): "class B: pass\n",
+        Path("broken.py"): "def (:\n",
+    }
+    builder.build(Path("a.py"), contents[Path("a.py")])
+    cache.calls.clear()
+
+    results = builder.build_many(list(contents), contents)
+
+    assert [r.status for r in results] == ["hit", "miss", "error"]
+    assert [s.name for s in results[1].symbols] == ["B"]
+    assert results[0].symbols == builder.build(Path("a.py"), contents[Path("a.py")]).symbols
+    assert cache.calls == ["get_many", "set_many:2"]
+
+
+def test_build_many_reads_files_not_in_contents(tmp_path: Path) -> None:
+    """Sin contenido explícito, build_many lee el archivo como build()."""
+    source = tmp_path / "mod.py"
+    source.write_text("def f(): pass\n")
+    builder = SkeletonMapBuilder(cache=InMemoryLRUCache(), segment_id=".")
+
+    (result,) = builder.build_many([source])
+
+    assert result.status == "miss"
+    assert result.cache_key == builder.build(source).cache_key
@@ -0,0 +1,168 @@
+"""Tests for the memory-mapped binary context pack (context_pack.bin)."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.application.context_index import pack_digest
+from src.application.context_service import BinaryPackSession, ContextService
+from src.application.use_cases import BuildContextPackUseCase, ValidateContextPackUseCase
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack
+from src.infrastructure.binary_pack import (
+    BINARY_PACK_FILENAME,
+    BinaryPackReader,
+    write_binary_pack,
+)
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+TEXTS = {
+    "skill:aaa": ("skill.md", "# Skill\nFollow the protocol rule for ctx.search calls.\n"),
+    "agent:bbb": ("agent_test.md", "# Agent\nTech stack: Python. Ünïcödé bodies survive.\n"),
+    "repo:ccc": ("service.py", "class ContextService:\n    def search(self):\n        pass\n"),
+}
+
+
+def _pack() -> ContextPack:
+    return ContextPack(
+        segment="test",
+        chunks=[
+            ContextChunk(
+                id=cid,
+                doc=cid.split(":")[0],
+                title_path=[title],
+                text=text,
+                char_count=len(text),
+                token_est=len(text) // 4,
+                source_path=title,
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+        index=[
+            ContextIndexEntry(
+                id=cid, title_path_norm=title, preview=text[:40], token_est=len(text) // 4
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+    )
+
+
+def _write_segment(segment: Path, binary: bool = True) -> ContextPack:
+    ctx_dir = segment / "_ctx"
+    ctx_dir.mkdir(exist_ok=True)
+    pack = _pack()
+    payload = pack.model_dump_json(indent=2)
+    (ctx_dir / "context_pack.json").write_text(payload + "\n")
+    if binary:
+        write_binary_pack(ctx_dir, pack, pack_digest(payload))
+    return pack
+
+
+@pytest.fixture
+def binary_segment(tmp_path: Path) -> Path:
+    segment = tmp_path / "binary"
+    segment.mkdir()
+    _write_segment(segment)
+    return segment
+
+
+@pytest.fixture
+def json_segment(tmp_path: Path) -> Path:
+    segment = tmp_path / "json"
+    segment.mkdir()
+    _write_segment(segment, binary=False)
+    return segment
+
+
+def test_round_trip_materializes_identical_pack(binary_segment: Path) -> None:
+    ctx_dir = binary_segment / "_ctx"
+    expected = ContextPack(**json.loads((ctx_dir / "context_pack.json").read_text()))
+    reader = BinaryPackReader(ctx_dir / BINARY_PACK_FILENAME)
+    try:
+        assert reader.to_pack() == expected
+        assert reader.chunk_ids == list(TEXTS)
+        assert reader.text("agent:bbb") == TEXTS["agent:bbb"][1]
+    finally:
+        reader.close()
+
+
+def test_service_uses_binary_session_lazily(binary_segment: Path) -> None:
+    service = ContextService(binary_segment)
+    session = service.open_session()
+
+    assert isinstance(session, BinaryPackSession)
+    service.get(["repo:ccc"], mode="raw")
+    assert list(session.chunk_map) == ["repo:ccc"]
+
+
+@pytest.mark.parametrize("query", ["search", "protocol rule", "ünïcödé", "contextservice"])
+def test_search_matches_json_pack(binary_segment: Path, json_segment: Path, query: str) -> None:
+    expected = ContextService(json_segment).search(query, k=10)
+    actual = ContextService(binary_segment).search(query, k=10)
+
+    assert [(h.id, h.score) for h in actual.hits] == [(h.id, h.score) for h in expected.hits]
+
+
+def test_get_matches_json_pack(binary_segment: Path, json_segment: Path) -> None:
+    ids = list(TEXTS) + ["missing:id"]
+    expected = ContextService(json_segment).get(ids, mode="raw", budget_token_est=10_000)
+    actual = ContextService(binary_segment).get(ids, mode="raw", budget_token_est=10_000)
+
+    assert actual == expected
+
+
+def test_stale_binary_is_ignored(binary_segment: Path) -> None:
+    pack_path = binary_segment / "_ctx" / "context_pack.json"
+    data = json.loads(pack_path.read_text())
+    data["chunks"][0]["text"] = "rewritten body mentions zebra\n"
+    pack_path.write_text(json.dumps(data, indent=2))
+
+    service = ContextService(binary_segment)
+
+    assert not isinstance(service.open_session(), BinaryPackSession)
+    assert [h.id for h in service.search("zebra").hits] == ["skill:aaa"]
+
+
+def test_validate_reports_corrupt_binary(binary_segment: Path) -> None:
+    validator = ValidateContextPackUseCase(FileSystemAdapter())
+    assert validator.execute(binary_segment).passed
+
+    ctx_dir = binary_segment / "_ctx"
+    json_stat = (ctx_dir / "context_pack.json").stat()
+    bin_path = ctx_dir / BINARY_PACK_FILENAME
+    raw = bytearray(bin_path.read_bytes())
+    raw[-3:] = b"XXX"
+    bin_path.write_bytes(bytes(raw))
+    os.utime(ctx_dir / "context_pack.json", ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns))
+
+    result = validator.execute(binary_segment)
+
+    assert not result.passed
+    assert "Binary pack chunk text mismatch: repo:ccc" in result.errors
+
+
+def _write_buildable_segment(segment: Path) -> None:
+    (segment / "_ctx").mkdir()
+    (segment / "skill.md").write_text("---\nname: test\n---\n# Test Segment\n")
+    (segment / "_ctx" / "agent_test.md").write_text("---\nsegment: test\n---\n# Agent\n")
+    (segment / "_ctx" / "prime_test.md").write_text("---\nsegment: test\n---\n# Prime\n")
+    (segment / "_ctx" / "session_test.md").write_text("# Session\n")
+    (segment / "_ctx" / "trifecta_config.json").write_text(
+        '{\n  "segment": "test",\n  "scope": "test",\n  "repo_root": "' + str(segment) + '"\n}\n'
+    )
+
+
+def test_build_writes_and_removes_binary(tmp_path: Path) -> None:
+    _write_buildable_segment(tmp_path)
+    bin_path = tmp_path / "_ctx" / BINARY_PACK_FILENAME
+    use_case = BuildContextPackUseCase(FileSystemAdapter())
+
+    assert use_case.execute(tmp_path, write_binary=True).is_ok()
+    assert bin_path.exists()
+    assert isinstance(ContextService(tmp_path).open_session(), BinaryPackSession)
+    assert ValidateContextPackUseCase(FileSystemAdapter()).execute(tmp_path).passed
+
+    assert use_case.execute(tmp_path).is_ok()
+    assert not bin_path.exists()
@@ -0,0 +1,67 @@
+"""Tests for the threaded read/hash stage of BuildContextPackUseCase."""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.use_cases import BuildContextPackUseCase
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+@pytest.fixture
+def segment(tmp_path: Path) -> Path:
+    (tmp_path / "_ctx").mkdir()
+    (tmp_path / "skill.md").write_text("---\nname: test\n---\n# Test Segment\n")
+    (tmp_path / "_ctx" / "agent_test.md").write_text("---\nsegment: test\n---\n# Agent\n")
+    (tmp_path / "_ctx" / "prime_test.md").write_text("---\nsegment: test\n---\n# Prime\n")
+    (tmp_path / "_ctx" / "session_test.md").write_text("# Session\n")
+    (tmp_path / "_ctx" / "trifecta_config.json").write_text(
+        '{\n  "segment": "test",\n  "scope": "test",\n  "repo_root": "' + str(tmp_path) + '"\n}\n'
+    )
+    (tmp_path / "src").mkdir()
+    for i in range(40):
+        (tmp_path / "src" / f"mod_{i:02d}.py").write_text(f"VALUE = {i}\n" * (i + 1))
+    return tmp_path
+
+
+def _build(segment: Path, jobs: int | None, telemetry=None) -> dict:
+    result = BuildContextPackUseCase(FileSystemAdapter(), telemetry).execute(segment, jobs=jobs)
+    assert result.is_ok(), result
+    data = json.loads((segment / "_ctx" / "context_pack.json").read_text())
+    data.pop("created_at")
+    return data
+
+
+def test_parallel_build_matches_sequential(segment: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sequential = _build(segment, jobs=1)
+
+    threads: set[str] = set()
+    original = Path.read_text
+
+    def tracking_read(self: Path, *args, **kwargs) -> str:
+        threads.add(threading.current_thread().name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read)
+    parallel = _build(segment, jobs=4)
+
+    assert parallel == sequential
+    assert any(name.startswith("ctx-build") for name in threads)
+
+
+def test_build_reports_phase_timings(segment: Path) -> None:
+    telemetry = Mock()
+
+    _build(segment, jobs=2, telemetry=telemetry)
+
+    phases = [call.args[0] for call in telemetry.observe.call_args_list]
+    assert phases == [
+        "ctx.build.discover",
+        "ctx.build.stat",
+        "ctx.build.read_hash",
+        "ctx.build.assemble",
+        "ctx.build.write",
+    ]
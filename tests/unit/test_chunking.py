@@ -1,8 +1,15 @@
-"""Tests for whole-file chunking logic."""
+"""Tests for whole-file and section chunking logic."""
 
 import hashlib
 import pytest
-from src.application.chunking import chunk_whole_file
+from pathlib import Path
+
+from src.application.chunking import (
+    Section,
+    chunk_whole_file,
+    split_markdown_sections,
+    split_python_sections,
+)
 
 
 class TestWholeFileChunking:
@@ -81,3 +88,67 @@ class TestWholeFileChunking:
 
         with pytest.raises(FrozenInstanceError):
             chunk.text = "modified"  # type: ignore
+
+
+class TestSectionChunking:
+    def test_markdown_splits_at_headings_outside_fences(self) -> None:
+        md = "Preamble.\n\n# A\ntext\n```\n# not a heading\n```\n## B\nb\n# C\nc\n"
+
+        sections = split_markdown_sections(md)
+
+        assert sections == [
+            Section((), "Preamble.\n\n", 1, 2),
+            Section(("A",), "# A\ntext\n```\n# not a heading\n```\n", 3, 7),
+            Section(("A", "B"), "## B\nb\n", 8, 9, parent=1),
+            Section(("C",), "# C\nc\n", 10, 11),
+        ]
+        assert "".join(section.text for section in sections) == md
+
+    def test_markdown_parent_skips_levels(self) -> None:
+        sections = split_markdown_sections("# A\n### C\n## B\n#### D\n")
+
+        assert [(s.title_path, s.parent) for s in sections] == [
+            (("A",), None),
+            (("A", "C"), 0),
+            (("A", "B"), 0),
+            (("A", "B", "D"), 2),
+        ]
+
+    def test_python_splits_at_top_level_symbols(self) -> None:
+        source = (
+            '"""Module."""\n\nimport os\n\n\n'
+            "# Helper\n@decorator\ndef helper():\n    return os\n\n"
+            "CONSTANT = 1\n\n\nclass Thing:\n    def method(self):\n        pass\n"
+        )
+
+        sections = split_python_sections(Path("mod.py"), source)
+
+        assert [(s.title_path, s.start_line, s.end_line) for s in sections] == [
+            ((), 1, 5),
+            (("helper",), 6, 13),
+            (("Thing",), 14, 16),
+        ]
+        assert sections[1].text.startswith("# Helper\n@decorator\ndef helper():")
+        assert "".join(section.text for section in sections) == source
+
+    def test_python_multi_line_decorators_stay_with_their_symbol(self) -> None:
+        source = (
+            "import typer\n\napp = typer.Typer()\n\n\n"
+            '@app.command(\n    "build",\n)\n@other\ndef build():\n    pass\n\n\n'
+            "@dataclass(\n    frozen=True,\n)\nclass Config:\n    name: str\n"
+        )
+
+        sections = split_python_sections(Path("cli.py"), source)
+
+        assert [(s.title_path, s.start_line, s.end_line) for s in sections] == [
+            ((), 1, 5),
+            (("build",), 6, 13),
+            (("Config",), 14, 18),
+        ]
+        assert sections[1].text.startswith('@app.command(\n    "build",\n)\n@other\ndef build')
+        assert sections[2].text.startswith("@dataclass(\n")
+        assert "".join(section.text for section in sections) == source
+
+    def test_python_without_symbols_or_unparsable_yields_nothing(self) -> None:
+        assert split_python_sections(Path("a.py"), "X = 1\n") == []
+        assert split_python_sections(Path("b.py"), "def broken(:\n") == []
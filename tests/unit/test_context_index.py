@@ -0,0 +1,216 @@
+"""Tests for the context_index.json inverted index sidecar."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.application.context_index import (
+    CONTEXT_INDEX_FILENAME,
+    ContextSearchIndex,
+    pack_digest,
+    write_context_index,
+)
+from src.application.context_service import ContextService, top_k
+from src.application.use_cases import BuildContextPackUseCase
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+TEXTS = {
+    "skill:aaa": ("skill.md", "# Skill\nFollow the protocol rule for ctx.search calls.\n"),
+    "agent:bbb": ("agent_test.md", "# Agent\nTech stack: Python, FastAPI. Debug with pytest -x.\n"),
+    "session:ccc": ("session_test.md", "# Session\nHandoff checklist and history log.\n"),
+    "repo:ddd": (
+        "context_service.py",
+        "class ContextService:\n    def search(self):\n        return SearchResult()\n",
+    ),
+    "repo:eee": ("README.md", "Índice de búsqueda en español. Configuración: ¿cómo?\n"),
+}
+
+QUERIES = [
+    "search",
+    "ctx.search",
+    "earch",
+    "contextservice",
+    "context_service.py",
+    "protocol rule",
+    "implement stack",
+    "handoff",
+    "log",
+    "español configuración",
+    "cómo",
+    "¿cómo?",
+    "-x",
+    "nothing-matches-here",
+    "py",
+    "service",
+]
+
+
+def _pack() -> ContextPack:
+    return ContextPack(
+        segment="test",
+        chunks=[
+            ContextChunk(
+                id=cid,
+                doc=cid.split(":")[0],
+                title_path=[title],
+                text=text,
+                char_count=len(text),
+                token_est=len(text) // 4,
+                source_path=title,
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+        index=[
+            ContextIndexEntry(
+                id=cid, title_path_norm=title, preview=text[:40], token_est=len(text) // 4
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+    )
+
+
+def _write_segment(segment: Path, with_index: bool) -> ContextPack:
+    ctx_dir = segment / "_ctx"
+    ctx_dir.mkdir(exist_ok=True)
+    pack = _pack()
+    payload = pack.model_dump_json(indent=2)
+    (ctx_dir / "context_pack.json").write_text(payload + "\n")
+    if with_index:
+        write_context_index(ctx_dir, pack, payload)
+    return pack
+
+
+@pytest.fixture
+def indexed_segment(tmp_path: Path) -> Path:
+    _write_segment(tmp_path, with_index=True)
+    return tmp_path
+
+
+@pytest.fixture
+def scan_segment(tmp_path: Path) -> Path:
+    segment = tmp_path / "scan"
+    segment.mkdir()
+    _write_segment(segment, with_index=False)
+    return segment
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_postings_scoring_matches_linear_scan(
+    indexed_segment: Path, scan_segment: Path, query: str
+) -> None:
+    indexed = ContextService(indexed_segment)
+    assert indexed.open_session().search_index is not None
+    scanned = ContextService(scan_segment)
+    assert scanned.open_session().search_index is None
+
+    expected = scanned.search(query, k=10)
+    actual = indexed.search(query, k=10)
+
+    assert [(h.id, h.score) for h in actual.hits] == [(h.id, h.score) for h in expected.hits]
+
+
+@pytest.mark.parametrize("with_index", [True, False])
+def test_search_terms_matches_per_query_search(
+    indexed_segment: Path, scan_segment: Path, with_index: bool
+) -> None:
+    service = ContextService(indexed_segment if with_index else scan_segment)
+    assert (service.open_session().search_index is not None) is with_index
+    scanned = ContextService(scan_segment)
+
+    results = service.search_terms(QUERIES, k=3)
+
+    assert len(results) == len(QUERIES)
+    for query, result in zip(QUERIES, results):
+        expected = [(h.id, h.score) for h in scanned.search(query, k=3).hits]
+        assert [(h.id, h.score) for h in result.hits] == expected
+        assert [(h.id, h.score) for h in service.search(query, k=3).hits] == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        # title/body matches plus the id boost triggered by a keyword
+        ("protocol rule", [("skill:aaa", 1.5)]),
+        ("handoff", [("session:ccc", 1.3)]),
+        # boost alone, with no word match
+        ("fix", [("agent:bbb", 1.0)]),
+        ("cómo", [("skill:aaa", 0.5), ("repo:eee", 0.5)]),
+    ],
+)
+def test_heuristic_boosts_apply_per_id_key(
+    scan_segment: Path, query: str, expected: list[tuple[str, float]]
+) -> None:
+    hits = ContextService(scan_segment).search(query, k=5).hits
+
+    assert [(h.id, h.score) for h in hits] == expected
+
+
+def test_top_k_matches_stable_sort_with_ties() -> None:
+    rng = random.Random(11)
+    for _ in range(200):
+        items = [(i, rng.choice([0.5, 1.0, 1.5, 2.3])) for i in range(rng.randint(0, 40))]
+        k = rng.randint(0, 45)
+        expected = sorted(items, key=lambda x: x[1], reverse=True)[:k]
+        assert top_k(items, k, lambda x: x[1]) == expected
+        assert top_k(iter(items), k, lambda x: x[1]) == expected
+
+
+def test_postings_respect_doc_filter(indexed_segment: Path, scan_segment: Path) -> None:
+    expected = ContextService(scan_segment).search("search", k=10, doc_filter="repo")
+    actual = ContextService(indexed_segment).search("search", k=10, doc_filter="repo")
+
+    assert [h.id for h in actual.hits] == [h.id for h in expected.hits] == ["repo:ddd"]
+
+
+def test_stale_index_falls_back_to_scan(indexed_segment: Path) -> None:
+    pack_path = indexed_segment / "_ctx" / "context_pack.json"
+    data = json.loads(pack_path.read_text())
+    data["chunks"][0]["text"] = "rewritten without the original words: zebra\n"
+    pack_path.write_text(json.dumps(data, indent=2))
+
+    service = ContextService(indexed_segment)
+
+    assert service.open_session().search_index is None
+    assert [h.id for h in service.search("zebra").hits] == ["skill:aaa"]
+
+
+def test_corrupt_index_is_ignored(indexed_segment: Path) -> None:
+    (indexed_segment / "_ctx" / CONTEXT_INDEX_FILENAME).write_text("{not json")
+
+    service = ContextService(indexed_segment)
+
+    assert service.open_session().search_index is None
+    assert service.search("handoff").hits[0].id == "session:ccc"
+
+
+def test_index_is_keyed_to_pack_digest(indexed_segment: Path) -> None:
+    ctx_dir = indexed_segment / "_ctx"
+    index = ContextSearchIndex.load(ctx_dir / CONTEXT_INDEX_FILENAME)
+
+    assert index is not None
+    assert index.pack_digest == pack_digest((ctx_dir / "context_pack.json").read_text())
+    assert index.entry_ids == list(TEXTS)
+
+
+def test_build_emits_index_sidecar(tmp_path: Path) -> None:
+    (tmp_path / "_ctx").mkdir()
+    (tmp_path / "skill.md").write_text("---\nname: test\n---\n# Test Segment\n")
+    (tmp_path / "_ctx" / "agent_test.md").write_text("---\nsegment: test\n---\n# Agent\n")
+    (tmp_path / "_ctx" / "prime_test.md").write_text("---\nsegment: test\n---\n# Prime\n")
+    (tmp_path / "_ctx" / "session_test.md").write_text("# Session\n")
+    (tmp_path / "_ctx" / "trifecta_config.json").write_text(
+        '{\n  "segment": "test",\n  "scope": "test",\n  "repo_root": "' + str(tmp_path) + '"\n}\n'
+    )
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n\nUnique marker quokka.\n")
+
+    result = BuildContextPackUseCase(FileSystemAdapter()).execute(tmp_path)
+    assert result.is_ok(), result
+
+    service = ContextService(tmp_path)
+    assert service.open_session().search_index is not None
+    assert [h.source_path for h in service.search("quokka").hits] == ["guide.md"]
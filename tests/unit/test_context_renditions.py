@@ -0,0 +1,158 @@
+"""Tests for the precomputed ctx.get renditions sidecar (context_renditions.bin)."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from src.application import context_renditions
+from src.application.context_index import pack_digest
+from src.application.context_renditions import (
+    CONTEXT_RENDITIONS_FILENAME,
+    ChunkRenditions,
+    ContextRenditions,
+    write_context_renditions,
+)
+from src.application.context_service import ContextService
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack
+from src.infrastructure.binary_pack import BinaryPackReader, write_binary_pack
+
+LONG_DOC = "# Guide\n\n" + "".join(f"  line {i} of the guide  \n\n" for i in range(60))
+CODE_DOC = (
+    "# API\n\nIntro.\n\n```python\ndef search(query):\n    return []\n```\n\n"
+    "## Notes\n\n```\nclass Pack:\n    pass\n```\n"
+)
+TEXTS = {
+    "repo:long": ("guide.md", LONG_DOC),
+    "repo:code": ("api.md", CODE_DOC),
+    "repo:plain": ("notes.txt", "no headings here, only a sentence.\n"),
+    "prime:big": ("prime.md", "x" * 9000 + "\n" + "y\n" * 30),
+    "repo:uni": ("es.md", "# Índice\n\n¿Cómo configurar? Configuración en español.\n"),
+}
+
+
+def _pack() -> ContextPack:
+    return ContextPack(
+        segment="test",
+        chunks=[
+            ContextChunk(
+                id=cid,
+                doc=cid.split(":")[0],
+                title_path=[title],
+                text=text,
+                char_count=len(text),
+                token_est=len(text) // 4,
+                source_path=title,
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+        index=[
+            ContextIndexEntry(
+                id=cid, title_path_norm=title, preview=text[:40], token_est=len(text) // 4
+            )
+            for cid, (title, text) in TEXTS.items()
+        ],
+    )
+
+
+def _write_segment(segment: Path, with_renditions: bool, binary: bool = False) -> ContextPack:
+    ctx_dir = segment / "_ctx"
+    ctx_dir.mkdir(parents=True, exist_ok=True)
+    pack = _pack()
+    payload = pack.model_dump_json(indent=2)
+    (ctx_dir / "context_pack.json").write_text(payload + "\n")
+    if with_renditions:
+        write_context_renditions(ctx_dir, pack, payload)
+    if binary:
+        write_binary_pack(ctx_dir, pack, pack_digest(payload))
+    return pack
+
+
+def _requests() -> list[dict]:
+    rng = random.Random(4)
+    ids = list(TEXTS) + ["missing:zzz"]
+    return [
+        {
+            "ids": rng.sample(ids, rng.randint(1, len(ids))),
+            "mode": rng.choice(["raw", "excerpt", "skeleton"]),
+            "budget_token_est": rng.choice([None, 5, 40, 400, 5000]),
+            "max_chunks": rng.choice([None, 1, 3]),
+            "stop_on_evidence": rng.random() < 0.3,
+            "query": "search",
+        }
+        for _ in range(150)
+    ]
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_get_with_renditions_matches_rendering_from_text(tmp_path: Path, binary: bool) -> None:
+    _write_segment(tmp_path / "plain", with_renditions=False, binary=binary)
+    _write_segment(tmp_path / "rendered", with_renditions=True, binary=binary)
+    plain = ContextService(tmp_path / "plain")
+    assert plain.open_session().renditions is None
+    rendered = ContextService(tmp_path / "rendered")
+    assert rendered.open_session().renditions is not None
+
+    for request in _requests():
+        assert rendered.get(**request) == plain.get(**request), request
+
+
+def test_raw_over_budget_is_decided_without_reading_the_body(tmp_path: Path) -> None:
+    _write_segment(tmp_path, with_renditions=True, binary=True)
+    service = ContextService(tmp_path)
+    session = service.open_session()
+    assert session.renditions is not None
+
+    def fail(self: BinaryPackReader, chunk_id: str) -> str:
+        raise AssertionError(f"chunk body read: {chunk_id}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BinaryPackReader, "text", fail)
+        result = service.get(["prime:big", "repo:long"], mode="raw", budget_token_est=100)
+        skeleton = service.get(["repo:code"], mode="skeleton")
+
+    assert result.stop_reason == "budget"
+    assert result.chunks[0].text.endswith("Usa mode='raw' con mayor budget si es crítico.")
+    assert skeleton.chunks[0].text == (
+        "# API\n```python\n  def search(query):\n```\n## Notes\n```\n  class Pack:\n```"
+    )
+
+
+def test_stale_or_corrupt_sidecar_is_ignored(tmp_path: Path) -> None:
+    pack = _write_segment(tmp_path, with_renditions=True)
+    ctx_dir = tmp_path / "_ctx"
+    expected = ContextService(tmp_path).get(["repo:long"], mode="excerpt")
+
+    # Pack rewritten after the sidecar: digest no longer matches
+    (ctx_dir / "context_pack.json").write_text(pack.model_dump_json(indent=2) + "\n\n")
+    service = ContextService(tmp_path)
+    assert service.open_session().renditions is None
+    assert service.get(["repo:long"], mode="excerpt") == expected
+
+    (ctx_dir / CONTEXT_RENDITIONS_FILENAME).write_bytes(b"TRFREND\x01garbage")
+    assert ContextRenditions.load(ctx_dir / CONTEXT_RENDITIONS_FILENAME) is None
+
+
+def test_unchanged_chunks_are_not_rendered_again(tmp_path: Path) -> None:
+    pack = _write_segment(tmp_path, with_renditions=True)
+    ctx_dir = tmp_path / "_ctx"
+    rendered: list[str] = []
+    original = ChunkRenditions.render.__func__  # type: ignore[attr-defined]
+
+    def tracking_render(cls: type, text: str) -> ChunkRenditions:
+        rendered.append(text)
+        return original(cls, text)
+
+    pack.chunks[0] = pack.chunks[0].model_copy(update={"text": "# Guide\n\nRewritten.\n"})
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ChunkRenditions, "render", classmethod(tracking_render))
+        write_context_renditions(ctx_dir, pack, pack.model_dump_json(indent=2))
+
+    assert rendered == ["# Guide\n\nRewritten.\n"]
+    renditions = ContextRenditions.load(ctx_dir / CONTEXT_RENDITIONS_FILENAME)
+    assert renditions is not None
+    long_excerpt = renditions.get("repo:long")
+    assert long_excerpt is not None and long_excerpt.excerpt == "# Guide\nRewritten."
+    code = renditions.get("repo:code")
+    assert code == ChunkRenditions.render(CODE_DOC)
+    assert code.skeleton == context_renditions.skeletonize(CODE_DOC)
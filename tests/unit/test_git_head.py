@@ -0,0 +1,118 @@
+"""Unit tests for reading the HEAD SHA from .git without a subprocess."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.git_head import read_head_sha
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _repo(tmp_path: Path, head: str = "ref: refs/heads/main\n") -> Path:
+    git_dir = tmp_path / "repo" / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head)
+    return git_dir
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(autouse=True)
+def no_git_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("git subprocess spawned")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    monkeypatch.setattr(subprocess, "Popen", fail)
+
+
+def test_loose_ref_is_resolved_from_subdirectory(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(SHA_A + "\n")
+    nested = git_dir.parent / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert read_head_sha(nested) == SHA_A
+
+
+def test_packed_ref_is_resolved(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{SHA_B} refs/heads/other\n"
+        f"{SHA_A} refs/heads/main\n"
+        f"^{SHA_B}\n"
+    )
+
+    assert read_head_sha(git_dir.parent) == SHA_A
+
+
+def test_detached_head(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path, head=SHA_B + "\n")
+
+    assert read_head_sha(git_dir.parent) == SHA_B
+
+
+def test_unborn_branch_and_missing_repo_return_none(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+
+    assert read_head_sha(git_dir.parent) is None
+    assert read_head_sha(tmp_path) is None
+
+
+def test_cache_is_invalidated_when_ref_file_mtime_changes(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+    ref = git_dir / "refs" / "heads" / "main"
+    ref.write_text(SHA_A + "\n")
+    assert read_head_sha(git_dir.parent) == SHA_A
+
+    ref.write_text(SHA_B + "\n")
+    _bump_mtime(ref)
+
+    assert read_head_sha(git_dir.parent) == SHA_B
+
+
+def test_cache_is_reused_while_mtimes_are_unchanged(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+    ref = git_dir / "refs" / "heads" / "main"
+    ref.write_text(SHA_A + "\n")
+    assert read_head_sha(git_dir.parent) == SHA_A
+
+    stat = ref.stat()
+    ref.write_text(SHA_B + "\n")
+    os.utime(ref, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert read_head_sha(git_dir.parent) == SHA_A
+
+
+def test_branch_switch_is_seen_through_head_mtime(tmp_path: Path) -> None:
+    git_dir = _repo(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(SHA_A + "\n")
+    (git_dir / "refs" / "heads" / "dev").write_text(SHA_B + "\n")
+    assert read_head_sha(git_dir.parent) == SHA_A
+
+    (git_dir / "HEAD").write_text("ref: refs/heads/dev\n")
+    _bump_mtime(git_dir / "HEAD")
+
+    assert read_head_sha(git_dir.parent) == SHA_B
+
+
+def test_linked_worktree_uses_common_dir_refs(tmp_path: Path) -> None:
+    main_git = _repo(tmp_path)
+    (main_git / "packed-refs").write_text(f"{SHA_A} refs/heads/feature\n")
+    worktree_git = main_git / "worktrees" / "wt"
+    worktree_git.mkdir(parents=True)
+    (worktree_git / "HEAD").write_text("ref: refs/heads/feature\n")
+    (worktree_git / "commondir").write_text("../..\n")
+    checkout = tmp_path / "wt"
+    checkout.mkdir()
+    (checkout / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+    assert read_head_sha(checkout) == SHA_A
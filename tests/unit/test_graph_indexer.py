@@ -1,3 +1,5 @@
+import sqlite3
+import os
 from pathlib import Path
 
 import pytest
@@ -164,3 +166,149 @@ def test_graph_indexer_uses_segment_ref_v1_as_ssot(
 
     assert summary.segment_id == fake_ref.id
     assert Path(summary.db_path) == GraphStore.db_path_for_segment(fake_ref.root_abs, fake_ref.id)
+
+
+def test_graph_indexer_process_pool_matches_serial_index(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    for i in range(6):
+        (source_dir / f"mod{i}.py").write_text(
+            f"def leaf{i}():\n"
+            "    return 1\n\n"
+            f"def root{i}():\n"
+            f"    return leaf{i}()\n"
+        )
+    (source_dir / "broken.py").write_text("def broken(:\n")
+
+    serial_store = GraphStore(tmp_path / "serial.db")
+    pooled_store = GraphStore(tmp_path / "pooled.db")
+    serial = GraphIndexer(store=serial_store).index_segment(segment)
+    pooled = GraphIndexer(store=pooled_store).index_segment(segment, jobs=2)
+
+    assert (pooled.node_count, pooled.edge_count) == (serial.node_count, serial.edge_count)
+    assert serial.node_count == 12
+    assert serial.edge_count == 6
+    for i in range(6):
+        callers = pooled_store.get_callers(pooled.segment_id, f"leaf{i}")
+        assert [node.symbol_name for node in callers] == [f"root{i}"]
+
+
+def _graph_snapshot(store: GraphStore, segment_id: str) -> tuple[list[str], list[str]]:
+    with sqlite3.connect(store.db_path) as conn:
+        nodes = conn.execute(
+            "SELECT id || ':' || line FROM nodes WHERE segment_id = ? ORDER BY id", (segment_id,)
+        ).fetchall()
+        edges = conn.execute(
+            "SELECT id FROM edges WHERE segment_id = ? ORDER BY id", (segment_id,)
+        ).fetchall()
+    return [row[0] for row in nodes], [row[0] for row in edges]
+
+
+def test_graph_indexer_reindexes_only_changed_added_and_deleted_files(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    (source_dir / "a.py").write_text(
+        "def leaf():\n    return 1\n\ndef root():\n    return leaf()\n"
+    )
+    (source_dir / "b.py").write_text("def other():\n    return 2\n")
+    (source_dir / "c.py").write_text("def gone():\n    return 3\n")
+
+    store = GraphStore(tmp_path / "graph.db")
+    indexer = GraphIndexer(store=store)
+    first = indexer.index_segment(segment)
+    assert (first.files_skipped, first.files_reparsed, first.files_removed) == (0, 3, 0)
+
+    unchanged = indexer.index_segment(segment)
+    assert unchanged.files_skipped == 3
+    assert (unchanged.files_reparsed, unchanged.files_removed) == (0, 0)
+    assert (unchanged.node_count, unchanged.edge_count) == (4, 1)
+
+    (source_dir / "a.py").write_text(
+        "\ndef leaf():\n    return 1\n\n"
+        "def root():\n    return 0\n\n"
+        "def top():\n    return root()\n"
+    )
+    (source_dir / "c.py").unlink()
+    (source_dir / "d.py").write_text("def fresh():\n    return other()\n")
+
+    summary = indexer.index_segment(segment)
+
+    assert (summary.files_skipped, summary.files_reparsed, summary.files_removed) == (1, 2, 1)
+    assert (summary.node_count, summary.edge_count) == (5, 1)
+    assert [node.symbol_name for node in store.get_callers(summary.segment_id, "root")] == ["top"]
+    assert store.get_callers(summary.segment_id, "leaf") == []
+
+    rebuilt_store = GraphStore(tmp_path / "rebuilt.db")
+    GraphIndexer(store=rebuilt_store).index_segment(segment, full=True)
+    assert _graph_snapshot(store, summary.segment_id) == _graph_snapshot(
+        rebuilt_store, summary.segment_id
+    )
+
+
+def test_graph_indexer_reads_only_files_whose_stat_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    (source_dir / "a.py").write_text("def leaf():\n    return 1\n")
+    (source_dir / "b.py").write_text("def other():\n    return leaf()\n")
+
+    indexer = GraphIndexer(store=GraphStore(tmp_path / "graph.db"))
+    indexer.index_segment(segment)
+
+    read: list[str] = []
+    original = graph_indexer_module._index_source
+
+    def tracking_index_source(segment_id, segment_root, file_path, known_hash=None):
+        read.append(file_path.name)
+        return original(segment_id, segment_root, file_path, known_hash)
+
+    monkeypatch.setattr(graph_indexer_module, "_index_source", tracking_index_source)
+
+    unchanged = indexer.index_segment(segment)
+    assert read == []
+    assert (unchanged.files_skipped, unchanged.files_reparsed) == (2, 0)
+
+    stat = (source_dir / "a.py").stat()
+    os.utime(source_dir / "a.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = indexer.index_segment(segment)
+    assert read == ["a.py"]
+    assert (touched.files_skipped, touched.files_reparsed) == (2, 0)
+    assert touched.node_count == 2
+
+    read.clear()
+    indexer.index_segment(segment)
+    assert read == []
+
+
+def test_graph_indexer_full_rebuild_reparses_every_file(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    (source_dir / "a.py").write_text("def leaf():\n    return 1\n")
+
+    indexer = GraphIndexer(store=GraphStore(tmp_path / "graph.db"))
+    indexer.index_segment(segment)
+    summary = indexer.index_segment(segment, full=True)
+
+    assert (summary.files_skipped, summary.files_reparsed, summary.files_removed) == (0, 1, 0)
+    assert summary.node_count == 1
+
+
+def test_graph_indexer_keeps_packages_named_like_build_outputs(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    for package in ("build", "dist"):
+        source_dir = segment / "src" / package
+        source_dir.mkdir(parents=True)
+        (source_dir / "steps.py").write_text(f"def {package}_step():\n    return 1\n")
+
+    store = GraphStore(segment / ".trifecta" / "cache" / "graph_test.db")
+    summary = GraphIndexer(store=store).index_segment(segment)
+
+    assert summary.node_count == 2
+    assert [node.symbol_name for node in store.search_nodes(summary.segment_id, "build_step")] == [
+        "build_step"
+    ]
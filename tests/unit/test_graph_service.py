@@ -273,3 +273,86 @@ def test_graph_service_status_uses_segment_ref_v1_as_ssot(
     assert seen["segment_id"] == fake_ref.id
     assert seen["db_path"] == GraphStore.db_path_for_segment(fake_ref.root_abs, fake_ref.id)
     assert payload["segment_id"] == fake_ref.id
+
+
+def _index_call_chain(tmp_path: Path) -> tuple[Path, GraphService]:
+    segment = tmp_path / "segment"
+    source_dir = segment / "src" / "pkg"
+    source_dir.mkdir(parents=True)
+    # entry -> parse -> tokenize -> emit -> parse (cycle); other -> tokenize
+    (source_dir / "chain.py").write_text(
+        "def entry():\n    return parse()\n\n"
+        "def parse():\n    return tokenize()\n\n"
+        "def tokenize():\n    return emit()\n\n"
+        "def emit():\n    return parse()\n\n"
+        "def other():\n    return tokenize()\n"
+    )
+    store = GraphStore(segment / ".trifecta" / "cache" / "graph_test.db")
+    GraphIndexer(store=store).index_segment(segment)
+    return segment, GraphService(store=store)
+
+
+def test_graph_service_callers_follow_calls_transitively_with_depth(tmp_path: Path) -> None:
+    segment, service = _index_call_chain(tmp_path)
+
+    direct = service.callers(segment, "tokenize")
+    transitive = service.callers(segment, "tokenize", depth=3)
+
+    assert [n["symbol_name"] for n in direct["nodes"]] == ["parse", "other"]
+    assert "depth" not in direct and "truncated" not in direct
+    assert all("depth" not in n for n in direct["nodes"])
+    assert transitive["depth"] == 3
+    assert transitive["truncated"] is False
+    assert [(n["symbol_name"], n["depth"]) for n in transitive["nodes"]] == [
+        ("parse", 1),
+        ("other", 1),
+        ("entry", 2),
+        ("emit", 2),
+    ]
+
+
+def test_graph_service_callees_survive_cycles_and_report_truncation(tmp_path: Path) -> None:
+    segment, service = _index_call_chain(tmp_path)
+
+    callees = service.callees(segment, "parse", depth=GraphService.MAX_DEPTH)
+    capped = service.callees(segment, "entry", depth=4, limit=2)
+
+    assert [(n["symbol_name"], n["depth"]) for n in callees["nodes"]] == [
+        ("tokenize", 1),
+        ("emit", 2),
+    ]
+    assert capped["truncated"] is True
+    assert [n["symbol_name"] for n in capped["nodes"]] == ["parse", "tokenize"]
+
+
+def test_graph_service_direct_callers_are_not_capped_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    segment, service = _index_call_chain(tmp_path)
+    monkeypatch.setattr(GraphService, "DEFAULT_RELATED_LIMIT", 1)
+
+    direct = service.callers(segment, "tokenize")
+    transitive = service.callers(segment, "tokenize", depth=2)
+
+    assert [n["symbol_name"] for n in direct["nodes"]] == ["parse", "other"]
+    assert transitive["truncated"] is True
+    assert len(transitive["nodes"]) == 1
+
+
+def test_graph_service_path_returns_shortest_call_chain(tmp_path: Path) -> None:
+    segment, service = _index_call_chain(tmp_path)
+
+    found = service.path(segment, "entry", "emit")
+    too_short = service.path(segment, "entry", "emit", max_depth=2)
+    unreachable = service.path(segment, "emit", "other")
+
+    assert found["found"] is True
+    assert [(n["symbol_name"], n["depth"]) for n in found["nodes"]] == [
+        ("entry", 0),
+        ("parse", 1),
+        ("tokenize", 2),
+        ("emit", 3),
+    ]
+    assert too_short["found"] is False
+    assert too_short["nodes"] == []
+    assert unreachable["found"] is False
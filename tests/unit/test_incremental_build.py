@@ -0,0 +1,205 @@
+"""Tests for incremental ctx build (reuse chunks by source mtime and size)."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.chunking import ChunkingMode
+from src.application.context_service import ContextService
+from src.application.use_cases import BuildContextPackUseCase
+from src.infrastructure.file_system import FileSystemAdapter
+
+
+@pytest.fixture
+def segment(tmp_path: Path) -> Path:
+    (tmp_path / "_ctx").mkdir()
+    (tmp_path / "skill.md").write_text("---\nname: test\n---\n# Test Segment\n")
+    (tmp_path / "_ctx" / "agent_test.md").write_text("---\nsegment: test\n---\n# Agent\n")
+    (tmp_path / "_ctx" / "prime_test.md").write_text("---\nsegment: test\n---\n# Prime\n")
+    (tmp_path / "_ctx" / "session_test.md").write_text("# Session\n")
+    (tmp_path / "_ctx" / "trifecta_config.json").write_text(
+        '{\n  "segment": "test",\n  "scope": "test",\n  "repo_root": "' + str(tmp_path) + '"\n}\n'
+    )
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n\nOriginal guide.\n")
+    (tmp_path / "docs" / "old.md").write_text("# Old\n\nTo be deleted.\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def main():\n    return 1\n")
+    return tmp_path
+
+
+def _pack_without_timestamp(segment: Path) -> str:
+    data = json.loads((segment / "_ctx" / "context_pack.json").read_text())
+    data.pop("created_at")
+    return json.dumps(data, indent=2)
+
+
+def _build(segment: Path, incremental: bool, chunking: ChunkingMode = "whole_file") -> str:
+    result = BuildContextPackUseCase(FileSystemAdapter()).execute(
+        segment, incremental=incremental, chunking=chunking
+    )
+    assert result.is_ok(), result
+    return _pack_without_timestamp(segment)
+
+
+def test_incremental_build_matches_full_rebuild(segment: Path) -> None:
+    _build(segment, incremental=False)
+
+    (segment / "docs" / "guide.md").write_text("# Guide\n\nEdited guide, longer now.\n")
+    (segment / "docs" / "old.md").unlink()
+    (segment / "docs" / "new.md").write_text("# New\n\nFresh page.\n")
+
+    incremental = _build(segment, incremental=True)
+    full = _build(segment, incremental=False)
+
+    assert incremental == full
+    paths = [src["path"] for src in json.loads(full)["source_files"]]
+    assert "docs/new.md" in paths
+    assert "docs/old.md" not in paths
+
+
+def test_unchanged_files_are_not_reread(segment: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _build(segment, incremental=False)
+    (segment / "src" / "app.py").write_text("def main():\n    return 2\n\n")
+
+    reads: list[str] = []
+    original = Path.read_text
+
+    def tracking_read(self: Path, *args, **kwargs) -> str:
+        reads.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read)
+    telemetry = Mock()
+    result = BuildContextPackUseCase(FileSystemAdapter(), telemetry).execute(
+        segment, incremental=True
+    )
+    assert result.is_ok()
+
+    assert "app.py" in reads
+    assert "guide.md" not in reads
+    assert "skill.md" not in reads
+    telemetry.incr.assert_any_call("ctx_build_rehashed_chunks", 1)
+
+
+def test_same_size_edit_with_new_mtime_is_rehashed(segment: Path) -> None:
+    _build(segment, incremental=False)
+    guide = segment / "docs" / "guide.md"
+    stat = guide.stat()
+    guide.write_text("# Guide\n\nOriginal GUIDE.\n")
+    assert guide.stat().st_size == stat.st_size
+    os.utime(guide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    pack = json.loads(_build(segment, incremental=True))
+
+    texts = [chunk["text"] for chunk in pack["chunks"]]
+    assert "# Guide\n\nOriginal GUIDE.\n" in texts
+
+
+def test_pack_without_sizes_falls_back_to_full_build(segment: Path) -> None:
+    _build(segment, incremental=False)
+    pack_path = segment / "_ctx" / "context_pack.json"
+    data = json.loads(pack_path.read_text())
+    for source in data["source_files"]:
+        source.pop("size")
+        source["sha256"] = "0" * 64
+    pack_path.write_text(json.dumps(data, indent=2))
+
+    incremental = _build(segment, incremental=True)
+
+    assert incremental == _build(segment, incremental=False)
+
+
+def test_sections_build_splits_files_and_get_returns_the_section(segment: Path) -> None:
+    (segment / "docs" / "guide.md").write_text(
+        "# Guide\n\nIntro.\n\n## Install\n\nRun pip.\n\n## Usage\n\nCall zebra().\n"
+    )
+    pack = json.loads(_build(segment, incremental=False, chunking="sections"))
+
+    guide = [chunk for chunk in pack["chunks"] if chunk["doc"] == "repo:docs/guide.md"]
+    assert [chunk["title_path"] for chunk in guide] == [
+        ["guide.md", "Guide"],
+        ["guide.md", "Guide", "Install"],
+        ["guide.md", "Guide", "Usage"],
+    ]
+    assert {chunk["chunking_method"] for chunk in guide} == {"heading"}
+    assert [chunk["parent_id"] for chunk in guide] == [None, guide[0]["id"], guide[0]["id"]]
+    lines = [(chunk["start_line"], chunk["end_line"]) for chunk in guide]
+    assert lines == [(1, 4), (5, 8), (9, 11)]
+    app = [chunk for chunk in pack["chunks"] if chunk["doc"] == "repo:src/app.py"]
+    assert [(chunk["title_path"], chunk["chunking_method"]) for chunk in app] == [
+        (["app.py", "main"], "symbol")
+    ]
+
+    service = ContextService(segment)
+    hit = service.search("zebra", k=1).hits[0]
+    assert hit.id == guide[2]["id"]
+    assert service.get([hit.id], mode="raw").chunks[0].text == "## Usage\n\nCall zebra().\n"
+
+
+def test_section_ids_survive_edits_to_other_sections(segment: Path) -> None:
+    guide = segment / "docs" / "guide.md"
+    guide.write_text("# Guide\n\n## A\n\nfirst\n\n## B\n\nsecond\n")
+    before = json.loads(_build(segment, incremental=False, chunking="sections"))
+    guide.write_text("# Guide\n\n## A\n\nfirst, edited\n\n## B\n\nsecond\n")
+    after = json.loads(_build(segment, incremental=False, chunking="sections"))
+
+    def ids(pack: dict) -> dict[str, str]:
+        return {
+            chunk["title_path"][-1]: chunk["id"]
+            for chunk in pack["chunks"]
+            if chunk["doc"] == "repo:docs/guide.md"
+        }
+
+    assert ids(before)["B"] == ids(after)["B"]
+    assert ids(before)["A"] != ids(after)["A"]
+
+
+def test_incremental_sections_build_matches_full_rebuild(segment: Path) -> None:
+    _build(segment, incremental=False)  # whole_file chunks are not reused for sections
+    incremental = _build(segment, incremental=True, chunking="sections")
+    assert incremental == _build(segment, incremental=False, chunking="sections")
+
+    (segment / "src" / "app.py").write_text("import os\n\n\n@cache\ndef main():\n    return 2\n")
+    incremental = _build(segment, incremental=True, chunking="sections")
+    assert incremental == _build(segment, incremental=False, chunking="sections")
+    assert incremental != _build(segment, incremental=True)
+
+
+def test_sections_build_reuses_persisted_python_skeletons(
+    segment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.application.ast_parser import SkeletonMapBuilder
+
+    (segment / "src" / "util.py").write_text("@cache\ndef helper():\n    return 2\n")
+    monkeypatch.setenv("TRIFECTA_AST_PERSIST", "1")
+    parsed: list[str] = []
+    original = SkeletonMapBuilder._parse_symbols
+
+    def tracking_parse(file_path: Path, content: str):
+        parsed.append(file_path.name)
+        return original(file_path, content)
+
+    monkeypatch.setattr(SkeletonMapBuilder, "_parse_symbols", staticmethod(tracking_parse))
+
+    first = _build(segment, incremental=False, chunking="sections")
+    assert sorted(parsed) == ["app.py", "util.py"]
+    parsed.clear()
+    second = _build(segment, incremental=False, chunking="sections")
+
+    assert parsed == []
+    assert second == first
+
+
+def test_build_skips_symlink_to_primary_skill(segment: Path) -> None:
+    (segment / "docs" / "skill_link.md").symlink_to(segment / "skill.md")
+
+    _build(segment, incremental=False)
+
+    pack = json.loads((segment / "_ctx" / "context_pack.json").read_text())
+    source_paths = {chunk["source_path"] for chunk in pack["chunks"]}
+    assert "docs/guide.md" in source_paths
+    assert "docs/skill_link.md" not in source_paths
@@ -0,0 +1,26 @@
+"""Tests for the FTS source index built by IndexUseCase."""
+
+import sqlite3
+from pathlib import Path
+
+from src.application.index_use_case import IndexUseCase
+
+
+def test_index_skips_runtime_dirs_but_keeps_build_packages(tmp_path: Path) -> None:
+    segment = tmp_path / "segment"
+    for rel in ("src/app.py", "src/build/steps.py", "dist/tool.py", "_ctx/gen.py"):
+        path = segment / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+    (segment / "src" / "__pycache__").mkdir()
+    (segment / "src" / "__pycache__" / "app.py").write_text("x = 1\n")
+
+    runtime = tmp_path / "runtime"
+    result = IndexUseCase(runtime).execute(segment)
+
+    conn = sqlite3.connect(runtime / "search.db")
+    rows = conn.execute("SELECT file FROM search_fts").fetchall()
+    conn.close()
+    files = sorted(Path(file).relative_to(segment).as_posix() for (file,) in rows)
+    assert result == {"status": "ok", "indexed": 3}
+    assert files == ["dist/tool.py", "src/app.py", "src/build/steps.py"]
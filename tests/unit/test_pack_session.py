@@ -0,0 +1,113 @@
+"""Tests for PackSession: the context pack is parsed once per search, not per term."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.context_service import ContextService
+from src.application.search_get_usecases import SearchUseCase
+from src.domain.context_models import ContextChunk, ContextIndexEntry, ContextPack
+
+
+def _write_pack(segment: Path) -> None:
+    ctx_dir = segment / "_ctx"
+    ctx_dir.mkdir()
+    texts = {
+        "skill:one": "# Skill\nservice layer and repository pattern\n",
+        "agent:two": "# Agent\ntelemetry events and service wiring\n",
+    }
+    pack = ContextPack(
+        segment="test",
+        chunks=[
+            ContextChunk(
+                id=cid,
+                doc=cid.split(":")[0],
+                title_path=[f"{cid.split(':')[0]}.md"],
+                text=text,
+                char_count=len(text),
+                token_est=len(text) // 4,
+                source_path=f"{cid.split(':')[0]}.md",
+            )
+            for cid, text in texts.items()
+        ],
+        index=[
+            ContextIndexEntry(
+                id=cid,
+                title_path_norm=f"{cid.split(':')[0]}.md",
+                preview=text,
+                token_est=len(text) // 4,
+            )
+            for cid, text in texts.items()
+        ],
+    )
+    (ctx_dir / "context_pack.json").write_text(pack.model_dump_json(indent=2))
+    (ctx_dir / "aliases.yaml").write_text(
+        "schema_version: 1\naliases:\n  service: [repository, telemetry, wiring]\n"
+    )
+
+
+@pytest.fixture
+def segment(tmp_path: Path) -> Path:
+    _write_pack(tmp_path)
+    return tmp_path
+
+
+def _count_loads(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = ContextService._load_pack
+
+    def counting_load(self: ContextService) -> ContextPack:
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(ContextService, "_load_pack", counting_load)
+    return calls
+
+
+def test_open_session_pins_pack_across_calls(
+    segment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _count_loads(monkeypatch)
+    service = ContextService(segment)
+    session = service.open_session()
+
+    service.search("service")
+    service.search("telemetry")
+    service.get(["skill:one"], mode="raw")
+
+    assert len(calls) == 1
+    assert service.open_session() is session
+
+
+def test_service_without_session_reloads_per_call(
+    segment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _count_loads(monkeypatch)
+    service = ContextService(segment)
+
+    service.search("service")
+    service.search("telemetry")
+
+    assert len(calls) == 2
+
+
+def test_pinned_session_returns_same_hits_as_one_shot(segment: Path) -> None:
+    one_shot = ContextService(segment).search("service wiring", k=5)
+    pinned_service = ContextService(segment)
+    pinned_service.open_session()
+    pinned = pinned_service.search("service wiring", k=5)
+
+    assert [(h.id, h.score) for h in pinned.hits] == [(h.id, h.score) for h in one_shot.hits]
+
+
+def test_search_use_case_loads_pack_once_for_all_expanded_terms(
+    segment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _count_loads(monkeypatch)
+    use_case = SearchUseCase(Mock(), telemetry=None)
+
+    result = use_case._execute_search_pipeline(segment, "service", limit=5)
+
+    assert len(result.expanded_terms) > 1
+    assert len(calls) == 1
@@ -26,6 +26,7 @@ def mock_context_service():
     # Return hits when searching for "agent.md" or "config"
     mock_hit = Mock(id="chunk1", title_path=["agent.md"], score=0.9, token_est=100, preview="...")
     service.search = Mock(return_value=MagicMock(hits=[mock_hit]))
+    service.search_terms = lambda queries, k=5: [service.search(q, k=k) for q in queries]
     return service
 
 
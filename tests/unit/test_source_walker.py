@@ -0,0 +1,98 @@
+"""Tests for the single-pass pruning source walker."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.application.use_cases import REPO_SOURCE_PATTERNS
+from src.infrastructure.source_walker import DEFAULT_EXCLUDE_DIRS, SourceMatcher, walk_sources
+
+
+FILES = [
+    "README.md",
+    "CHANGELOG.md",
+    "main.py",
+    "setup.py",
+    "docs/guide.md",
+    "docs/deep/nested/page.md",
+    "docs/image.png",
+    "src/pkg/__init__.py",
+    "src/pkg/mod.py",
+    "src/pkg/__pycache__/mod.cpython-312.py",
+    "src/web/app.ts",
+    "src/node_modules/dep/index.js",
+    "tests/test_mod.py",
+    "config/app.yaml",
+    "config/nested/more.toml",
+    "apps/ui/Component.vue",
+    "vendor/lib/vendored.py",
+    ".venv/lib/site.py",
+    ".git/hooks/pre-commit.py",
+    "_ctx/notes.md",
+]
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in FILES:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+def _glob_reference(root: Path, patterns: tuple[str, ...]) -> set[str]:
+    found: set[str] = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            rel = path.relative_to(root)
+            if path.is_file() and not DEFAULT_EXCLUDE_DIRS.intersection(rel.parts):
+                found.add(rel.as_posix())
+    return found
+
+
+def test_matches_path_glob_for_build_patterns(tree: Path) -> None:
+    walked = {p.relative_to(tree).as_posix() for p in walk_sources(tree, REPO_SOURCE_PATTERNS)}
+
+    assert walked == _glob_reference(tree, REPO_SOURCE_PATTERNS)
+    assert "vendor/lib/vendored.py" not in walked
+    assert "docs/deep/nested/page.md" in walked
+
+
+def test_results_ordered_by_pattern_then_path(tree: Path) -> None:
+    walked = [p.relative_to(tree).as_posix() for p in walk_sources(tree, ["docs/**/*.md", "*.md"])]
+
+    assert walked == ["docs/deep/nested/page.md", "docs/guide.md", "CHANGELOG.md", "README.md"]
+
+
+def test_never_enters_excluded_or_unreachable_dirs(
+    tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    visited: list[str] = []
+    original = os.scandir
+
+    def tracking_scandir(path):
+        visited.append(Path(path).relative_to(tree).as_posix())
+        return original(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+    walk_sources(tree, REPO_SOURCE_PATTERNS)
+
+    assert not [d for d in visited if d.split("/")[0] in {".git", ".venv", "_ctx", "vendor"}]
+    assert "src/node_modules" not in visited
+    assert "src/pkg/__pycache__" not in visited
+    assert sorted(visited) == sorted(set(visited))
+
+
+def test_matcher_prunes_by_literal_prefix() -> None:
+    matcher = SourceMatcher(["docs/**/*.md", "main.py", "a/*/b.py"])
+
+    assert matcher.should_descend(())
+    assert matcher.should_descend(("docs", "x", "y"))
+    assert matcher.should_descend(("a", "any"))
+    assert not matcher.should_descend(("a", "any", "deeper"))
+    assert not matcher.should_descend(("src",))
+    assert matcher.match("docs/x/y.md") == 0
+    assert matcher.match("main.py") == 1
+    assert matcher.match("sub/main.py") is None
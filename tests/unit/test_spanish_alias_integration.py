@@ -84,6 +84,7 @@ class TestSpanishAliasIndependentOfLint:
         ) as mock_context_service_class:
             mock_service = Mock()
             mock_service.search = mock_search
+            mock_service.search_terms = lambda queries, k=10: [mock_search(q, k) for q in queries]
             mock_context_service_class.return_value = mock_service
 
             use_case = SearchUseCase(mock_file_system, mock_telemetry)
@@ -139,6 +140,7 @@ class TestSpanishAliasIndependentOfLint:
         ) as mock_context_service_class:
             mock_service = Mock()
             mock_service.search = mock_search
+            mock_service.search_terms = lambda queries, k=10: [mock_search(q, k) for q in queries]
             mock_context_service_class.return_value = mock_service
 
             use_case = SearchUseCase(mock_file_system, mock_telemetry)
@@ -0,0 +1,119 @@
+"""Unit tests for buffered events.jsonl writes (_EventBuffer)."""
+
+import gc
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure import telemetry as telemetry_module
+from src.infrastructure.telemetry import Telemetry, _EventBuffer
+
+
+@pytest.fixture
+def segment_path(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    return tmp_path
+
+
+def _events(segment_path: Path) -> list[dict]:
+    events_file = segment_path / "_ctx" / "telemetry" / "events.jsonl"
+    if not events_file.exists():
+        return []
+    return [json.loads(line) for line in events_file.read_text().splitlines()]
+
+
+def test_events_are_buffered_until_flush(segment_path: Path) -> None:
+    telemetry = Telemetry(segment_path, level="lite")
+
+    telemetry.event("buffered.one", {}, {}, 1)
+    telemetry.event("buffered.two", {}, {}, 1)
+    assert _events(segment_path) == []
+
+    telemetry.flush()
+
+    assert [event["cmd"] for event in _events(segment_path)] == ["buffered.one", "buffered.two"]
+
+
+def test_full_batch_is_written_with_one_append(
+    segment_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    telemetry = Telemetry(segment_path, level="lite")
+    telemetry._events.max_batch = 10
+    writes: list[int] = []
+    real_write = os.write
+
+    def counting_write(fd: int, data: bytes) -> int:
+        writes.append(len(data))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(telemetry_module.os, "write", counting_write)
+    for i in range(10):
+        telemetry.event(f"batch.{i}", {}, {}, 1)
+
+    assert len(writes) == 1
+    assert len(_events(segment_path)) == 10
+
+
+def test_pending_events_are_written_when_instance_is_collected(segment_path: Path) -> None:
+    telemetry = Telemetry(segment_path, level="lite")
+    telemetry.event("collected", {}, {}, 1)
+
+    del telemetry
+    gc.collect()
+
+    assert [event["cmd"] for event in _events(segment_path)] == ["collected"]
+
+
+def test_background_thread_flushes_after_interval(tmp_path: Path) -> None:
+    buffer = _EventBuffer(tmp_path / "events.jsonl", flush_interval_s=0.05)
+
+    buffer.append('{"cmd": "timed"}\n')
+    deadline = time.time() + 5
+    while not (tmp_path / "events.jsonl").exists() and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert (tmp_path / "events.jsonl").read_text() == '{"cmd": "timed"}\n'
+
+
+def test_failed_writes_keep_events_and_count_overflow_drops(tmp_path: Path) -> None:
+    missing_dir = tmp_path / "missing"
+    buffer = _EventBuffer(missing_dir / "events.jsonl", max_batch=100, capacity=3)
+
+    for i in range(5):
+        buffer.append(f"{i}\n")
+    buffer.flush()
+    missing_dir.mkdir()
+    buffer.flush()
+
+    assert (missing_dir / "events.jsonl").read_text() == "2\n3\n4\n"
+    assert buffer.dropped == 2
+    assert buffer.drop_rate == pytest.approx(0.4)
+
+
+def test_last_run_reports_drop_rate(segment_path: Path) -> None:
+    telemetry = Telemetry(segment_path, level="lite")
+    telemetry._events.emitted = 8
+    telemetry._events.dropped = 2
+
+    telemetry.flush()
+
+    last_run = json.loads((segment_path / "_ctx" / "telemetry" / "last_run.json").read_text())
+    assert last_run["telemetry_drops"] == {"drop_rate": 0.25, "dropped": 2}
+
+
+def test_forked_child_does_not_rewrite_parent_pending_events(tmp_path: Path) -> None:
+    buffer = _EventBuffer(tmp_path / "events.jsonl")
+    buffer.append("parent\n")
+
+    pid = os.fork()
+    if pid == 0:
+        buffer.append("child\n")
+        buffer.flush()
+        os._exit(0)
+    os.waitpid(pid, 0)
+    buffer.flush()
+
+    assert sorted((tmp_path / "events.jsonl").read_text().splitlines()) == ["child", "parent"]
@@ -0,0 +1,142 @@
+"""Unit tests for the indexed telemetry store (TelemetryStore)."""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.application.zero_hit_reports import get_zero_hit_metrics
+from src.infrastructure.telemetry_store import STORE_FILENAME, TelemetryStore
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def segment_path(tmp_path: Path) -> Path:
+    (tmp_path / "_ctx" / "telemetry").mkdir(parents=True)
+    return tmp_path
+
+
+def _events_file(segment_path: Path) -> Path:
+    return segment_path / "_ctx" / "telemetry" / "events.jsonl"
+
+
+def _event(hours_ago: float, cmd: str = "ctx.search", source: str = "agent", **result) -> dict:
+    return {
+        "ts": (NOW - timedelta(hours=hours_ago)).isoformat(),
+        "cmd": cmd,
+        "x": {"source": source},
+        "result": result,
+    }
+
+
+def _append(segment_path: Path, *events: dict) -> None:
+    with open(_events_file(segment_path), "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def test_sync_only_ingests_appended_lines(segment_path: Path) -> None:
+    _append(segment_path, _event(1, hits=1), _event(2, hits=0))
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert store.count() == 2
+
+    _append(segment_path, _event(0, hits=3))
+    with TelemetryStore(segment_path / "_ctx" / "telemetry") as store:
+        assert store.sync() == 1
+        assert store.sync() == 0
+        assert store.count() == 3
+    assert (segment_path / "_ctx" / "telemetry" / STORE_FILENAME).exists()
+
+
+def test_partial_last_line_waits_for_next_sync(segment_path: Path) -> None:
+    _append(segment_path, _event(1, hits=1))
+    with open(_events_file(segment_path), "a") as f:
+        f.write('{"cmd": "ctx.sea')
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert store.count() == 1
+
+    with open(_events_file(segment_path), "a") as f:
+        f.write('rch", "result": {"hits": 2}}\n')
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert [event["result"]["hits"] for event in store.events()] == [1, 2]
+
+
+def test_rewritten_log_is_reingested(segment_path: Path) -> None:
+    _append(segment_path, _event(1, hits=1), _event(2, hits=2))
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert store.count() == 2
+
+    _events_file(segment_path).write_text(
+        "".join(json.dumps(_event(h, hits=9)) + "\n" for h in range(3))
+    )
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert [event["result"]["hits"] for event in store.events()] == [9, 9, 9]
+
+
+def test_events_window_filters(segment_path: Path) -> None:
+    _append(
+        segment_path,
+        _event(72, hits=1),
+        {"cmd": "ctx.search", "result": {"hits": 0}},
+        _event(1, cmd="ctx.get"),
+        _event(2, hits=4),
+    )
+    since = NOW - timedelta(days=1)
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert len(store.events()) == 4
+        assert [e["cmd"] for e in store.events(since=since)] == ["ctx.get", "ctx.search"]
+        assert len(store.events(since=since, include_undated=True)) == 3
+        assert [e["result"] for e in store.events(since=since, cmd="ctx.search")] == [{"hits": 4}]
+
+
+def test_search_counts_match_full_scan_across_day_boundaries(segment_path: Path) -> None:
+    rng = random.Random(7)
+    events = [
+        _event(
+            rng.uniform(0, 24 * 40),
+            source=rng.choice(["agent", "fixture", "interactive"]),
+            hits=rng.choice([0, 0, 1, 5]),
+        )
+        for _ in range(500)
+    ]
+    _append(segment_path, *events)
+
+    metrics = get_zero_hit_metrics(segment_path, days=10)
+
+    cutoff = NOW - timedelta(days=10)
+    window = [e for e in events if datetime.fromisoformat(e["ts"]) > cutoff]
+    expected: dict[str, dict[str, int]] = {}
+    for event in window:
+        counts = expected.setdefault(event["x"]["source"], {"total": 0, "zero_hits": 0})
+        counts["total"] += 1
+        counts["zero_hits"] += event["result"]["hits"] == 0
+    assert metrics["total_searches"] == len(window)
+    assert list(metrics["by_source"]) == list(expected)
+    for source, counts in expected.items():
+        assert metrics["by_source"][source]["total"] == counts["total"]
+        assert metrics["by_source"][source]["zero_hits"] == counts["zero_hits"]
+
+
+def test_search_counts_distinguish_missing_hits(segment_path: Path) -> None:
+    _append(
+        segment_path,
+        _event(1, hits=0),
+        _event(1, hits=2),
+        {"ts": NOW.isoformat(), "cmd": "ctx.search", "result": {}},
+        {"ts": NOW.isoformat(), "cmd": "ctx.search", "result": {"hits": None}},
+    )
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert store.search_counts() == [
+            {"source": "agent", "events": 2, "with_hits": 1, "zero_hits": 1, "missing_hits": 0},
+            {"source": "unknown", "events": 2, "with_hits": 0, "zero_hits": 0, "missing_hits": 1},
+        ]
+
+
+def test_missing_log_gives_empty_store_without_creating_db(segment_path: Path) -> None:
+    with TelemetryStore.for_segment(segment_path) as store:
+        assert store.count() == 0
+        assert store.events() == []
+    assert not (segment_path / "_ctx" / "telemetry" / STORE_FILENAME).exists()
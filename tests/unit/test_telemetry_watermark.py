@@ -0,0 +1,92 @@
+"""Unit tests for incremental events.jsonl normalization (watermark)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.telemetry import WATERMARK_FILENAME, Telemetry
+
+FULL_ROW = {
+    "ts": "2026-01-01T00:00:00+0000",
+    "run_id": "run_1",
+    "segment_id": "abcdef12",
+    "cmd": "ctx.search",
+    "args": {},
+    "result": {},
+    "timing_ms": 3,
+    "warnings": [],
+    "x": {},
+}
+
+
+@pytest.fixture
+def telemetry_dir(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    directory = tmp_path / "_ctx" / "telemetry"
+    directory.mkdir(parents=True)
+    return directory
+
+
+def _parsed_lines(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+    original = Telemetry._normalize_lines
+
+    def spy(self: Telemetry, lines: list[str]):
+        calls.append(list(lines))
+        return original(self, lines)
+
+    monkeypatch.setattr(Telemetry, "_normalize_lines", spy)
+    return calls
+
+
+def test_legacy_rows_are_normalized_once(telemetry_dir: Path) -> None:
+    events_file = telemetry_dir / "events.jsonl"
+    events_file.write_text(json.dumps(FULL_ROW) + "\n" + '{"cmd": "old"}\n' + "not json\n")
+
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+
+    rows = [json.loads(line) for line in events_file.read_text().splitlines()]
+    assert rows[0] == FULL_ROW
+    assert rows[1]["cmd"] == "old"
+    assert rows[1]["warnings"] == [] and rows[1]["timing_ms"] == 1
+    assert len(rows) == 2
+    watermark = json.loads((telemetry_dir / WATERMARK_FILENAME).read_text())
+    assert watermark["offset"] == events_file.stat().st_size
+    assert watermark["inode"] == events_file.stat().st_ino
+
+
+def test_only_appended_lines_are_parsed(
+    telemetry_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events_file = telemetry_dir / "events.jsonl"
+    events_file.write_text((json.dumps(FULL_ROW) + "\n") * 100)
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+    calls = _parsed_lines(monkeypatch)
+
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+    with events_file.open("a") as f:
+        f.write('{"cmd": "appended"}\n{"cmd": "partial')
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+
+    assert calls == [['{"cmd": "appended"}']]
+    lines = events_file.read_text().splitlines()
+    assert len(lines) == 102
+    assert json.loads(lines[100])["warnings"] == []
+    assert lines[101] == '{"cmd": "partial'
+
+
+def test_rotated_file_is_checked_from_the_start(
+    telemetry_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events_file = telemetry_dir / "events.jsonl"
+    events_file.write_text((json.dumps(FULL_ROW) + "\n") * 3)
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+    calls = _parsed_lines(monkeypatch)
+
+    events_file.rename(telemetry_dir / "events.jsonl.1")
+    events_file.write_text((json.dumps(FULL_ROW) + "\n") * 5)
+    Telemetry(telemetry_dir.parent.parent, level="lite")
+
+    assert len(calls) == 1
+    assert len(calls[0]) == 5